@@ -1,27 +1,41 @@
 import os
 import logging
+from functools import wraps
 from flask import Flask, render_template, abort, jsonify, request, redirect, url_for, session
-from werkzeug.security import generate_password_hash, check_password_hash
 from flask_cors import CORS
 from markupsafe import Markup
-from config import SQLALCHEMY_DATABASE_URI, db
+from config import SQLALCHEMY_DATABASE_URI, SQLALCHEMY_ENGINE_OPTIONS, SQLALCHEMY_BINDS, DB_READ_AFTER_WRITE_SECONDS, INTERNAL_ENDPOINTS_ENABLED, NLP_WARMUP_ON_START, NLP_SERVER_SOCKET, FEEDBACK_WORKER_INTERVAL_SECONDS, REVIEWS_PER_PAGE, db
 from decimal import Decimal
 import json
-import nltk
 import re
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-from sentiment_analysis import analyze_sentiment
-from improvement_tips import generate_improvement_tip
-from issue_extraction import extract_issues
+import nlp_models
+from nlp_cache import result_cache
+from sentiment_analysis import cascade_metrics
+from commands import register_commands
+from seeding import verify_schema
+from migrations import pending_migrations
+from offload import hash_password, verify_password
+from text_chunks import highlight_segments
+from feedback_rollups import recurring_issues, tutor_trends
+from tutor_stats import tutor_stats
+from booking_rules import SlotUnavailable, slot_end
+from review_feed import review_feed, SOURCE_SESSION
+from tutor_profile_cache import cached_tutor_profile
+from improvement_tips import rank_improvement_tips
+import offload
+from feedback_worker import process_pending_feedback, ANALYSIS_PENDING, ANALYSIS_PROCESSING
 from datetime import datetime, timedelta
-from matching_module import calculate_dynamic_score, match_tutor 
+from matching_module import calculate_dynamic_score, match_tutor, PortableCursor
+from experiments import weights_for_student, record_exposure, record_booking, record_rating, experiment_report
 from flask_socketio import SocketIO, emit, join_room, leave_room
 from flask_apscheduler import APScheduler
 from werkzeug.utils import secure_filename
+from sqlalchemy.exc import SQLAlchemyError
+from db_pool import pool_status
+from db_routing import REPLICA_BIND, init_read_routing
+from sql_stats import InstrumentedCursor, endpoint_stats, init_sql_stats
 
-from models import Tutor, Student, Subject, TutorSubject, TutorReview, TutorAvailableSlot, Session, SessionFeedback, StudentSubject, StudentAvailableSlot, StudentLearningPath, seed_data
-
-analyzer = SentimentIntensityAnalyzer()
+from models import Tutor, Student, Subject, TutorSubject, TutorAvailableSlot, Session, SessionFeedback, StudentSubject, StudentAvailableSlot, StudentLearningPath, session_description
 
 app = Flask(__name__)
 CORS(app, supports_credentials=True, origins=["http://localhost:5001", "http://127.0.0.1:5001"])
@@ -32,9 +46,15 @@ app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gif"}
 app.config['SQLALCHEMY_DATABASE_URI'] = SQLALCHEMY_DATABASE_URI
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = SQLALCHEMY_ENGINE_OPTIONS
+app.config['SQLALCHEMY_BINDS'] = SQLALCHEMY_BINDS
+app.config['INTERNAL_ENDPOINTS_ENABLED'] = INTERNAL_ENDPOINTS_ENABLED
 app.secret_key = 'your_secret_key_here'
 
 db.init_app(app)
+init_sql_stats(app)
+init_read_routing(app, db, DB_READ_AFTER_WRITE_SECONDS)
+register_commands(app)
 
 scheduler = APScheduler()
 scheduler.init_app(app)
@@ -45,11 +65,24 @@ def get_current_time():
 
 
 # --------------------------
-# Create tables and seed data
+# Verify the database schema
 # --------------------------
+# Startup never changes the schema or seeds tables; run `flask --app app migrate`
+# to apply schema migrations and `flask --app app seed` to load the seed data.
 with app.app_context():
-    db.create_all()  
-    seed_data()       
+    try:
+        pending = pending_migrations(db.engine)
+        if pending:
+            logging.error(f"Database has pending migrations {[version for version, _ in pending]}; run 'flask --app app migrate'.")
+        schema = verify_schema()
+        if schema["missing_tables"]:
+            logging.error(f"Database is missing tables {schema['missing_tables']}; run 'flask --app app migrate'.")
+        if schema["missing_columns"]:
+            logging.error(f"Database tables are missing columns: {schema['missing_columns']}")
+        if schema["missing_indexes"]:
+            logging.error(f"Database tables are missing indexes: {schema['missing_indexes']}")
+    except SQLAlchemyError as e:
+        logging.error(f"Could not verify the database schema: {e}")
 
 # ------------------------
 # Helper Functions
@@ -86,6 +119,31 @@ def remove_expired_available_slots():
 
 scheduler.add_job(id='remove_expired_slots', func=remove_expired_available_slots, trigger='interval', minutes=30)
 
+def analyze_pending_feedback():
+    """Background worker: analyze submitted feedback and push the results to the tutor."""
+    with app.app_context():
+        while True:
+            notifications = process_pending_feedback()
+            if not notifications:
+                break
+            for tutor_id, payload in notifications:
+                socketio.emit("feedback_analyzed", payload, to=f"tutor_{tutor_id}")
+
+scheduler.add_job(id='analyze_pending_feedback', func=analyze_pending_feedback, trigger='interval',
+                  seconds=FEEDBACK_WORKER_INTERVAL_SECONDS, max_instances=1, coalesce=True)
+
+def wake_feedback_worker():
+    """Run the feedback worker now instead of waiting for its next interval."""
+    job = scheduler.get_job('analyze_pending_feedback')
+    if job:
+        job.modify(next_run_time=datetime.now())
+
+# The transformer pipelines load lazily on the first feedback analysis;
+# optionally start loading them now without blocking startup. With a shared
+# model server they are never loaded in this process.
+if NLP_WARMUP_ON_START and not NLP_SERVER_SOCKET:
+    nlp_models.start_warm_up()
+
 # ------------------------
 # Routes (unchanged)
 # ------------------------
@@ -315,21 +373,26 @@ def update_tutor_profile():
     start_times = request.form.getlist('start_time[]')
     end_times = request.form.getlist('end_time[]')
     if available_dates and start_times and end_times:
-        TutorAvailableSlot.query.filter_by(tutor_id=tutor_id).delete()
+        new_slots = []
         for date_str, start_str, end_str in zip(available_dates, start_times, end_times):
             try:
                 available_date = datetime.strptime(date_str, '%Y-%m-%d').date()
                 start_time = datetime.strptime(start_str, '%H:%M').time()
                 end_time = datetime.strptime(end_str, '%H:%M').time()
-                new_slot = TutorAvailableSlot(
-                    tutor_id=tutor_id,
-                    available_date=available_date,
-                    start_time=start_time,
-                    end_time=end_time
-                )
-                db.session.add(new_slot)
             except Exception:
                 continue
+            # Sessions can only be booked into one-hour slots (booking_rules.py).
+            if end_time != slot_end(start_time):
+                db.session.rollback()
+                return jsonify({"msg": "Availability slots must be exactly one hour long."}), 400
+            new_slots.append(TutorAvailableSlot(
+                tutor_id=tutor_id,
+                available_date=available_date,
+                start_time=start_time,
+                end_time=end_time
+            ))
+        TutorAvailableSlot.query.filter_by(tutor_id=tutor_id).delete()
+        db.session.add_all(new_slots)
     try:
         db.session.commit()
         return jsonify({"msg": "Profile updated successfully"}), 200
@@ -355,56 +418,25 @@ def dashboard_tutor():
     ).order_by(Session.scheduled_time).all()
     for s in upcoming_sessions:
         s.end_time = s.scheduled_time + timedelta(hours=1)
-    session_feedbacks = (
-        db.session.query(SessionFeedback, Session, Student)
-        .join(Session, Session.session_id == SessionFeedback.session_id)
-        .join(Student, Student.student_id == Session.student_id)
-        .filter(Session.tutor_id == tutor_id)
-        .order_by(SessionFeedback.feedback_id.desc())
-        .all()
-    )
-    session_reviews = []
-    for fb, sess, stud in session_feedbacks:
-        review_dict = {
-            "review_id": fb.feedback_id,
-            "student_profile_pic": stud.profile_pic_url or '/static/images/default-profile-picture.png',
-            "student_name": stud.name,
-            "comment": fb.student_feedback or "No review available.",
-            "rating": fb.star_rating,
-            "sentiment": fb.feedback_sentiment or "N/A",
-            "date_posted": sess.scheduled_time
-        }
-        session_reviews.append(review_dict)
-    tutor_reviews_query = TutorReview.query.filter_by(tutor_id=tutor_id).order_by(TutorReview.review_id.desc()).all()
-    tutor_reviews = []
-    for tr in tutor_reviews_query:
-        review_dict = {
-            "review_id": tr.review_id,
-            "student_profile_pic": '/static/images/default-profile-picture.png',
-            "student_name": tr.student_name,
-            "comment": tr.comment or "No review available.",
-            "rating": tr.rating,
-            "sentiment": "N/A",
-            "date_posted": None
-        }
-        tutor_reviews.append(review_dict)
-    reviews = session_reviews + tutor_reviews
-    reviews = sorted(reviews, key=lambda r: r["review_id"], reverse=True)
-    review_count = tutor.review_count
-    star_counts = {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}
-    for review in reviews:
-        try:
-            rating = int(round(float(review["rating"])))
-            if rating in star_counts:
-                star_counts[rating] += 1
-        except Exception:
-            continue
-    if review_count > 0:
-        star_percentages = {star: round((count / review_count) * 100) for star, count in star_counts.items()}
-        average_star_rating = round(sum(float(review["rating"]) for review in reviews) / review_count, 2)
-    else:
-        star_percentages = {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}
-        average_star_rating = "N/A"
+    # The dashboard shows the two most recent reviews.
+    feed, _ = review_feed(tutor_id, limit=2)
+    reviews = []
+    for row in feed:
+        is_feedback = row.source == SOURCE_SESSION
+        reviews.append({
+            "review_id": row.review_id,
+            "feedback_id": row.review_id if is_feedback else None,
+            "student_profile_pic": row.profile_pic_url or '/static/images/default-profile-picture.png',
+            "student_name": row.student_name,
+            "comment": row.comment or "No review available.",
+            "rating": row.rating,
+            "sentiment": row.sentiment or ("Analyzing..." if row.analysis_status in (ANALYSIS_PENDING, ANALYSIS_PROCESSING) else "N/A"),
+            "date_posted": row.date_posted
+        })
+    stats = tutor_stats(tutor_id)
+    review_count = stats.review_count
+    star_percentages = stats.star_percentages
+    average_star_rating = stats.average_rating if review_count > 0 else "N/A"
     return render_template(
         'dashboard-tutor.html',
         tutor=tutor,
@@ -441,7 +473,7 @@ def signup():
     else:
         if Student.query.filter_by(email=email).first():
             return jsonify({"msg": "Student with that email already exists."}), 400
-    hashed_password = generate_password_hash(password)
+    hashed_password = hash_password(password)
     try:
         if user_type == 'tutor':
             new_user = Tutor(
@@ -482,7 +514,7 @@ def login():
         return jsonify({"msg": "Missing email or password"}), 400
     tutor = Tutor.query.filter_by(email=email).first()
     student = Student.query.filter_by(email=email).first()
-    if tutor and check_password_hash(tutor.password, password):
+    if tutor and verify_password(tutor.password, password):
         session.clear()
         session['tutor_id'] = tutor.tutor_id
         return jsonify({
@@ -491,7 +523,7 @@ def login():
             "tutor_id": tutor.tutor_id,
             "firstLogin": tutor.completed_sessions == 0
         }), 200
-    elif student and check_password_hash(student.password, password):
+    elif student and verify_password(student.password, password):
         session.clear()
         session['student_id'] = student.student_id
         return jsonify({
@@ -527,45 +559,38 @@ def analyze_feedback():
     if not session_id or not tutor_id or not student_feedback or star_rating is None:
         return jsonify({"error": "Missing required fields"}), 400
 
-    sentiment_result = analyze_sentiment(student_feedback)
-    sentiment_label = sentiment_result.get("label", "")
-    sentiment_label = sentiment_label.capitalize() 
-    if sentiment_label not in ["Positive", "Neutral", "Negative"]:
-        sentiment_label = "Neutral"
-
-    issues = extract_issues(student_feedback)
-    improvement_tip = generate_improvement_tip(issues)
-    issues_str = ", ".join([issue["issue"] for issue in issues])
+    # Sentiment, issues and the improvement tip are filled in by the background worker.
     new_feedback = SessionFeedback(
         session_id=session_id,
         student_feedback=student_feedback,
         star_rating=star_rating,
-        feedback_sentiment=sentiment_label,
-        feedback_issues=issues_str,
-        improvement_tip=improvement_tip
+        analysis_status=ANALYSIS_PENDING
     )
     try:
         db.session.add(new_feedback)
+        tutoring_session = Session.query.get(session_id)
+        if tutoring_session:
+            record_rating(tutoring_session.student_id, star_rating)
         db.session.commit()
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": f"Failed to add feedback: {str(e)}"}), 500
 
     try:
-        avg_rating = db.session.query(db.func.avg(SessionFeedback.star_rating))\
-                    .join(Session, Session.session_id == SessionFeedback.session_id)\
-                    .filter(Session.tutor_id == tutor_id).scalar()
+        # TutorStats was updated in the same transaction as the insert.
+        stats = tutor_stats(tutor_id)
         tutor = Tutor.query.get(tutor_id)
-        tutor.average_star_rating = avg_rating
+        if stats.feedback_count:
+            tutor.average_star_rating = stats.feedback_rating_sum / stats.feedback_count
         db.session.commit()
     except Exception as e:
         db.session.rollback()
         logging.error(f"Error updating tutor average rating: {e}")
+    wake_feedback_worker()
     return jsonify({
-        "sentiment": sentiment_label,
-        "issues": issues,
-        "improvement_tip": improvement_tip
-    }), 200
+        "feedback_id": new_feedback.feedback_id,
+        "analysis_status": ANALYSIS_PENDING
+    }), 202
 
 @app.route('/call_feedback')
 def call_feedback():
@@ -591,70 +616,24 @@ def session_feedback():
     tutor = Tutor.query.get(tutor_id)
     if not tutor:
         abort(404)
-    session_feedbacks = (
-        db.session.query(SessionFeedback, Session, Student)
-        .join(Session, Session.session_id == SessionFeedback.session_id)
-        .join(Student, Student.student_id == Session.student_id)
-        .filter(Session.tutor_id == tutor_id)
-        .order_by(SessionFeedback.feedback_id.desc())
-        .all()
-    )
-    session_reviews = []
-    for fb, sess, stud in session_feedbacks:
-        review_dict = {
-            "review_id": fb.feedback_id,
-            "profile_pic_url": stud.profile_pic_url or '/static/images/default-profile-picture.png',
-            "student_name": stud.name,
-            "date_posted": sess.scheduled_time,
-            "sentiment": fb.feedback_sentiment or "N/A",
-            "comment": fb.student_feedback or "No review available.",
-            "star_rating": fb.star_rating,
-            "improvement_tip": fb.improvement_tip or "No improvement tip available"
-        }
-        session_reviews.append(review_dict)
-    tutor_reviews_query = TutorReview.query.filter_by(tutor_id=tutor_id).order_by(TutorReview.review_id.desc()).all()
-    tutor_reviews = []
-    for tr in tutor_reviews_query:
-        review_dict = {
-            "review_id": tr.review_id,
-            "profile_pic_url": '/static/images/default-profile-picture.png',
-            "student_name": tr.student_name,
-            "comment": tr.comment or "No review available.",
-            "star_rating": tr.rating, 
-            "sentiment": "N/A",
-            "date_posted": None,
-            "improvement_tip": "No improvement tip available"
-        }
-        tutor_reviews.append(review_dict)
-    
-    all_reviews = session_reviews + tutor_reviews
-    all_reviews = sorted(all_reviews, key=lambda r: r["review_id"], reverse=True)
-    review_count = tutor.review_count
-    star_counts = {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}
-    for review in all_reviews:
-        try:
-            rating = int(round(float(review["star_rating"])))
-            if rating in star_counts:
-                star_counts[rating] += 1
-        except Exception:
-            continue
-    if review_count > 0:
-        star_percentages = {star: round((count / review_count) * 100) for star, count in star_counts.items()}
-        average_star_rating = round(sum(float(review["star_rating"]) for review in all_reviews) / review_count, 2)
-    else:
-        star_percentages = {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}
-        average_star_rating = "N/A"
-    if review_count > 0:
-        most_recent = all_reviews[0]
+    stats = tutor_stats(tutor_id)
+    review_count = stats.review_count
+    star_percentages = stats.star_percentages
+    average_star_rating = stats.average_rating if review_count > 0 else "N/A"
+    feed, _ = review_feed(tutor_id, limit=1)
+    if feed:
+        most_recent = feed[0]
         recent_review = {
-            "profile_pic_url": most_recent.get("profile_pic_url", "/static/images/default-profile-picture.png"),
-            "student_name": most_recent.get("student_name", "N/A"),
-            "date_posted": most_recent.get("date_posted").strftime("%d %b %Y") if most_recent.get("date_posted") else "N/A",
-            "sentiment": most_recent.get("sentiment", "N/A"),
-            "comment": most_recent.get("comment", "No review available."),
-            "star_rating": most_recent.get("star_rating", 0)
+            "profile_pic_url": most_recent.profile_pic_url or "/static/images/default-profile-picture.png",
+            "student_name": most_recent.student_name or "N/A",
+            "date_posted": most_recent.date_posted.strftime("%d %b %Y") if most_recent.date_posted else "N/A",
+            "sentiment": most_recent.sentiment or "N/A",
+            "comment": most_recent.comment or "No review available.",
+            "segments": highlight_segments(most_recent.comment, json.loads(most_recent.issue_sentences))
+                        if most_recent.comment and most_recent.issue_sentences else None,
+            "star_rating": most_recent.rating or 0
         }
-        improvement_tip = most_recent.get("improvement_tip", "No improvement tip available")
+        improvement_tip = most_recent.improvement_tip or "No improvement tip available"
     else:
         recent_review = None
         improvement_tip = "No improvement tip available"
@@ -671,6 +650,7 @@ def session_feedback():
         tutor=tutor,
         recent_review=recent_review,
         improvement_tip=improvement_tip,
+        ranked_tips=rank_improvement_tips(recurring_issues(tutor_id)),
         star_percentages=star_percentages,
         review_count=review_count,
         average_star_rating=average_star_rating,
@@ -681,25 +661,8 @@ def session_feedback():
 def sentiment_breakdown():
     if 'tutor_id' not in session:
         return jsonify({"error": "Not logged in"}), 401
-    tutor_id = session['tutor_id']
-    session_feedbacks = (
-        db.session.query(SessionFeedback.feedback_sentiment)
-        .join(Session, Session.session_id == SessionFeedback.session_id)
-        .filter(Session.tutor_id == tutor_id)
-        .all()
-    )
-    tutor_reviews = TutorReview.query.filter(TutorReview.tutor_id == tutor_id).all()
-    counts = {"Positive": 0, "Neutral": 0, "Negative": 0}
-    for (sentiment,) in session_feedbacks:
-        sentiment = (sentiment or "Neutral").capitalize()
-        if sentiment not in ["Positive", "Neutral", "Negative"]:
-            sentiment = "Neutral"
-        counts[sentiment] += 1
-    for review in tutor_reviews:
-        sentiment = (review.sentiment or "Neutral").capitalize()
-        if sentiment not in ["Positive", "Neutral", "Negative"]:
-            sentiment = "Neutral"
-        counts[sentiment] += 1
+    stats = tutor_stats(session['tutor_id'])
+    counts = {"Positive": stats.positive_count, "Neutral": stats.neutral_count, "Negative": stats.negative_count}
     return jsonify([
         {"value": counts["Positive"], "name": "Positive"},
         {"value": counts["Neutral"], "name": "Neutral"},
@@ -714,54 +677,24 @@ def tutor_feedback():
     tutor = Tutor.query.get(tutor_id)
     if not tutor:
         abort(404)
-    session_feedback_entries = db.session.query(
-        SessionFeedback.feedback_id,
-        Student.name.label("student_name"),
-        Student.profile_pic_url.label("reviewer_logo"),
-        SessionFeedback.student_feedback.label("comment"),
-        SessionFeedback.star_rating.label("rating"),
-        SessionFeedback.feedback_sentiment.label("sentiment")
-    ).join(Session, Session.session_id == SessionFeedback.session_id
-    ).join(Student, Student.student_id == Session.student_id
-    ).filter(Session.tutor_id == tutor_id
-    ).order_by(SessionFeedback.feedback_id.desc()).all()
-    session_reviews = []
-    for entry in session_feedback_entries:
-        session_reviews.append({
-            "review_id": entry.feedback_id,
-            "student_name": entry.student_name,
-            "reviewer_logo": entry.reviewer_logo or '/static/images/default-profile-picture.png',
-            "comment": entry.comment or "No review available.",
-            "rating": entry.rating,
-            "sentiment": entry.sentiment or "N/A"
-        })
-    tutor_reviews_entries = db.session.query(
-        TutorReview.review_id,
-        TutorReview.student_name,
-        db.literal('/static/images/default-profile-picture.png').label("reviewer_logo"),
-        TutorReview.comment.label("comment"),
-        TutorReview.rating.label("rating"),
-        db.literal("N/A").label("sentiment")
-    ).filter(TutorReview.tutor_id == tutor_id
-    ).order_by(TutorReview.review_id.desc()).all()
-    tutor_reviews = []
-    for entry in tutor_reviews_entries:
-        tutor_reviews.append({
-            "review_id": entry.review_id,
-            "student_name": entry.student_name,
-            "reviewer_logo": entry.reviewer_logo,
-            "comment": entry.comment or "No review available.",
-            "rating": entry.rating,
-            "sentiment": entry.sentiment
+    feed, next_cursor = review_feed(tutor_id, limit=REVIEWS_PER_PAGE, before=request.args.get('before'))
+    reviews = []
+    for row in feed:
+        reviews.append({
+            "review_id": row.review_id,
+            "student_name": row.student_name,
+            "reviewer_logo": row.profile_pic_url or '/static/images/default-profile-picture.png',
+            "comment": row.comment or "No review available.",
+            "rating": row.rating,
+            "sentiment": row.sentiment or "N/A"
         })
-    
-    reviews = session_reviews + tutor_reviews
-    reviews = sorted(reviews, key=lambda r: r["review_id"], reverse=True)
-    return render_template('feedback.html', tutor=tutor, tutor_id=tutor_id, reviews=reviews)
+    return render_template('feedback.html', tutor=tutor, tutor_id=tutor_id, reviews=reviews,
+                           next_cursor=next_cursor, trends=tutor_trends(tutor_id))
 
-def load_weights():
-    with open("weights.json", "r") as f:
-        return json.load(f)
+def load_weights(student_id):
+    """Weights of the experiment arm the student is assigned to."""
+    _, _, weights = weights_for_student(student_id)
+    return weights
 
 @app.route('/find-a-tutor')
 def find_a_tutor():
@@ -802,7 +735,7 @@ def find_a_tutor():
                   .join(TutorSubject)
                   .filter(TutorSubject.subject_id.in_(subject_ids))
                   .all())
-    weights = load_weights()
+    weights = load_weights(student_id)
     total_weight = sum(weights.values())
     current_date = get_current_time().date()
     for tutor in tutors:
@@ -826,7 +759,13 @@ def find_a_tutor():
             weights
         )
         tutor.match_percentage = round((score / total_weight) * 100) if total_weight > 0 else 0
-        print(f"Tutor {tutor.name} match percentage: {tutor.match_percentage}")
+        logging.debug(f"Tutor {tutor.name} match percentage: {tutor.match_percentage}")
+    try:
+        record_exposure(student_id)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error recording experiment exposure: {e}")
     return render_template('find-a-tutor.html', student=student, tutors=tutors, student_id=student_id, all_languages=all_languages)
 
 @app.route('/match-tutor', methods=['GET'])
@@ -859,15 +798,26 @@ def match_tutor_page():
                       "Shona", "Sindhi", "Sinhala", "Slovak", "Slovenian", "Somali", "Spanish", "Sundanese", "Swahili",
                       "Swedish", "Tajik", "Tamil", "Tatar", "Telugu", "Thai", "Turkish", "Turkmen", "Ukrainian",
                       "Urdu", "Uyghur", "Uzbek", "Vietnamese", "Welsh", "Xhosa", "Yiddish", "Yoruba", "Zulu" ]
-    engine = db.get_engine()
+    weights = load_weights(student_id)
+    # Raw DBAPI connection borrowed from the shared pool of the engine this
+    # request reads from (the replica, if configured); close() returns it.
+    engine = db.session.get_bind()
     conn = engine.raw_connection()
-    cursor = conn.cursor()
-    weights = load_weights()
-    top_tutor, learning_path = match_tutor(subject, desired_date, budget, language, learning_style, weights, cursor)
-    cursor.close()
-    conn.close()
+    try:
+        # Raw cursors bypass the engine's events; InstrumentedCursor records them in the request's SQL stats.
+        cursor = PortableCursor(InstrumentedCursor(conn.cursor()), engine.dialect.paramstyle)
+        top_tutor, learning_path = match_tutor(subject, desired_date, budget, language, learning_style, weights, cursor)
+        cursor.close()
+    finally:
+        conn.close()
     if top_tutor is None:
         abort(404, description="No matching tutor found.")
+    try:
+        record_exposure(student_id)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error recording experiment exposure: {e}")
     score = top_tutor.get('score', 0)
     return render_template(
         'match-tutor.html',
@@ -887,49 +837,13 @@ def tutor_profile():
     if 'view_tutor_id' not in session:
         abort(400, description="Tutor not selected.")
     tutor_id = session['view_tutor_id']
-    tutor = Tutor.query.options(
-        db.joinedload(Tutor.subjects),
-        db.joinedload(Tutor.tutor_subjects_assoc),
-        db.joinedload(Tutor.reviews),
-        db.joinedload(Tutor.available_slots)
-    ).get(tutor_id)
+    tutor = cached_tutor_profile(tutor_id)
     if not tutor:
         abort(404)
-    tutor_reviews = TutorReview.query.filter_by(tutor_id=tutor_id).order_by(TutorReview.review_id.desc()).all()
-    session_feedbacks = (
-        db.session.query(SessionFeedback, Session, Student)
-        .join(Session, Session.session_id == SessionFeedback.session_id)
-        .join(Student, Student.student_id == Session.student_id)
-        .filter(Session.tutor_id == tutor_id)
-        .order_by(SessionFeedback.feedback_id.desc())
-        .all()
-    )
-    reviews = []
-    for review in tutor_reviews:
-        reviews.append({
-            "review_id": review.review_id,
-            "student_name": review.student_name,
-            "profile_pic_url": "/static/images/default-profile-picture.png",
-            "comment": review.comment or "No review available.",
-            "rating": review.rating,
-            "sentiment": "N/A",
-            "date_posted": None
-        })
-    for feedback, tutoring_session, student in session_feedbacks:
-        reviews.append({
-            "review_id": feedback.feedback_id,
-            "student_name": student.name,
-            "profile_pic_url": student.profile_pic_url or "/static/images/default-profile-picture.png",
-            "comment": feedback.student_feedback or "No review available.",
-            "rating": feedback.star_rating,
-            "sentiment": feedback.feedback_sentiment or "N/A",
-            "date_posted": tutoring_session.scheduled_time.strftime('%d %b %Y') if tutoring_session.scheduled_time else "N/A"
-        })
-    reviews_sorted = sorted(reviews, key=lambda r: r["review_id"], reverse=True)
-    tutor.last_two_reviews = reviews_sorted[:2]
     student_id = session['student_id']
     student = db.session.get(Student, student_id)
-    return render_template('tutor-profile-page.html', tutor=tutor, student=student, student_id=student_id, reviews=reviews_sorted)
+    return render_template('tutor-profile-page.html', tutor=tutor, student=student, student_id=student_id,
+                           reviews=tutor["last_two_reviews"])
 
 @app.route('/set_view_tutor/<int:tutor_id>')
 def set_view_tutor(tutor_id):
@@ -945,16 +859,25 @@ def get_sessions_for_student():
     if 'student_id' not in session:
         return jsonify({"error": "Not logged in"}), 401
     student_id = session['student_id']
-    sessions = Session.query.filter_by(student_id=student_id).order_by(Session.scheduled_time).all()
+    # Project the names in the same query instead of lazy-loading them per session.
+    sessions = (
+        db.session.query(Session.session_id, Session.student_id, Session.tutor_id, Tutor.name.label("tutor_name"),
+                         Session.subject_id, Subject.subject_name, Session.scheduled_time, Session.session_status)
+        .join(Tutor, Tutor.tutor_id == Session.tutor_id)
+        .join(Subject, Subject.subject_id == Session.subject_id)
+        .filter(Session.student_id == student_id)
+        .order_by(Session.scheduled_time)
+        .all()
+    )
     rows = []
     for s in sessions:
         rows.append({
             "session_id": s.session_id,
             "student_id": s.student_id,
             "tutor_id": s.tutor_id,
-            "tutor_name": s.tutor.name,
+            "tutor_name": s.tutor_name,
             "subject_id": s.subject_id,
-            "subject_name": s.subject.subject_name,
+            "subject_name": s.subject_name,
             "scheduled_time": s.scheduled_time.isoformat(),
             "session_status": s.session_status
         })
@@ -965,16 +888,24 @@ def get_sessions_for_tutor():
     if 'tutor_id' not in session:
         return jsonify({"error": "Not logged in"}), 401
     tutor_id = session['tutor_id']
-    sessions = Session.query.filter_by(tutor_id=tutor_id).order_by(Session.scheduled_time).all()
+    sessions = (
+        db.session.query(Session.session_id, Session.student_id, Student.name.label("student_name"), Session.tutor_id,
+                         Session.subject_id, Subject.subject_name, Session.scheduled_time, Session.session_status)
+        .join(Student, Student.student_id == Session.student_id)
+        .join(Subject, Subject.subject_id == Session.subject_id)
+        .filter(Session.tutor_id == tutor_id)
+        .order_by(Session.scheduled_time)
+        .all()
+    )
     rows = []
     for s in sessions:
         rows.append({
             "session_id": s.session_id,
             "student_id": s.student_id,
-            "student_name": s.student.name,
+            "student_name": s.student_name,
             "tutor_id": s.tutor_id,
             "subject_id": s.subject_id,
-            "subject_name": s.subject.subject_name,
+            "subject_name": s.subject_name,
             "scheduled_time": s.scheduled_time.isoformat(),
             "session_status": s.session_status
         })
@@ -1035,12 +966,12 @@ def book_session():
     selected_time = request.form.get('selected_time')
     scheduled_slot = selected_date + " " + selected_time
     if not all([tutor_id, subject_id, scheduled_slot]):
-        return render_template('booking-error.html', message="Missing required fields."), 400
+        abort(400, description="Missing required fields.")
     try:
         tutor_id = int(tutor_id)
         subject_id = int(subject_id)
     except ValueError:
-        return render_template('booking-error.html', message="Invalid input types."), 400
+        abort(400, description="Invalid input types.")
     try:
         date_str, time_str = scheduled_slot.split()
         slot_date = datetime.strptime(date_str, "%Y-%m-%d").date()
@@ -1049,17 +980,17 @@ def book_session():
         else:
             slot_time = datetime.strptime(time_str, "%H:%M").time()
     except Exception:
-        return render_template('booking-error.html', message="Invalid scheduled slot format."), 400
+        abort(400, description="Invalid scheduled slot format.")
 
     available_slot = TutorAvailableSlot.query.filter_by(
-        tutor_id=tutor_id, available_date=slot_date, start_time=slot_time
+        tutor_id=tutor_id, available_date=slot_date, start_time=slot_time, end_time=slot_end(slot_time)
     ).first()
     if not available_slot:
-        return render_template('booking-error.html', message="Selected time slot is not available."), 400
+        abort(400, description="Selected time slot is not available.")
 
     tutor_subject = TutorSubject.query.filter_by(tutor_id=tutor_id, subject_id=subject_id).first()
     if not tutor_subject:
-        return render_template('booking-error.html', message="Tutor does not offer this subject."), 400
+        abort(400, description="Tutor does not offer this subject.")
 
     scheduled_datetime = datetime.combine(slot_date, slot_time)
     new_session = Session(
@@ -1080,11 +1011,15 @@ def book_session():
 
         logging.info(f"Updated earnings for tutor {tutor_id}: {tutor.earnings}")
 
-        db.session.delete(available_slot)
+        # Inserting the session removes the booked slots (booking_rules.py).
+        record_booking(student_id)
         db.session.commit()
+    except SlotUnavailable as e:
+        db.session.rollback()
+        abort(400, description=str(e))
     except Exception as e:
         db.session.rollback()
-        return render_template('booking-error.html', message="Booking failed. Please try again."), 500
+        abort(500, description="Booking failed. Please try again.")
 
     return redirect(url_for('booking_confirmation', session_id=new_session.session_id))
 
@@ -1093,18 +1028,26 @@ def api_student_sessions():
     if 'student_id' not in session:
         return jsonify({"error": "Not logged in"}), 401
     student_id = session['student_id']
-    sessions = Session.query.filter_by(student_id=student_id).order_by(Session.scheduled_time).all()
+    sessions = (
+        db.session.query(Session.session_id, Tutor.name.label("tutor_name"), Tutor.profile_pic_url.label("tutor_pic"),
+                         Session.session_status, Subject.subject_name, Session.scheduled_time)
+        .join(Tutor, Tutor.tutor_id == Session.tutor_id)
+        .join(Subject, Subject.subject_id == Session.subject_id)
+        .filter(Session.student_id == student_id)
+        .order_by(Session.scheduled_time)
+        .all()
+    )
     sessions_data = []
     for s in sessions:
         sessions_data.append({
             "session_id": s.session_id,
-            "tutor_name": s.tutor.name,
-            "tutor_pic": s.tutor.profile_pic_url,
+            "tutor_name": s.tutor_name,
+            "tutor_pic": s.tutor_pic,
             "session_status": s.session_status,
-            "subject_name": s.subject.subject_name,
+            "subject_name": s.subject_name,
             "scheduled_date": s.scheduled_time.strftime('%d %b %Y'),
             "scheduled_time": s.scheduled_time.strftime('%I:%M %p'),
-            "description": s.description
+            "description": session_description(s.subject_name)
         })
     return jsonify(sessions_data)
 
@@ -1135,15 +1078,25 @@ def api_student_reminders():
     student = Student.query.get(student_id)
     if not student:
         return jsonify({"error": "Student not found"}), 404
-    sessions = Session.query.filter_by(student_id=student_id).all()
     current_time = get_current_time()
+    # Only sessions starting within the next hour, with their names joined in.
+    sessions = (
+        db.session.query(Session.scheduled_time, Subject.subject_name, Tutor.name.label("tutor_name"))
+        .join(Tutor, Tutor.tutor_id == Session.tutor_id)
+        .join(Subject, Subject.subject_id == Session.subject_id)
+        .filter(Session.student_id == student_id,
+                Session.session_status == 'Scheduled',
+                Session.scheduled_time >= current_time,
+                Session.scheduled_time <= current_time + timedelta(hours=1))
+        .all()
+    )
     reminders = []
     for s in sessions:
-        if s.session_status == 'Scheduled' and 0 <= (s.scheduled_time - current_time).total_seconds() <= 3600:
+        if 0 <= (s.scheduled_time - current_time).total_seconds() <= 3600:
             minutes_left = int((s.scheduled_time - current_time).total_seconds() // 60)
             reminders.append({
-                "message": f"Your '{s.subject.subject_name}' session starts in {minutes_left} minutes.",
-                "tutor_name": s.tutor.name,
+                "message": f"Your '{s.subject_name}' session starts in {minutes_left} minutes.",
+                "tutor_name": s.tutor_name,
                 "time": s.scheduled_time.strftime('%I:%M %p'),
                 "date": s.scheduled_time.strftime('%b %d %Y')
             })
@@ -1216,6 +1169,53 @@ def get_user_booked_dates():
     unique_dates = {s.scheduled_time.date().isoformat() for s in upcoming_sessions}
     return jsonify(list(unique_dates))
 
+@app.route('/api/nlp/status')
+def nlp_status():
+    if NLP_SERVER_SOCKET:
+        from nlp_client import nlp_client, NLPServerError
+        try:
+            health = nlp_client.health()
+        except NLPServerError as e:
+            return jsonify({"ready": False, "server": NLP_SERVER_SOCKET, "error": str(e)}), 503
+        return jsonify(health), 200 if health["ready"] else 503
+    ready = nlp_models.is_ready()
+    return jsonify({
+        "ready": ready,
+        "models": nlp_models.status(),
+        "offload": offload.stats(),
+        "sentiment_cascade": cascade_metrics(),
+        "cache": result_cache.stats() if result_cache else None
+    }), 200 if ready else 503
+
+def internal_endpoint(view):
+    """Serve an operational endpoint only when INTERNAL_ENDPOINTS_ENABLED is set; 404 otherwise."""
+    @wraps(view)
+    def guarded(*args, **kwargs):
+        if not app.config['INTERNAL_ENDPOINTS_ENABLED']:
+            abort(404)
+        return view(*args, **kwargs)
+    return guarded
+
+@app.route('/internal/db-pool')
+@internal_endpoint
+def db_pool_status():
+    """Pool utilization and checkout wait times of the shared engine, for sizing DB_POOL_SIZE/DB_MAX_OVERFLOW."""
+    status = pool_status(db.engine)
+    if REPLICA_BIND in db.engines:
+        status["replica"] = pool_status(db.engines[REPLICA_BIND])
+    return jsonify(status)
+
+@app.route('/internal/sql-stats')
+@internal_endpoint
+def sql_stats_report():
+    """Statement counts, DB time and slowest statements per endpoint since startup."""
+    return jsonify(endpoint_stats.summary())
+
+@app.route('/api/experiments/report')
+@internal_endpoint
+def experiments_report():
+    return jsonify(experiment_report())
+
 @app.route('/join_session/<int:session_id>')
 def join_session(session_id):
     return f"Joining session {session_id}"
@@ -1270,6 +1270,12 @@ def on_leave(data):
         leave_room(session_id)
         logging.info(f"{username} left session {session_id}")
 
+@socketio.on("join_tutor_feed")
+def on_join_tutor_feed(data=None):
+    tutor_id = session.get('tutor_id')
+    if tutor_id:
+        join_room(f"tutor_{tutor_id}")
+
 @socketio.on("disconnect")
 def on_disconnect():
     logging.info(f"Client disconnected: SID {request.sid}")
@@ -0,0 +1,89 @@
+# benchmarks/backend_compare.py
+"""
+Compare inference backends: peak RSS, p50/p99 single-text latency and
+batched throughput for the sentiment and zero-shot pipelines.
+
+Each backend/model pair is measured in a fresh process so RSS numbers are
+not polluted by models loaded for another measurement.
+
+Usage (from the repository root):
+    python -m benchmarks.backend_compare [--backends pytorch onnx] [--requests 50]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODELS = {
+    "sentiment": ("sentiment-analysis", "sentiment_analysis", "SENTIMENT_MODEL", "SENTIMENT_MODEL_REVISION"),
+    "issues": ("zero-shot-classification", "issue_extraction", "ISSUE_MODEL", "ISSUE_MODEL_REVISION"),
+}
+
+
+def measure(model_key, backend, requests, batch_size):
+    import importlib
+    import config
+    from nlp_models import LazyPipeline
+    from issue_extraction import CANDIDATE_LABELS
+    from benchmarks.corpus import synthetic_texts
+    from benchmarks.stats import latency_summary, peak_rss_mb
+
+    task, module, model_attr, revision_attr = MODELS[model_key]
+    model = getattr(importlib.import_module(module), model_attr)
+    handle = LazyPipeline(task, model, getattr(config, revision_attr), register=False, backend=backend)
+    extra = (CANDIDATE_LABELS,) if model_key == "issues" else ()
+    texts = synthetic_texts(requests)
+
+    rss_before = peak_rss_mb()
+    start = time.perf_counter()
+    handle.get()
+    load_seconds = time.perf_counter() - start
+    handle(texts[:1], *extra)
+
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        handle([text], *extra)
+        latencies.append(time.perf_counter() - start)
+    start = time.perf_counter()
+    handle(texts, *extra, batch_size=batch_size)
+    batched_seconds = time.perf_counter() - start
+
+    result = {"model": model_key, "backend": backend, "load_seconds": load_seconds,
+              "baseline_rss_mb": rss_before, "peak_rss_mb": peak_rss_mb(),
+              "batched_throughput_per_s": len(texts) / batched_seconds}
+    result.update(latency_summary(latencies))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare NLP inference backends.")
+    parser.add_argument("--backends", nargs="+", default=["pytorch", "onnx"])
+    parser.add_argument("--models", nargs="+", default=list(MODELS), choices=list(MODELS))
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--child", nargs=2, metavar=("MODEL", "BACKEND"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child[0], args.child[1], args.requests, args.batch_size)))
+        return
+
+    results = []
+    for model_key in args.models:
+        for backend in args.backends:
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.backend_compare", "--child", model_key, backend,
+                 "--requests", str(args.requests), "--batch-size", str(args.batch_size)],
+                cwd=ROOT, capture_output=True, text=True, check=True
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+    print(json.dumps(results, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# benchmarks/corpus.py
+"""Feedback texts shared by the benchmarks."""
+import random
+
+FEEDBACK_SAMPLES = [
+    "Great session!",
+    "Very helpful, thank you.",
+    "The tutor was great but spoke too fast.",
+    "I didn't understand the explanation of integrals at all.",
+    "The tutor was rude when I asked a question twice.",
+    "Audio kept cutting out and the whiteboard froze several times.",
+    "Well prepared, clear examples and lots of patience.",
+    "The session felt disorganized and we jumped between topics.",
+    "She checked that I understood each step before moving on.",
+    "Not very engaging, mostly reading from slides.",
+    "He adapted the pace once he saw I was struggling, which really helped.",
+    "Okay session, nothing special.",
+]
+
+# Hand-labelled feedback (Positive/Neutral/Negative) for sentiment evaluation.
+LABELED_SENTIMENT_SAMPLES = [
+    ("Great session, thank you so much!", "Positive"),
+    ("Very helpful, I finally understand derivatives.", "Positive"),
+    ("Excellent explanations and lots of patience.", "Positive"),
+    ("She was friendly and the examples were really clear.", "Positive"),
+    ("Loved the practice problems at the end.", "Positive"),
+    ("He adapted the pace once he saw I was struggling, which really helped.", "Positive"),
+    ("Well prepared and easy to follow.", "Positive"),
+    ("The tutor was great but spoke too fast.", "Positive"),
+    ("I feel much more confident about the exam now.", "Positive"),
+    ("Checked that I understood each step before moving on.", "Positive"),
+    ("Clear, structured and encouraging.", "Positive"),
+    ("Best tutor I have had so far.", "Positive"),
+    ("The tutor was rude when I asked a question twice.", "Negative"),
+    ("I didn't understand the explanation of integrals at all.", "Negative"),
+    ("Terrible session, the tutor was late and unprepared.", "Negative"),
+    ("Audio kept cutting out and the whiteboard froze several times.", "Negative"),
+    ("The session felt disorganized and we jumped between topics.", "Negative"),
+    ("Not very engaging, mostly reading from slides.", "Negative"),
+    ("Way too fast, I was lost after ten minutes.", "Negative"),
+    ("He seemed annoyed by my questions.", "Negative"),
+    ("A waste of time, nothing was explained properly.", "Negative"),
+    ("The answers to my questions were vague and confusing.", "Negative"),
+    ("I would not book this tutor again.", "Negative"),
+    ("She kept checking her phone during the session.", "Negative"),
+    ("Okay session, nothing special.", "Neutral"),
+    ("We covered chapter four.", "Neutral"),
+    ("The session lasted one hour.", "Neutral"),
+    ("We went through the homework questions.", "Neutral"),
+    ("It was fine.", "Neutral"),
+    ("Average, about what I expected.", "Neutral"),
+    ("We used the whiteboard for most of the time.", "Neutral"),
+    ("Next time we will look at probability.", "Neutral"),
+]
+
+PHRASES = [
+    "the tutor explained recursion with clear diagrams",
+    "we ran out of time before finishing the exercises",
+    "the pace was too fast for me to follow",
+    "I felt encouraged to ask questions",
+    "the connection dropped twice during the call",
+    "examples were relevant to my homework",
+    "some answers to my questions were vague",
+    "the session started late",
+    "feedback on my practice problems was detailed",
+    "the tone was a bit impatient at times",
+]
+
+
+def synthetic_texts(count: int, sentences: int = 2, seed: int = 42) -> list:
+    """Generate `count` feedback texts of roughly `sentences` sentences each."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        parts = [rng.choice(PHRASES) for _ in range(sentences)]
+        texts.append(" ".join(part[0].upper() + part[1:] + "." for part in parts))
+    return texts
+
+
+CORPORA = {
+    "samples": "the hand-written FEEDBACK_SAMPLES, cycled",
+    "short": "synthetic two-sentence texts",
+    "long": "synthetic twelve-sentence texts, the length of a detailed review",
+}
+
+
+def corpus_texts(name: str, count: int) -> list:
+    """`count` texts from one of the CORPORA."""
+    if name == "samples":
+        return [FEEDBACK_SAMPLES[i % len(FEEDBACK_SAMPLES)] for i in range(count)]
+    if name == "short":
+        return synthetic_texts(count, sentences=2)
+    if name == "long":
+        return synthetic_texts(count, sentences=12)
+    raise ValueError(f"Unknown corpus '{name}'")
@@ -0,0 +1,82 @@
+# benchmarks/feedback_batching.py
+"""
+Throughput and latency of feedback analysis with and without micro-batching.
+
+`--concurrency` client threads each analyze feedback texts until `--requests`
+texts have been processed. The "direct" mode runs one text per forward pass
+(the behaviour before batching); the "batched" mode goes through an
+InferenceQueue for every --batch-size / --wait-ms combination.
+
+Usage (from the repository root):
+    python -m benchmarks.feedback_batching --requests 128 --concurrency 16 --batch-size 1 4 8 16 --wait-ms 10 25
+"""
+import argparse
+import json
+import threading
+import time
+
+import nlp_models
+from feedback_analysis import analyze_feedback_batch
+from inference_queue import InferenceQueue
+from benchmarks.corpus import synthetic_texts
+from benchmarks.stats import latency_summary
+
+
+def drive(analyze, texts, concurrency):
+    latencies = []
+    lock = threading.Lock()
+    position = iter(range(len(texts)))
+
+    def client():
+        while True:
+            with lock:
+                index = next(position, None)
+            if index is None:
+                return
+            start = time.perf_counter()
+            analyze(texts[index])
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    result = {"requests": len(texts), "concurrency": concurrency, "throughput_per_s": len(texts) / wall}
+    result.update(latency_summary(latencies))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark micro-batched feedback analysis.")
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument("--wait-ms", type=float, nargs="+", default=[20])
+    parser.add_argument("--sentences", type=int, default=2, help="sentences per synthetic text")
+    args = parser.parse_args()
+
+    texts = synthetic_texts(args.requests, sentences=args.sentences)
+    nlp_models.warm_up()
+    analyze_feedback_batch(texts[:2])
+
+    results = []
+    direct = drive(lambda text: analyze_feedback_batch([text]), texts, args.concurrency)
+    direct["mode"] = "direct"
+    results.append(direct)
+    for batch_size in args.batch_size:
+        for wait_ms in args.wait_ms:
+            inference_queue = InferenceQueue(analyze_feedback_batch, max_batch_size=batch_size, max_wait_ms=wait_ms)
+            result = drive(lambda text: inference_queue.submit(text).result(), texts, args.concurrency)
+            result.update({"mode": "batched", "batch_size": batch_size, "wait_ms": wait_ms})
+            result["mean_batch_size"] = inference_queue.stats()["mean_batch_size"]
+            results.append(result)
+    print(json.dumps(results, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/hub_latency.py
+"""
+Event-loop latency of the eventlet hub while CPU-bound work runs.
+
+A probe green thread wakes every `--interval-ms` and records how late it was
+woken; that delay is what every Socket.IO event (WebRTC signaling, whiteboard
+strokes) waits before its handler runs. Meanwhile `--concurrency` green
+threads play request handlers that hash passwords or run feedback inference,
+either inline on the hub ("inline", the behaviour before offload.py) or
+through offload ("offloaded"). With offloading the probe latency should stay
+close to the idle baseline.
+
+Usage (from the repository root):
+    python -m benchmarks.hub_latency --workload password --requests 32
+    python -m benchmarks.hub_latency --workload inference --requests 32
+"""
+import argparse
+import json
+import time
+
+import eventlet
+
+from offload import offload
+from benchmarks.corpus import synthetic_texts
+from benchmarks.stats import latency_summary
+
+
+def workload(name):
+    """Return (kind, func, args) for one unit of the chosen workload."""
+    if name == "password":
+        from werkzeug.security import generate_password_hash
+        return "password", generate_password_hash, ("correct horse battery staple",)
+    from feedback_analysis import analyze_feedback_batch_local
+    return "inference", analyze_feedback_batch_local, (synthetic_texts(1),)
+
+
+def probe(interval, lags, stop):
+    while not stop:
+        start = time.perf_counter()
+        eventlet.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - start - interval))
+
+
+def run(mode, kind, func, args, requests, concurrency, interval):
+    lags, stop = [], []
+    probe_thread = eventlet.spawn(probe, interval, lags, stop)
+    eventlet.sleep(interval * 5)
+    remaining = iter(range(requests))
+
+    def handler():
+        for _ in remaining:
+            if mode == "inline":
+                func(*args)
+            elif mode == "offloaded":
+                offload(kind, func, *args)
+            else:
+                eventlet.sleep(0.01)
+
+    start = time.perf_counter()
+    pool = eventlet.GreenPool(concurrency)
+    for _ in range(concurrency):
+        pool.spawn(handler)
+    pool.waitall()
+    wall = time.perf_counter() - start
+    stop.append(True)
+    probe_thread.wait()
+    result = {"mode": mode, "requests": requests, "concurrency": concurrency,
+              "throughput_per_s": requests / wall, "probe_samples": len(lags)}
+    result.update({f"event_lag_{key}": value for key, value in latency_summary(lags).items()})
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure eventlet hub latency under CPU-bound load.")
+    parser.add_argument("--workload", choices=["password", "inference"], default="password")
+    parser.add_argument("--modes", nargs="+", default=["idle", "inline", "offloaded"],
+                        choices=["idle", "inline", "offloaded"])
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--interval-ms", type=float, default=10)
+    args = parser.parse_args()
+
+    kind, func, func_args = workload(args.workload)
+    func(*func_args)  # load models / warm caches outside the measurement
+    results = [run(mode, kind, func, func_args, args.requests, args.concurrency, args.interval_ms / 1000.0)
+               for mode in args.modes]
+    print(json.dumps({"workload": args.workload, "results": results}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/issue_classifier_eval.py
+"""
+Compare the embedding fast path for issue extraction with the zero-shot
+classifier it replaces.
+
+For every text it reports whether the top issue matches the zero-shot top
+issue, the Jaccard overlap of the issue sets above the threshold, and the
+per-text latency of the zero-shot path, the pure embedding path and the
+embedding path with zero-shot fallback.
+
+Usage (from the repository root):
+    python -m benchmarks.issue_classifier_eval [--texts feedback.txt] [--count 100] [--threshold 0.1]
+"""
+import argparse
+import json
+import time
+
+import issue_extraction
+from issue_extraction import (CANDIDATE_LABELS, extract_issues_zero_shot_batch,
+                              extract_issues_embedding_batch)
+from benchmarks.corpus import FEEDBACK_SAMPLES, synthetic_texts
+from benchmarks.stats import latency_summary
+
+
+def timed(fn, texts):
+    results, latencies = [], []
+    for text in texts:
+        start = time.perf_counter()
+        results.append(fn([text])[0])
+        latencies.append(time.perf_counter() - start)
+    return results, latencies
+
+
+def top_issue(issues):
+    return max(issues, key=lambda issue: issue["score"])["issue"] if issues else None
+
+
+def agreement(reference, candidate):
+    top = sum(top_issue(r) == top_issue(c) for r, c in zip(reference, candidate)) / len(reference)
+    jaccard = []
+    for r, c in zip(reference, candidate):
+        a, b = {i["issue"] for i in r}, {i["issue"] for i in c}
+        jaccard.append(len(a & b) / len(a | b) if a | b else 1.0)
+    return {"top1_agreement": top, "mean_jaccard": sum(jaccard) / len(jaccard)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the embedding issue classifier against zero-shot.")
+    parser.add_argument("--texts", help="file with one feedback text per line (default: built-in samples)")
+    parser.add_argument("--count", type=int, default=50, help="synthetic texts added to the built-in samples")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    if args.texts:
+        with open(args.texts, "r") as f:
+            texts = [line.strip() for line in f if line.strip()]
+    else:
+        texts = FEEDBACK_SAMPLES + synthetic_texts(args.count)
+
+    # Load models and label embeddings outside the timed region.
+    extract_issues_zero_shot_batch(texts[:1], CANDIDATE_LABELS, args.threshold)
+    extract_issues_embedding_batch(texts[:1], CANDIDATE_LABELS, args.threshold, fallback=False)
+
+    zero_shot, zero_shot_latency = timed(
+        lambda t: extract_issues_zero_shot_batch(t, CANDIDATE_LABELS, args.threshold), texts)
+    embedding, embedding_latency = timed(
+        lambda t: extract_issues_embedding_batch(t, CANDIDATE_LABELS, args.threshold, fallback=False), texts)
+    issue_extraction.fast_path_stats.update(fast=0, fallback=0)
+    cascaded, cascaded_latency = timed(
+        lambda t: extract_issues_embedding_batch(t, CANDIDATE_LABELS, args.threshold, fallback=True), texts)
+
+    report = {
+        "texts": len(texts),
+        "zero_shot": {"latency": latency_summary(zero_shot_latency)},
+        "embedding": dict(agreement(zero_shot, embedding), latency=latency_summary(embedding_latency)),
+        "embedding_with_fallback": dict(
+            agreement(zero_shot, cascaded),
+            latency=latency_summary(cascaded_latency),
+            fallback_rate=issue_extraction.fast_path_stats["fallback"] / len(texts)
+        )
+    }
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
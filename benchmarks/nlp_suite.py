@@ -0,0 +1,162 @@
+# benchmarks/nlp_suite.py
+"""
+NLP throughput and latency suite.
+
+Drives sentiment analysis, issue extraction and the full feedback analysis
+(what the feedback worker runs for every /analyze-feedback submission) over
+several corpora while sweeping backends, torch intra-op threads and batch
+sizes. Every configuration runs in a fresh process so thread settings and
+peak RSS are not shared between measurements; the result cache is disabled
+so every text reaches the models.
+
+For each configuration it reports single-text p50/p95/p99 latency, batched
+throughput and peak RSS. The JSON output carries the git commit and the
+environment, and --compare prints the throughput and p95 ratio against a
+previous run, so numbers can be tracked across commits.
+
+Usage (from the repository root):
+    python -m benchmarks.nlp_suite --targets sentiment issues feedback --threads 1 2 4 \\
+        --batch-sizes 1 8 16 --backends pytorch onnx --output nlp_suite.json
+    python -m benchmarks.nlp_suite ... --compare baseline.json
+"""
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from benchmarks.corpus import CORPORA
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = ["sentiment", "issues", "feedback"]
+
+
+def target_function(target):
+    """Return fn(texts, batch_size) -> results for a target."""
+    if target == "sentiment":
+        from sentiment_analysis import analyze_sentiments
+        return lambda texts, batch_size: analyze_sentiments(texts, batch_size=batch_size)
+    if target == "issues":
+        from issue_extraction import extract_issues_batch
+        return lambda texts, batch_size: extract_issues_batch(texts, batch_size=batch_size)
+    from feedback_analysis import analyze_feedback_batch_local
+    return lambda texts, batch_size: analyze_feedback_batch_local(texts, batch_size=batch_size)
+
+
+def measure(target, corpus, threads, batch_size, requests):
+    import torch
+    from benchmarks.corpus import corpus_texts
+    from benchmarks.stats import latency_summary, peak_rss_mb
+
+    torch.set_num_threads(threads)
+    run = target_function(target)
+    texts = corpus_texts(corpus, requests)
+
+    start = time.perf_counter()
+    run(texts[:1], 1)
+    first_call_seconds = time.perf_counter() - start
+
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        run([text], 1)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        run(texts[i:i + batch_size], batch_size)
+    batched_seconds = time.perf_counter() - start
+
+    result = {"first_call_seconds": first_call_seconds,
+              "throughput_per_s": len(texts) / batched_seconds,
+              "peak_rss_mb": peak_rss_mb()}
+    result.update(latency_summary(latencies))
+    return result
+
+
+def config_key(result):
+    return tuple(result[key] for key in ("target", "corpus", "backend", "threads", "batch_size"))
+
+
+def environment():
+    import config
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "sentiment_engine": config.SENTIMENT_ENGINE,
+        "issue_classifier": config.ISSUE_CLASSIFIER,
+        "chunk_max_chars": config.FEEDBACK_CHUNK_MAX_CHARS,
+    }
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, "r") as f:
+        baseline = {config_key(result): result for result in json.load(f)["results"]}
+    comparison = []
+    for result in results:
+        previous = baseline.get(config_key(result))
+        if previous:
+            comparison.append(dict(zip(("target", "corpus", "backend", "threads", "batch_size"), config_key(result)),
+                                   throughput_ratio=result["throughput_per_s"] / previous["throughput_per_s"],
+                                   p95_ratio=result["p95_ms"] / previous["p95_ms"] if previous["p95_ms"] else None))
+    return comparison
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep NLP throughput and latency.")
+    parser.add_argument("--targets", nargs="+", default=TARGETS, choices=TARGETS)
+    parser.add_argument("--corpora", nargs="+", default=["short", "long"], choices=list(CORPORA))
+    parser.add_argument("--backends", nargs="+", default=["pytorch"], choices=["pytorch", "onnx"])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 16])
+    parser.add_argument("--requests", type=int, default=64, help="texts per configuration")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    parser.add_argument("--compare", help="JSON report of a previous run to compare against")
+    parser.add_argument("--child", nargs=4, metavar=("TARGET", "CORPUS", "THREADS", "BATCH_SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        target, corpus, threads, batch_size = args.child
+        print(json.dumps(measure(target, corpus, int(threads), int(batch_size), args.requests)))
+        return
+
+    results = []
+    for target, corpus, backend, threads, batch_size in itertools.product(
+            args.targets, args.corpora, args.backends, args.threads, args.batch_sizes):
+        env = dict(os.environ, NLP_BACKEND=backend, NLP_CACHE_ENABLED="false",
+                   OMP_NUM_THREADS=str(threads), MKL_NUM_THREADS=str(threads))
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.nlp_suite", "--child", target, corpus, str(threads), str(batch_size),
+             "--requests", str(args.requests)],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        ).stdout
+        result = {"target": target, "corpus": corpus, "backend": backend, "threads": threads, "batch_size": batch_size}
+        result.update(json.loads(output.strip().splitlines()[-1]))
+        results.append(result)
+        print(f"{target}/{corpus}/{backend} threads={threads} batch={batch_size}: "
+              f"{result['throughput_per_s']:.1f}/s p95 {result['p95_ms']:.1f}ms", file=sys.stderr)
+
+    report = {"environment": environment(), "requests": args.requests, "results": results}
+    if args.compare:
+        report["comparison"] = compare(results, args.compare)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/onnx_parity.py
+"""
+Parity check between the PyTorch and ONNX Runtime backends.
+
+Runs the sentiment and zero-shot pipelines on both backends over the same
+texts and fails (exit code 1) when label agreement drops below
+--min-agreement or a top score differs by more than --score-tolerance on
+more than the allowed share of texts.
+
+Usage (from the repository root):
+    python -m benchmarks.onnx_parity [--min-agreement 0.95] [--score-tolerance 0.05]
+
+tests/test_nlp_backends.py runs the same checks under pytest when torch and
+optimum are installed.
+"""
+import argparse
+import json
+import sys
+
+from nlp_models import LazyPipeline
+from sentiment_analysis import SENTIMENT_MODEL
+from issue_extraction import ISSUE_MODEL, CANDIDATE_LABELS
+from config import SENTIMENT_MODEL_REVISION, ISSUE_MODEL_REVISION
+from benchmarks.corpus import FEEDBACK_SAMPLES, synthetic_texts
+
+# name -> (task, model, revision, candidate labels)
+CHECKS = {
+    "sentiment": ("sentiment-analysis", SENTIMENT_MODEL, SENTIMENT_MODEL_REVISION, None),
+    "issues": ("zero-shot-classification", ISSUE_MODEL, ISSUE_MODEL_REVISION, CANDIDATE_LABELS),
+}
+
+
+def top_predictions(handle, texts, labels=None):
+    if labels is None:
+        return [(r["label"], r["score"]) for r in handle(texts, batch_size=8)]
+    return [(r["labels"][0], r["scores"][0]) for r in handle(texts, labels, batch_size=8)]
+
+
+def compare(name, reference, candidate, min_agreement, score_tolerance):
+    agree = sum(r[0] == c[0] for r, c in zip(reference, candidate)) / len(reference)
+    diffs = [abs(r[1] - c[1]) for r, c in zip(reference, candidate) if r[0] == c[0]]
+    within = sum(d <= score_tolerance for d in diffs) / len(reference)
+    return {
+        "check": name,
+        "label_agreement": agree,
+        "max_score_diff": max(diffs) if diffs else None,
+        "share_within_tolerance": within,
+        "passed": agree >= min_agreement and within >= min_agreement
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check ONNX backend parity with PyTorch.")
+    parser.add_argument("--min-agreement", type=float, default=0.95)
+    parser.add_argument("--score-tolerance", type=float, default=0.05)
+    parser.add_argument("--count", type=int, default=40, help="synthetic texts added to the built-in samples")
+    args = parser.parse_args()
+    texts = FEEDBACK_SAMPLES + synthetic_texts(args.count)
+
+    results = []
+    for name, (task, model, revision, labels) in CHECKS.items():
+        reference = top_predictions(LazyPipeline(task, model, revision, register=False, backend="pytorch"), texts, labels)
+        candidate = top_predictions(LazyPipeline(task, model, revision, register=False, backend="onnx"), texts, labels)
+        results.append(compare(name, reference, candidate, args.min_agreement, args.score_tolerance))
+
+    print(json.dumps(results, indent=4))
+    sys.exit(0 if all(result["passed"] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
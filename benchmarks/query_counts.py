@@ -0,0 +1,128 @@
+# benchmarks/query_counts.py
+"""
+SQL statement counts of the session listing endpoints.
+
+Builds a scratch SQLite database from the seed data, serves every endpoint
+below through the Flask test client at two session counts and counts the
+statements each request executes. A count that grows with the number of
+sessions means rows are being loaded one by one (an N+1 query), and the
+script exits non-zero.
+
+Usage (from the repository root):
+    python -m benchmarks.query_counts [--small 5] [--large 50]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+from datetime import datetime, timedelta
+
+ENDPOINTS = ["/sessions/student", "/sessions/tutor", "/api/student_sessions", "/api/student_reminders"]
+
+STUDENT_ID = 1
+TUTOR_ID = 1
+
+
+def load_app(database_path):
+    """Import the app against a scratch SQLite database."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{database_path}"
+    import app as tutoreal
+    return tutoreal.app
+
+
+def prepare(app):
+    from config import db
+    from migrations import upgrade
+    from seeding import load_seed_file, seed_database
+    with app.app_context():
+        upgrade(db.engine)
+        seed_database(load_seed_file())
+
+
+def grow_sessions(app, total):
+    """
+    Give student STUDENT_ID and tutor TUTOR_ID `total` sessions each, some
+    starting within the hour. The other side of each session cycles through
+    every tutor, student and subject: a lazy load of an object that is already
+    in the session's identity map costs no query, so repeating one tutor would
+    hide an N+1. Rows are inserted with Core, bypassing the booking rules,
+    since most of them match no available slot.
+    """
+    from config import db
+    from models import Session, Student, Subject, Tutor
+    with app.app_context():
+        tutors = db.session.scalars(db.select(Tutor.tutor_id)).all()
+        students = db.session.scalars(db.select(Student.student_id)).all()
+        subjects = db.session.scalars(db.select(Subject.subject_id)).all()
+        now = datetime.now()
+        for column, value in ((Session.student_id, STUDENT_ID), (Session.tutor_id, TUTOR_ID)):
+            existing = db.session.scalar(db.select(db.func.count()).select_from(Session).where(column == value))
+            rows = []
+            for i in range(existing, total):
+                other = {"tutor_id": tutors[i % len(tutors)]} if column is Session.student_id \
+                    else {"student_id": students[i % len(students)]}
+                rows.append({column.key: value, **other, "subject_id": subjects[i % len(subjects)],
+                             "scheduled_time": now + timedelta(minutes=5 + i % 50, days=i % 2 * 3),
+                             "session_status": "Scheduled"})
+            if rows:
+                db.session.execute(Session.__table__.insert(), rows)
+        db.session.commit()
+
+
+def count_statements(app):
+    """Statements executed by one request to each endpoint."""
+    from sqlalchemy import event
+    from config import db
+    counts = {}
+    request_thread = threading.get_ident()
+    executed = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        # Background jobs (the feedback worker) run on other threads.
+        if threading.get_ident() == request_thread:
+            executed.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session["student_id"] = STUDENT_ID
+            session["tutor_id"] = TUTOR_ID
+        for path in ENDPOINTS:
+            executed.clear()
+            response = client.get(path)
+            if response.status_code != 200:
+                raise RuntimeError(f"{path} returned {response.status_code}")
+            counts[path] = len(executed)
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that session listings do not issue a query per row.")
+    parser.add_argument("--small", type=int, default=5, help="sessions per user for the first run")
+    parser.add_argument("--large", type=int, default=50, help="sessions per user for the second run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = load_app(os.path.join(directory, "query_counts.sqlite3"))
+        prepare(app)
+        grow_sessions(app, args.small)
+        small = count_statements(app)
+        grow_sessions(app, args.large)
+        large = count_statements(app)
+
+    results = {path: {"small": small[path], "large": large[path], "ok": large[path] <= small[path]}
+               for path in ENDPOINTS}
+    print(json.dumps({"sessions": {"small": args.small, "large": args.large}, "endpoints": results}, indent=4))
+    if not all(result["ok"] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
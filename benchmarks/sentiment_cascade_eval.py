@@ -0,0 +1,93 @@
+# benchmarks/sentiment_cascade_eval.py
+"""
+Accuracy vs. latency of the cascaded sentiment analyzer.
+
+On a labelled sample it compares VADER alone, the transformer alone and the
+cascade at several VADER thresholds, reporting 3-class accuracy, accuracy on
+the polar (Positive/Negative) texts, the escalation rate and per-text latency.
+The transformer never predicts Neutral, so 3-class accuracy penalizes it on
+neutral texts by design.
+
+Usage (from the repository root):
+    python -m benchmarks.sentiment_cascade_eval [--labeled labeled.tsv] [--thresholds 0.3 0.5 0.7]
+
+A --labeled file holds one "label<TAB>text" pair per line.
+"""
+import argparse
+import json
+import time
+
+import sentiment_analysis
+from sentiment_analysis import analyze_sentiments_transformer, analyze_sentiments_cascaded
+from feedback_analysis import normalize_sentiment_label
+from models import vader_sentiment
+from benchmarks.corpus import LABELED_SENTIMENT_SAMPLES
+from benchmarks.stats import latency_summary
+
+
+def timed(fn, texts):
+    labels, latencies = [], []
+    for text in texts:
+        start = time.perf_counter()
+        labels.append(fn(text))
+        latencies.append(time.perf_counter() - start)
+    return labels, latencies
+
+
+def score(gold, predicted, latencies):
+    polar = [(g, p) for g, p in zip(gold, predicted) if g != "Neutral"]
+    return {
+        "accuracy": sum(g == p for g, p in zip(gold, predicted)) / len(gold),
+        "polar_accuracy": sum(g == p for g, p in polar) / len(polar) if polar else 0.0,
+        "latency": latency_summary(latencies)
+    }
+
+
+def load_labeled(path):
+    samples = []
+    with open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                label, text = line.rstrip("\n").split("\t", 1)
+                samples.append((text, normalize_sentiment_label(label)))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate VADER -> transformer sentiment cascading.")
+    parser.add_argument("--labeled", help="TSV file of label<TAB>text (default: built-in sample)")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
+    args = parser.parse_args()
+
+    samples = load_labeled(args.labeled) if args.labeled else LABELED_SENTIMENT_SAMPLES
+    texts = [text for text, _ in samples]
+    gold = [label for _, label in samples]
+
+    # Load the model and VADER lexicon outside the timed region; bypass the
+    # result cache so every text really runs through the model.
+    sentiment_analysis.cached = lambda namespace, params, texts, compute: compute(texts)
+    analyze_sentiments_transformer(texts[:1])
+    vader_sentiment(texts[0])
+
+    report = {"texts": len(texts)}
+    predicted, latencies = timed(vader_sentiment, texts)
+    report["vader"] = score(gold, predicted, latencies)
+    predicted, latencies = timed(
+        lambda t: normalize_sentiment_label(analyze_sentiments_transformer([t])[0]["label"]), texts)
+    report["transformer"] = score(gold, predicted, latencies)
+
+    report["cascade"] = []
+    for threshold in args.thresholds:
+        sentiment_analysis.cascade_stats.update(vader=0, escalated=0)
+        predicted, latencies = timed(
+            lambda t: normalize_sentiment_label(analyze_sentiments_cascaded([t], threshold)[0]["label"]), texts)
+        report["cascade"].append(dict(
+            score(gold, predicted, latencies),
+            threshold=threshold,
+            escalation_rate=sentiment_analysis.cascade_stats["escalated"] / len(texts)
+        ))
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/startup.py
+"""
+Cold-start benchmark.
+
+Each run starts a fresh Python process, imports the app, serves the landing
+page through the Flask test client and reports how long that took. With
+--warm-up it also times loading the NLP pipelines.
+
+Usage (from the repository root):
+    python -m benchmarks.startup --runs 5 [--warm-up]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import json, sys, time
+start = time.perf_counter()
+import app as tutoreal
+import nlp_models
+imported = time.perf_counter()
+response = tutoreal.app.test_client().get("/")
+served = time.perf_counter()
+result = {
+    "import_seconds": imported - start,
+    "first_response_seconds": served - start,
+    "status_code": response.status_code,
+    "nlp_ready_after_import": nlp_models.is_ready(),
+}
+if "--warm-up" in sys.argv:
+    nlp_models.warm_up()
+    result["warm_up_seconds"] = time.perf_counter() - served
+print(json.dumps(result))
+"""
+
+
+def run_once(warm_up):
+    args = [sys.executable, "-c", PROBE] + (["--warm-up"] if warm_up else [])
+    output = subprocess.run(args, cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure app cold-start time.")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--warm-up", action="store_true", help="also time loading the NLP pipelines")
+    args = parser.parse_args()
+
+    runs = [run_once(args.warm_up) for _ in range(args.runs)]
+    summary = {"runs": runs}
+    for key in ("import_seconds", "first_response_seconds", "warm_up_seconds"):
+        values = [run[key] for run in runs if key in run]
+        if values:
+            summary[f"median_{key}"] = statistics.median(values)
+    print(json.dumps(summary, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# booking_rules.py
+"""
+Booking rules for new sessions, enforced on every database backend.
+
+These were the MySQL triggers before_session_insert and after_session_insert.
+The rules now run from mapper events in the same transaction as the insert,
+so they behave the same on MySQL and SQLite:
+
+- before insert: the session must start exactly at one of the tutor's
+  one-hour available slots and at one of the student's (unless
+  BOOKING_REQUIRE_STUDENT_SLOT is turned off), otherwise SlotUnavailable is
+  raised and the flush is rolled back;
+- after insert: unless the session is Canceled, the matching slots of both
+  parties are removed.
+
+Sessions before BOOKING_RULES_START (historical data) are exempt, as they
+were from the triggers. Bulk inserts that bypass mapper events (seeding) are
+not checked.
+"""
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import delete, event, exists, select
+
+from config import BOOKING_REQUIRE_STUDENT_SLOT
+from models import Session, StudentAvailableSlot, TutorAvailableSlot
+
+BOOKING_RULES_START = date(2025, 3, 30)
+SLOT_LENGTH = timedelta(hours=1)
+
+
+class SlotUnavailable(ValueError):
+    """A new session does not match a party's available slot."""
+
+
+def slot_end(start_time: time) -> time:
+    """End time of the bookable slot that starts at start_time."""
+    return (datetime.combine(date.min, start_time) + SLOT_LENGTH).time()
+
+
+def _slot_condition(slot_model, owner_column, owner_id, scheduled_time):
+    """Slots of one party that exactly cover the session's hour."""
+    return (
+        owner_column == owner_id,
+        slot_model.available_date == scheduled_time.date(),
+        slot_model.start_time == scheduled_time.time(),
+        slot_model.end_time == slot_end(scheduled_time.time()),
+    )
+
+
+def _parties(target):
+    return [
+        (TutorAvailableSlot, TutorAvailableSlot.tutor_id, target.tutor_id,
+         "Tutor not available at the scheduled time", True),
+        (StudentAvailableSlot, StudentAvailableSlot.student_id, target.student_id,
+         "Student not available at the scheduled time", BOOKING_REQUIRE_STUDENT_SLOT),
+    ]
+
+
+def _applies(target) -> bool:
+    return target.scheduled_time is not None and target.scheduled_time.date() >= BOOKING_RULES_START
+
+
+def _validate_session(mapper, connection, target):
+    if not _applies(target):
+        return
+    for slot_model, owner_column, owner_id, message, required in _parties(target):
+        if not required:
+            continue
+        condition = _slot_condition(slot_model, owner_column, owner_id, target.scheduled_time)
+        if not connection.execute(select(exists().where(*condition))).scalar():
+            raise SlotUnavailable(message)
+
+
+def _remove_booked_slots(mapper, connection, target):
+    if not _applies(target) or target.session_status == 'Canceled':
+        return
+    for slot_model, owner_column, owner_id, _, _ in _parties(target):
+        connection.execute(delete(slot_model).where(
+            *_slot_condition(slot_model, owner_column, owner_id, target.scheduled_time)))
+
+
+event.listen(Session, "before_insert", _validate_session)
+event.listen(Session, "after_insert", _remove_booked_slots)
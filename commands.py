@@ -0,0 +1,272 @@
+# commands.py
+"""
+Maintenance commands, run through the Flask CLI:
+
+    flask --app app migrate
+    flask --app app seed
+    flask --app app check-query-plans
+    flask --app app backfill-review-sentiment --workers 4
+    flask --app app reanalyze-feedback --workers 4 --batch-size 32
+    flask --app app rebuild-feedback-rollups
+    flask --app app rebuild-tutor-stats
+"""
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import inspect, update
+
+from config import db, SEED_DATA_FILE
+from models import TutorReview, SessionFeedback, vader_sentiment
+from feedback_worker import ANALYSIS_DONE
+from feedback_rollups import rebuild_rollups
+from tutor_stats import rebuild_tutor_stats
+from seeding import load_seed_file, seed_database
+from migrations import schema_migrations, upgrade, available_migrations, applied_versions, describe
+from query_plans import check_query_plans
+
+
+@click.command("migrate")
+@click.option("--status", is_flag=True, help="list the migrations and whether they are applied, without applying any")
+@with_appcontext
+def migrate(status):
+    """Apply the pending schema migrations in version order."""
+    if status:
+        with db.engine.connect() as conn:
+            applied = applied_versions(conn)
+        for version, module in available_migrations():
+            click.echo(f"{version} {'applied' if version in applied else 'pending'}  {describe(module)}")
+        return
+    applied = upgrade(db.engine, on_apply=lambda version, description: click.echo(f"Applying {version}: {description}"))
+    click.echo(f"Done: {len(applied)} migrations applied" if applied else "Schema is up to date")
+
+
+@click.command("seed")
+@click.option("--file", "path", default=SEED_DATA_FILE, show_default=True, help="seed data file")
+@click.option("--reset", is_flag=True, help="drop all tables first (destroys existing data)")
+@with_appcontext
+def seed(path, reset):
+    """
+    Apply pending migrations and insert the seed rows that are not there yet.
+    Safe to run repeatedly; existing rows are never modified.
+    """
+    if reset:
+        click.confirm("Drop all tables and their data?", abort=True)
+        db.drop_all()
+        schema_migrations.drop(db.engine, checkfirst=True)
+    for version in upgrade(db.engine):
+        click.echo(f"Applied migration {version}")
+    start = time.perf_counter()
+    inserted = seed_database(load_seed_file(path))
+    for table, count in inserted.items():
+        click.echo(f"{table}: {count} rows inserted")
+    if inserted.get("SessionFeedback"):
+        rebuild_rollups()
+        db.session.commit()
+    if inserted.get("SessionFeedback") or inserted.get("TutorReviews"):
+        rebuild_tutor_stats(db.session.connection())
+        db.session.commit()
+    click.echo(f"Done: {sum(inserted.values())} rows in {time.perf_counter() - start:.1f}s")
+
+
+def _classify_reviews(rows):
+    """Worker: VADER sentiment for a chunk of (review_id, comment) rows."""
+    return [{"review_id": review_id, "sentiment": vader_sentiment(comment)} for review_id, comment in rows]
+
+
+@click.command("backfill-review-sentiment")
+@click.option("--chunk-size", default=1000, show_default=True, help="reviews per worker task")
+@click.option("--workers", default=4, show_default=True, help="worker processes")
+@with_appcontext
+def backfill_review_sentiment(chunk_size, workers):
+    """Store the sentiment of TutorReviews rows that do not have one yet."""
+    columns = {column["name"] for column in inspect(db.engine).get_columns("TutorReviews")}
+    if "sentiment" not in columns:
+        raise click.ClickException("TutorReviews has no sentiment column; run 'flask --app app migrate' first.")
+
+    start = time.perf_counter()
+    total = 0
+    last_id = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            rows = (
+                db.session.query(TutorReview.review_id, TutorReview.comment)
+                .filter(TutorReview.sentiment.is_(None), TutorReview.review_id > last_id)
+                .order_by(TutorReview.review_id)
+                .limit(chunk_size * workers)
+                .all()
+            )
+            if not rows:
+                break
+            last_id = rows[-1].review_id
+            rows = [tuple(row) for row in rows]
+            chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+            for updates in pool.map(_classify_reviews, chunks):
+                db.session.execute(update(TutorReview), updates)
+            db.session.commit()
+            total += len(rows)
+            click.echo(f"{total} reviews updated ({total / (time.perf_counter() - start):.0f} rows/s)")
+    if total:
+        rebuild_tutor_stats(db.session.connection())
+        db.session.commit()
+    click.echo(f"Done: {total} reviews in {time.perf_counter() - start:.1f}s")
+
+
+def _init_analysis_worker(threads):
+    """Worker initializer: limit torch threads and load the models once per process."""
+    import torch
+    import nlp_models
+    torch.set_num_threads(threads)
+    nlp_models.warm_up()
+
+
+def _reanalyze_batch(rows):
+    """Worker: analyze a batch of (feedback_id, text) rows and return bulk-update dicts."""
+    from feedback_analysis import analyze_feedback_batch
+    results = analyze_feedback_batch([text or "" for _, text in rows])
+    return [
+        {
+            "feedback_id": feedback_id,
+            "feedback_sentiment": result["sentiment"],
+            "feedback_issues": ", ".join(issue["issue"] for issue in result["issues"]),
+            "improvement_tip": result["improvement_tip"],
+            "issue_sentences": json.dumps(result["issue_sentences"]),
+            "issue_scores": json.dumps(result["issues"]),
+            "analysis_status": ANALYSIS_DONE
+        }
+        for (feedback_id, _), result in zip(rows, results)
+    ]
+
+
+def _read_checkpoint(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"last_feedback_id": 0, "processed": 0}
+
+
+def _write_checkpoint(path, checkpoint):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+@click.command("reanalyze-feedback")
+@click.option("--workers", default=2, show_default=True, help="inference worker processes")
+@click.option("--threads-per-worker", default=1, show_default=True, help="torch intra-op threads per worker")
+@click.option("--batch-size", default=32, show_default=True, help="feedback rows per inference batch")
+@click.option("--checkpoint", "checkpoint_path", default="instance/reanalyze_feedback.json", show_default=True)
+@click.option("--reset", is_flag=True, help="ignore the checkpoint and start from the first row")
+@with_appcontext
+def reanalyze_feedback(workers, threads_per_worker, batch_size, checkpoint_path, reset):
+    """
+    Recompute sentiment, issues and improvement tips of all SessionFeedback rows.
+    Rows are read in feedback_id order in keyset batches (feedback_id > the
+    last one read, LIMIT batch size), analyzed by a process pool and written
+    back with bulk updates. Progress is checkpointed after every committed
+    batch, so an interrupted run resumes where it stopped.
+    """
+    checkpoint = {"last_feedback_id": 0, "processed": 0} if reset else _read_checkpoint(checkpoint_path)
+    click.echo(f"Resuming after feedback_id {checkpoint['last_feedback_id']}" if checkpoint["last_feedback_id"] else "Starting from the first row")
+
+    start = time.perf_counter()
+    processed = 0
+    last_read = checkpoint["last_feedback_id"]
+    in_flight = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_analysis_worker,
+        initargs=(threads_per_worker,)
+    ) as pool:
+        def drain(limit):
+            nonlocal processed
+            while len(in_flight) > limit:
+                last_id, future = in_flight.popleft()
+                updates = future.result()
+                db.session.execute(update(SessionFeedback), updates)
+                db.session.commit()
+                processed += len(updates)
+                checkpoint["last_feedback_id"] = last_id
+                checkpoint["processed"] += len(updates)
+                _write_checkpoint(checkpoint_path, checkpoint)
+                click.echo(f"{checkpoint['processed']} rows done, last feedback_id {last_id} "
+                           f"({processed / (time.perf_counter() - start):.1f} rows/s)")
+
+        while True:
+            # Each batch is a short query of its own: no cursor stays open
+            # across the writes, whatever the driver buffers.
+            rows = db.session.execute(
+                db.select(SessionFeedback.feedback_id, SessionFeedback.student_feedback)
+                .where(SessionFeedback.feedback_id > last_read)
+                .order_by(SessionFeedback.feedback_id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            rows = [tuple(row) for row in rows]
+            last_read = rows[-1][0]
+            in_flight.append((last_read, pool.submit(_reanalyze_batch, rows)))
+            drain(workers * 2)
+        drain(0)
+    elapsed = time.perf_counter() - start
+    click.echo(f"Done: {processed} rows in {elapsed:.1f}s ({processed / elapsed if elapsed else 0:.1f} rows/s)")
+    rolled_up = rebuild_rollups()
+    rebuild_tutor_stats(db.session.connection())
+    db.session.commit()
+    click.echo(f"Rebuilt feedback rollups from {rolled_up} rows and the tutor stats")
+
+
+@click.command("rebuild-feedback-rollups")
+@with_appcontext
+def rebuild_feedback_rollups():
+    """Recompute the per-tutor issue and sentiment rollups from SessionFeedback."""
+    rolled_up = rebuild_rollups()
+    db.session.commit()
+    click.echo(f"Rebuilt feedback rollups from {rolled_up} rows")
+
+
+@click.command("rebuild-tutor-stats")
+@with_appcontext
+def rebuild_tutor_stats_command():
+    """Recompute the per-tutor review counts, star histograms and sentiment counts."""
+    tutors = rebuild_tutor_stats(db.session.connection())
+    db.session.commit()
+    click.echo(f"Rebuilt stats of {tutors} tutors")
+
+
+@click.command("check-query-plans")
+@with_appcontext
+def check_query_plans_command():
+    """
+    EXPLAIN the hot queries of app.py and matching_module.py and fail if any
+    of them reads a table without an index.
+    """
+    results = check_query_plans(db.engine)
+    for result in results:
+        click.echo(f"{'ok  ' if result['ok'] else 'SCAN'} {result['name']} ({result['source']})")
+        for table, description in result["tables"].items():
+            click.echo(f"       {table}: {description}")
+    failed = [result["name"] for result in results if not result["ok"]]
+    if failed:
+        raise click.ClickException(f"{len(failed)} hot queries do not use an index: {', '.join(failed)}")
+
+
+def register_commands(app):
+    app.cli.add_command(migrate)
+    app.cli.add_command(seed)
+    app.cli.add_command(backfill_review_sentiment)
+    app.cli.add_command(reanalyze_feedback)
+    app.cli.add_command(rebuild_feedback_rollups)
+    app.cli.add_command(rebuild_tutor_stats_command)
+    app.cli.add_command(check_query_plans_command)
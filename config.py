@@ -1,24 +1,187 @@
 import os
 from urllib.parse import quote_plus
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from db_pool import InstrumentedQueuePool
+from db_routing import REPLICA_BIND, RoutingSession
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.engine import make_url
 
 load_dotenv()
 
 DB_USERNAME = os.getenv("DB_USERNAME")
-DB_PASSWORD = quote_plus(os.getenv("DB_PASSWORD"))
+DB_PASSWORD = quote_plus(os.getenv("DB_PASSWORD", ""))
 DB_HOST = os.getenv("DB_HOST")
 DB_NAME = os.getenv("DB_NAME")
 
-SQLALCHEMY_DATABASE_URI = (
+# DATABASE_URL (any SQLAlchemy URL, e.g. sqlite:///tutoreal.sqlite3; relative
+# SQLite paths are resolved in the instance/ folder)
+# replaces the MySQL database built from the DB_* variables, so the app and
+# the benchmarks can run without a MySQL server.
+DATABASE_URL = os.getenv("DATABASE_URL")
+SQLALCHEMY_DATABASE_URI = DATABASE_URL or (
     f"mysql+mysqlconnector://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}/{DB_NAME}?charset=utf8"
 )
 
-# Create a shared SQLAlchemy instance.
-db = SQLAlchemy()
+# One pooled engine per process, shared by the ORM session and raw-cursor users.
+# Recycle connections before MySQL's wait_timeout closes them; pre-ping drops
+# connections that died while idle in the pool.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "10"))
+
+# Operational endpoints (pool and SQL statistics, experiment results) are not
+# authenticated; they respond 404 unless this is set, e.g. on a staging host
+# or behind a network policy that only admits operators.
+INTERNAL_ENDPOINTS_ENABLED = os.getenv("INTERNAL_ENDPOINTS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+
+def engine_options(uri: str) -> dict:
+    """Engine options for a database URL; the pool and connect options depend on its dialect."""
+    url = make_url(uri)
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            # An in-memory database lives in one connection; keep SQLAlchemy's default pool.
+            return {}
+        # sqlite3's timeout is how long a connection waits for another writer's lock.
+        connect_args = {"timeout": DB_CONNECT_TIMEOUT}
+    else:
+        connect_args = {"connection_timeout": DB_CONNECT_TIMEOUT}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+
+# Per-request SQL instrumentation (sql_stats.py). Statements slower than
+# SQL_SLOW_QUERY_MS and requests whose statements took more than
+# SQL_SLOW_REQUEST_MS in total are logged; /internal/sql-stats keeps the
+# SQL_STATS_SLOWEST slowest statements per endpoint. SQL_STATS_HEADER adds an
+# X-SQL-Stats header (statement count and DB time) to every response.
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "100"))
+SQL_SLOW_REQUEST_MS = float(os.getenv("SQL_SLOW_REQUEST_MS", "250"))
+SQL_STATS_SLOWEST = int(os.getenv("SQL_STATS_SLOWEST", "5"))
+SQL_STATS_HEADER = os.getenv("SQL_STATS_HEADER", "false").lower() in ("1", "true", "yes")
+
+# Read replica (db_routing.py). When DATABASE_REPLICA_URL is set, the reads of
+# GET requests and of the tutor matching queries go to it; writes, and every
+# request of a client for DB_READ_AFTER_WRITE_SECONDS after it wrote, use the
+# primary. Any SQLAlchemy URL works, e.g. a second SQLite file locally.
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL", "")
+DB_READ_AFTER_WRITE_SECONDS = float(os.getenv("DB_READ_AFTER_WRITE_SECONDS", "5"))
+SQLALCHEMY_BINDS = (
+    {REPLICA_BIND: {"url": DATABASE_REPLICA_URL, **engine_options(DATABASE_REPLICA_URL)}}
+    if DATABASE_REPLICA_URL else {}
+)
+
+# Read-through cache of the tutor profile page's data (tutor_profile_cache.py),
+# invalidated when the tutor, their subjects, slots, reviews, sessions or
+# feedback change. "memory" is a per-process LRU of TUTOR_PROFILE_CACHE_ENTRIES
+# profiles; "sqlite" shares one file (TUTOR_PROFILE_CACHE_PATH) between the
+# worker processes of a node, so a write in one worker invalidates all of them;
+# "none" disables the cache. Entries expire after TUTOR_PROFILE_CACHE_TTL_SECONDS,
+# which bounds staleness after writes that bypass the ORM events.
+TUTOR_PROFILE_CACHE_BACKEND = os.getenv("TUTOR_PROFILE_CACHE_BACKEND", "memory")
+TUTOR_PROFILE_CACHE_ENTRIES = int(os.getenv("TUTOR_PROFILE_CACHE_ENTRIES", "1000"))
+TUTOR_PROFILE_CACHE_PATH = os.getenv("TUTOR_PROFILE_CACHE_PATH", "instance/tutor_profile_cache.sqlite3")
+TUTOR_PROFILE_CACHE_TTL_SECONDS = float(os.getenv("TUTOR_PROFILE_CACHE_TTL_SECONDS", "300"))
+
+# Bookings must match one of the student's available slots as well as the
+# tutor's, as the old before_session_insert trigger required.
+BOOKING_REQUIRE_STUDENT_SLOT = os.getenv("BOOKING_REQUIRE_STUDENT_SLOT", "true").lower() in ("1", "true", "yes")
+
+# Matching weights and A/B weight experiments.
+WEIGHTS_FILE = os.getenv("WEIGHTS_FILE", "weights.json")
+EXPERIMENTS_FILE = os.getenv("EXPERIMENTS_FILE", "experiments.json")
+
+# Seed rows loaded by `flask --app app seed` (see seeding.py).
+SEED_DATA_FILE = os.getenv("SEED_DATA_FILE", "seed_data.json")
+
+# Reviews per page of the tutor feedback feed (see review_feed.py).
+REVIEWS_PER_PAGE = int(os.getenv("REVIEWS_PER_PAGE", "20"))
+
+# Model revisions (git tag or commit on the Hugging Face hub). They are part of
+# the NLP result cache key, so pinning a new revision invalidates cached results.
+SENTIMENT_MODEL_REVISION = os.getenv("SENTIMENT_MODEL_REVISION", "main")
+ISSUE_MODEL_REVISION = os.getenv("ISSUE_MODEL_REVISION", "main")
+
+# Sentiment engine: "cascade" accepts VADER's label when |compound| is at
+# least SENTIMENT_VADER_THRESHOLD and only runs the transformer on the rest;
+# "transformer" runs the transformer on every text.
+SENTIMENT_ENGINE = os.getenv("SENTIMENT_ENGINE", "cascade")
+SENTIMENT_VADER_THRESHOLD = float(os.getenv("SENTIMENT_VADER_THRESHOLD", "0.5"))
+
+# Cache of sentiment/issue results keyed on the normalized text, shared by all
+# workers through a SQLite file.
+NLP_CACHE_ENABLED = os.getenv("NLP_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+NLP_CACHE_PATH = os.getenv("NLP_CACHE_PATH", "instance/nlp_cache.sqlite3")
+NLP_CACHE_MEMORY_ENTRIES = int(os.getenv("NLP_CACHE_MEMORY_ENTRIES", "10000"))
+NLP_CACHE_MAX_DISK_ENTRIES = int(os.getenv("NLP_CACHE_MAX_DISK_ENTRIES", "1000000"))
+
+# Inference backend for the transformer pipelines: "pytorch" or "onnx"
+# (ONNX Runtime with dynamic int8 quantization, see nlp_backends.py).
+NLP_BACKEND = os.getenv("NLP_BACKEND", "pytorch")
+ONNX_MODEL_DIR = os.getenv("ONNX_MODEL_DIR", "instance/onnx")
+ONNX_QUANTIZATION = os.getenv("ONNX_QUANTIZATION", "avx2")
+
+# Load the NLP pipelines in the background at startup instead of on first use.
+NLP_WARMUP_ON_START = os.getenv("NLP_WARMUP_ON_START", "false").lower() in ("1", "true", "yes")
+
+# Feedback inference batch size. The shared model server (nlp_server.py) runs a
+# micro-batch once it holds FEEDBACK_BATCH_SIZE texts or FEEDBACK_BATCH_WAIT_MS
+# has passed since its first text.
+FEEDBACK_BATCH_SIZE = int(os.getenv("FEEDBACK_BATCH_SIZE", "8"))
+FEEDBACK_BATCH_WAIT_MS = float(os.getenv("FEEDBACK_BATCH_WAIT_MS", "20"))
+
+# Long feedback is split into sentences and packed into chunks of at most this
+# many characters before inference (see text_chunks.py).
+FEEDBACK_CHUNK_MAX_CHARS = int(os.getenv("FEEDBACK_CHUNK_MAX_CHARS", "400"))
+
+# Shared NLP model server (nlp_server.py). When NLP_SERVER_SOCKET is set, web
+# workers send inference to that Unix socket instead of loading the models.
+NLP_SERVER_SOCKET = os.getenv("NLP_SERVER_SOCKET", "")
+# Shared secret of the server and its clients. Requests are pickled, so there
+# is no default: the server refuses to start and clients to connect without it.
+NLP_SERVER_AUTHKEY = os.getenv("NLP_SERVER_AUTHKEY", "").encode("utf-8")
+NLP_SERVER_TIMEOUT_SECONDS = float(os.getenv("NLP_SERVER_TIMEOUT_SECONDS", "60"))
+
+# Background analysis of submitted feedback. A job still "processing" after
+# the lease has expired (e.g. its worker crashed) is picked up again, up to
+# FEEDBACK_ANALYSIS_MAX_ATTEMPTS times.
+FEEDBACK_WORKER_INTERVAL_SECONDS = int(os.getenv("FEEDBACK_WORKER_INTERVAL_SECONDS", "5"))
+FEEDBACK_ANALYSIS_LEASE_SECONDS = int(os.getenv("FEEDBACK_ANALYSIS_LEASE_SECONDS", "300"))
+FEEDBACK_ANALYSIS_MAX_ATTEMPTS = int(os.getenv("FEEDBACK_ANALYSIS_MAX_ATTEMPTS", "3"))
+
+# CPU-bound work (model inference, password hashing) is moved off the eventlet
+# hub onto a pool of OFFLOAD_THREADS real threads; the *_MAX_CONCURRENCY
+# settings bound how many calls of each kind run at once.
+OFFLOAD_THREADS = int(os.getenv("OFFLOAD_THREADS", "8"))
+INFERENCE_MAX_CONCURRENCY = int(os.getenv("INFERENCE_MAX_CONCURRENCY", "2"))
+PASSWORD_HASH_MAX_CONCURRENCY = int(os.getenv("PASSWORD_HASH_MAX_CONCURRENCY", "4"))
+
+# Issue extraction: "zero-shot" runs bart-large-mnli over every label;
+# "embedding" scores labels with a small sentence encoder and falls back to
+# zero-shot only when the top label's probability is below the minimum confidence.
+ISSUE_CLASSIFIER = os.getenv("ISSUE_CLASSIFIER", "zero-shot")
+ISSUE_EMBEDDING_MODEL = os.getenv("ISSUE_EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+ISSUE_EMBEDDING_TEMPERATURE = float(os.getenv("ISSUE_EMBEDDING_TEMPERATURE", "0.05"))
+ISSUE_FAST_PATH_MIN_CONFIDENCE = float(os.getenv("ISSUE_FAST_PATH_MIN_CONFIDENCE", "0.35"))
+
+# Create a shared SQLAlchemy instance; its sessions route reads to the replica.
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 
 def get_db_connection():
-    """Returns a new database connection using SQLAlchemy."""
-    engine = create_engine(SQLALCHEMY_DATABASE_URI)
-    return engine.connect()
+    """
+    Returns a connection borrowed from the app's shared engine pool.
+    Must be called inside an app context; close it to return it to the pool.
+    """
+    return db.engine.connect()
@@ -0,0 +1,102 @@
+# db_pool.py
+"""
+Connection pool instrumentation for the shared database engine.
+
+InstrumentedQueuePool is a QueuePool that records how long each checkout
+waited for a connection (including opening a new one when the pool grows
+into its overflow) and how often checkouts timed out. pool_status() combines
+those numbers with the pool's current utilization for /internal/db-pool.
+"""
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+class PoolStats:
+    """Checkout wait times, shared by a pool and the pools it is recreated as."""
+
+    def __init__(self, window: int = 1000):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.recent_waits = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, wait: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.recent_waits.append(wait)
+
+    def summary(self) -> dict:
+        with self._lock:
+            recent = sorted(self.recent_waits)
+        def pct(p):
+            return recent[min(len(recent) - 1, int(len(recent) * p / 100))] * 1000 if recent else 0.0
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "mean_wait_ms": self.total_wait / self.checkouts * 1000 if self.checkouts else 0.0,
+            "max_wait_ms": self.max_wait * 1000,
+            "recent_p50_wait_ms": pct(50),
+            "recent_p95_wait_ms": pct(95),
+            "recent_p99_wait_ms": pct(99),
+        }
+
+
+_checkout = threading.local()
+
+
+class InstrumentedQueuePool(QueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def _do_get(self):
+        # QueuePool._do_get retries by calling itself; only time the outer call.
+        if getattr(_checkout, "active", False):
+            return super()._do_get()
+        _checkout.active = True
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        finally:
+            _checkout.active = False
+        self.stats.record(time.perf_counter() - start)
+        return record
+
+
+def pool_status(engine) -> dict:
+    """Current utilization of the engine's pool plus its checkout wait statistics."""
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        size = pool.size()
+        checked_out = pool.checkedout()
+        status.update({
+            "size": size,
+            "max_overflow": pool._max_overflow,
+            "checked_in": pool.checkedin(),
+            "checked_out": checked_out,
+            "overflow": max(pool.overflow(), 0),
+            "utilization": checked_out / (size + max(pool._max_overflow, 0)) if size else 0.0,
+        })
+    if isinstance(pool, InstrumentedQueuePool):
+        status["wait"] = pool.stats.summary()
+    return status
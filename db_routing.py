@@ -0,0 +1,88 @@
+# db_routing.py
+"""
+Read-replica routing for the ORM session.
+
+When a replica is configured (DATABASE_REPLICA_URL, the "replica" bind),
+RoutingSession sends the reads of GET/HEAD requests to it and everything
+else to the primary:
+
+- flushes, DML statements and SELECT ... FOR UPDATE always use the primary,
+  and once a request has written, its remaining reads use the primary too;
+- non-GET requests, background jobs and CLI commands never use the replica;
+- after a request writes, the client's requests for the next
+  DB_READ_AFTER_WRITE_SECONDS stay on the primary (a timestamp in the Flask
+  session), so a page loaded right after a booking or a profile update sees
+  the write even if the replica lags.
+
+Raw connections follow the same routing through db.session.get_bind().
+primary_reads() sends a block's reads to the primary, for results that
+outlive the request (caches).
+"""
+import time
+from contextlib import contextmanager
+
+from flask import request, session as client_session
+from flask_sqlalchemy.session import Session
+
+REPLICA_BIND = "replica"
+
+READ_METHODS = ("GET", "HEAD")
+
+# Keys of Session.info and of the Flask session.
+_USE_REPLICA = "use_replica"
+_WROTE = "wrote"
+_PRIMARY_UNTIL = "_primary_until"
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session that reads from the replica bind when the request allows it."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        if bind is not None:
+            return engine
+        if self._flushing or _is_write(clause):
+            self.info[_WROTE] = True
+            return engine
+        if not self.info.get(_USE_REPLICA) or self.info.get(_WROTE):
+            return engine
+        replica = self._db.engines.get(REPLICA_BIND)
+        # Only tables of the default bind are replicated.
+        if replica is not None and engine is self._db.engines.get(None):
+            return replica
+        return engine
+
+
+@contextmanager
+def primary_reads(session):
+    """Read from the primary inside the block, even on a GET request."""
+    use_replica = session.info.get(_USE_REPLICA)
+    session.info[_USE_REPLICA] = False
+    try:
+        yield
+    finally:
+        session.info[_USE_REPLICA] = use_replica
+
+
+def _is_write(clause) -> bool:
+    if clause is None:
+        return False
+    return getattr(clause, "is_dml", False) or getattr(clause, "_for_update_arg", None) is not None
+
+
+def init_read_routing(app, db, read_after_write_seconds: float):
+    """Route the reads of the app's GET requests to the replica, if one is configured."""
+
+    def start_request():
+        if REPLICA_BIND not in db.engines:
+            return
+        db.session.info[_USE_REPLICA] = (request.method in READ_METHODS
+                                         and time.time() >= client_session.get(_PRIMARY_UNTIL, 0))
+
+    def finish_request(response):
+        if REPLICA_BIND in db.engines and db.session.info.get(_WROTE):
+            client_session[_PRIMARY_UNTIL] = time.time() + read_after_write_seconds
+        return response
+
+    app.before_request(start_request)
+    app.after_request(finish_request)
@@ -0,0 +1,229 @@
+# experiments.py
+import copy
+import hashlib
+import json
+import math
+import os
+import threading
+from datetime import datetime
+
+from sqlalchemy import select, update
+
+from config import db, EXPERIMENTS_FILE, WEIGHTS_FILE
+from models import ExperimentArmStats, ExperimentExposure
+from upserts import increment, insert_once
+
+HASH_BUCKETS = 10000
+Z_95 = 1.96
+
+# path -> (modification time, parsed JSON) of the experiment and weights files.
+_json_cache = {}
+_json_cache_lock = threading.Lock()
+
+
+def _load_json(path):
+    """
+    Parse a JSON file, reusing the previous result while the file's
+    modification time is unchanged. Callers get their own copy.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    with _json_cache_lock:
+        cached = _json_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, "r") as f:
+            cached = (mtime, json.load(f))
+        with _json_cache_lock:
+            _json_cache[path] = cached
+    return copy.deepcopy(cached[1])
+
+
+def load_experiment(path=EXPERIMENTS_FILE):
+    """
+    Load the experiment definition.
+    Arms are listed in order; the first arm is the control. Each arm has an
+    'allocation' (percentage of students) and 'weights', either a dict of
+    weights or the path of a weights JSON file.
+    Falls back to a single control arm using weights.json when no experiment is configured.
+    The file is only re-read after it changes.
+    """
+    try:
+        experiment = _load_json(path)
+    except FileNotFoundError:
+        return {"name": "default", "arms": [{"name": "control", "allocation": 100, "weights": WEIGHTS_FILE}]}
+    total = sum(arm["allocation"] for arm in experiment["arms"])
+    if not experiment["arms"] or abs(total - 100) > 1e-9:
+        raise ValueError(f"Arm allocations in {path} must add up to 100, got {total}.")
+    return experiment
+
+
+def hash_bucket(experiment_name, student_id):
+    """Map a student to a stable bucket in [0, HASH_BUCKETS) for the given experiment."""
+    digest = hashlib.sha256(f"{experiment_name}:{student_id}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % HASH_BUCKETS
+
+
+def assign_arm(student_id, experiment=None):
+    """Deterministically assign a student to an arm of the experiment."""
+    experiment = experiment or load_experiment()
+    bucket = hash_bucket(experiment["name"], student_id)
+    upper = 0.0
+    for arm in experiment["arms"]:
+        upper += arm["allocation"] * HASH_BUCKETS / 100.0
+        if bucket < upper:
+            return arm
+    return experiment["arms"][-1]
+
+
+def arm_weights(arm):
+    weights = arm["weights"]
+    if isinstance(weights, str):
+        return _load_json(weights)
+    return dict(weights)
+
+
+def weights_for_student(student_id):
+    """Return (experiment name, arm name, weights) for the student."""
+    experiment = load_experiment()
+    arm = assign_arm(student_id, experiment)
+    return experiment["name"], arm["name"], arm_weights(arm)
+
+
+# ----------------------------
+# Incremental per-arm counters
+# ----------------------------
+
+def _increment(experiment_name, arm_name, **deltas):
+    """Add deltas to the arm's counters. Runs inside the caller's transaction; the caller commits."""
+    increment(db.session, ExperimentArmStats.__table__,
+              {"experiment_name": experiment_name, "arm_name": arm_name}, deltas)
+
+
+def _expose(experiment_name, arm_name, student_id):
+    """Count the student as exposed to the arm the first time they see it."""
+    table = ExperimentExposure.__table__
+    seen = db.session.execute(select(table.c.student_id).where(
+        table.c.experiment_name == experiment_name, table.c.student_id == student_id)).first()
+    if seen:
+        return
+    # insert_once settles the race between two first views of the same student.
+    if insert_once(db.session, table, {"experiment_name": experiment_name, "student_id": student_id,
+                                       "arm_name": arm_name, "exposed_at": datetime.now()}):
+        _increment(experiment_name, arm_name, exposures=1)
+
+
+def record_exposure(student_id):
+    experiment = load_experiment()
+    _expose(experiment["name"], assign_arm(student_id, experiment)["name"], student_id)
+
+
+def record_booking(student_id):
+    """Count a booking, and the student as converted on their first one."""
+    experiment = load_experiment()
+    arm_name = assign_arm(student_id, experiment)["name"]
+    # Students can book without having seen a recommendation page.
+    _expose(experiment["name"], arm_name, student_id)
+    table = ExperimentExposure.__table__
+    first = db.session.execute(
+        update(table)
+        .where(table.c.experiment_name == experiment["name"], table.c.student_id == student_id,
+               table.c.first_booked_at.is_(None))
+        .values(first_booked_at=datetime.now())
+    ).rowcount
+    _increment(experiment["name"], arm_name, bookings=1, booking_students=first)
+
+
+def record_rating(student_id, star_rating):
+    experiment = load_experiment()
+    rating = float(star_rating)
+    _increment(experiment["name"], assign_arm(student_id, experiment)["name"],
+               rating_count=1, rating_sum=rating, rating_sq_sum=rating * rating)
+
+
+# ----------------------------
+# Reporting
+# ----------------------------
+
+def _proportion(successes, trials):
+    """
+    The rate, its standard error (for the lift) and its 95% Wilson score
+    interval, which stays within [0, 1] and keeps its coverage for small
+    samples and rates near 0 or 1.
+    """
+    if trials == 0:
+        return None, None, None
+    p = successes / trials
+    z2 = Z_95 * Z_95
+    center = (p + z2 / (2 * trials)) / (1 + z2 / trials)
+    half_width = Z_95 * math.sqrt(p * (1 - p) / trials + z2 / (4 * trials * trials)) / (1 + z2 / trials)
+    return p, math.sqrt(max(p * (1 - p), 0.0) / trials), [max(center - half_width, 0.0), min(center + half_width, 1.0)]
+
+
+def _mean(count, total, sq_total):
+    if count == 0:
+        return None, None
+    mean = total / count
+    if count < 2:
+        return mean, None
+    variance = max((sq_total - total * total / count) / (count - 1), 0.0)
+    return mean, math.sqrt(variance / count)
+
+
+def _interval(value, se):
+    if value is None or se is None:
+        return None
+    return [value - Z_95 * se, value + Z_95 * se]
+
+
+def _lift(arm_value, arm_se, control_value, control_se):
+    """Absolute difference vs. control with a 95% normal-approximation interval."""
+    if arm_value is None or control_value is None:
+        return None
+    diff = arm_value - control_value
+    se = None if arm_se is None or control_se is None else math.sqrt(arm_se ** 2 + control_se ** 2)
+    return {
+        "absolute": diff,
+        "relative": diff / control_value if control_value else None,
+        "ci": _interval(diff, se)
+    }
+
+
+def experiment_report():
+    """Build the per-arm metrics and lift vs. control from the stored counters."""
+    experiment = load_experiment()
+    rows = {row.arm_name: row for row in
+            ExperimentArmStats.query.filter_by(experiment_name=experiment["name"]).all()}
+    arms = []
+    for arm in experiment["arms"]:
+        row = rows.get(arm["name"])
+        exposures = row.exposures if row else 0
+        booking_students = row.booking_students if row else 0
+        bookings = row.bookings if row else 0
+        rating_count = row.rating_count if row else 0
+        booking_rate, booking_se, booking_ci = _proportion(booking_students, exposures)
+        mean_rating, rating_se = _mean(rating_count, row.rating_sum if row else 0.0, row.rating_sq_sum if row else 0.0)
+        arms.append({
+            "arm": arm["name"],
+            "allocation": arm["allocation"],
+            "exposures": exposures,
+            "booking_students": booking_students,
+            "bookings": bookings,
+            "booking_rate": booking_rate,
+            "booking_rate_ci": booking_ci,
+            "rating_count": rating_count,
+            "mean_rating": mean_rating,
+            "mean_rating_ci": _interval(mean_rating, rating_se),
+            "_booking_se": booking_se,
+            "_rating_se": rating_se
+        })
+    control = arms[0]
+    lift = []
+    for arm in arms[1:]:
+        lift.append({
+            "arm": arm["arm"],
+            "booking_rate": _lift(arm["booking_rate"], arm["_booking_se"], control["booking_rate"], control["_booking_se"]),
+            "mean_rating": _lift(arm["mean_rating"], arm["_rating_se"], control["mean_rating"], control["_rating_se"])
+        })
+    for arm in arms:
+        del arm["_booking_se"]
+        del arm["_rating_se"]
+    return {"experiment": experiment["name"], "control": control["arm"], "arms": arms, "lift": lift}
@@ -0,0 +1,142 @@
+# feedback_analysis.py
+from collections import defaultdict
+
+from config import FEEDBACK_BATCH_SIZE, NLP_SERVER_SOCKET
+from sentiment_analysis import analyze_sentiments
+from issue_extraction import extract_issues_batch, issue_scores_batch
+from improvement_tips import generate_improvement_tip
+from text_chunks import split_sentences, chunk_sentences
+
+
+def normalize_sentiment_label(label: str) -> str:
+    """Map a model label such as 'POSITIVE' onto Positive/Neutral/Negative."""
+    label = (label or "").capitalize()
+    if label not in ["Positive", "Neutral", "Negative"]:
+        label = "Neutral"
+    return label
+
+
+def analyze_feedback_batch(texts: list) -> list:
+    """
+    Run sentiment analysis and issue extraction over a batch of feedback texts,
+    on the shared model server when one is configured.
+
+    Returns:
+        list: One dictionary per text with 'sentiment', 'issues', 'issue_sentences'
+              and 'improvement_tip'.
+    """
+    if NLP_SERVER_SOCKET:
+        from nlp_client import nlp_client
+        return nlp_client.analyze_feedback_batch(texts)
+    return analyze_feedback_batch_local(texts)
+
+
+def analyze_feedback_batch_local(texts: list, batch_size: int = FEEDBACK_BATCH_SIZE) -> list:
+    """
+    analyze_feedback_batch using the models loaded in this process.
+    `batch_size` is the forward-pass batch size of every model call.
+
+    Each text is split into sentences that are packed into chunks; sentiment
+    and issues run once per chunk. Sentiment is aggregated weighted by chunk
+    length, issues keep their highest score. 'issue_sentences' lists the
+    character spans of the sentences each issue was attributed to (see
+    attribute_issues).
+    """
+    sentence_spans = [split_sentences(text) or [(0, len(text or ""))] for text in texts]
+    chunk_spans = [chunk_sentences(spans) for spans in sentence_spans]
+    chunks = [(text or "")[start:end] for text, spans in zip(texts, chunk_spans) for start, end in spans]
+    # The sentences of every chunk, in the same order as chunks.
+    chunk_sentence_spans = [[(start, end) for start, end in sentences if chunk_start <= start and end <= chunk_end]
+                            for sentences, text_chunks in zip(sentence_spans, chunk_spans)
+                            for chunk_start, chunk_end in text_chunks]
+    chunk_texts = [text for text, text_chunks in zip(texts, chunk_spans) for _ in text_chunks]
+
+    chunk_sentiments = analyze_sentiments(chunks, batch_size=batch_size)
+    chunk_issues = extract_issues_batch(chunks, batch_size=batch_size)
+    attributed = attribute_issues(
+        [[(text or "")[start:end] for start, end in spans] for text, spans in zip(chunk_texts, chunk_sentence_spans)],
+        chunk_issues, batch_size)
+
+    results = []
+    position = 0
+    for text_chunks in chunk_spans:
+        chunk_range = range(position, position + len(text_chunks))
+        position += len(text_chunks)
+        sentiment = aggregate_sentiment([chunk_sentiments[i] for i in chunk_range],
+                                        [end - start for start, end in text_chunks])
+        issues = aggregate_issues([chunk_issues[i] for i in chunk_range])
+        results.append({
+            "sentiment": normalize_sentiment_label(sentiment.get("label", "")),
+            "issues": issues,
+            "issue_sentences": [
+                {"start": start, "end": end, "issues": found}
+                for i in chunk_range
+                for (start, end), found in zip(chunk_sentence_spans[i], attributed[i]) if found
+            ],
+            "improvement_tip": generate_improvement_tip(issues)
+        })
+    return results
+
+
+def attribute_issues(sentences_per_chunk: list, issues_per_chunk: list, batch_size: int = FEEDBACK_BATCH_SIZE) -> list:
+    """
+    Attribute the issues found in each chunk to the chunk's sentences.
+
+    A chunk of one sentence needs no further inference. Otherwise its
+    sentences are scored against the chunk's issues only (issue_scores_batch),
+    and each issue goes to the sentence that scores highest for it.
+
+    Args:
+        sentences_per_chunk (list): The sentence texts of each chunk.
+        issues_per_chunk (list): The issues extracted from each chunk.
+        batch_size (int): Forward-pass batch size for issue_scores_batch.
+
+    Returns:
+        list: Per chunk, per sentence, the list of issue labels attributed to it.
+    """
+    attributed = [[[] for _ in sentences] for sentences in sentences_per_chunk]
+    # Sentences to score, grouped by the labels to score them against.
+    pending = defaultdict(list)
+    for index, (sentences, issues) in enumerate(zip(sentences_per_chunk, issues_per_chunk)):
+        labels = [issue["issue"] for issue in issues]
+        if not labels:
+            continue
+        if len(sentences) == 1:
+            attributed[index][0] = labels
+        else:
+            pending[tuple(labels)].append(index)
+
+    for labels, indexes in pending.items():
+        texts = [sentence for index in indexes for sentence in sentences_per_chunk[index]]
+        scores = iter(issue_scores_batch(texts, list(labels), batch_size=batch_size))
+        for index in indexes:
+            sentence_scores = [next(scores) for _ in sentences_per_chunk[index]]
+            for label in labels:
+                best = max(range(len(sentence_scores)), key=lambda i: sentence_scores[i].get(label, 0.0))
+                attributed[index][best].append(label)
+    return attributed
+
+
+def aggregate_sentiment(results: list, weights: list) -> dict:
+    """
+    Combine per-chunk sentiment results into one: the length-weighted mean of
+    +score (positive), -score (negative) or 0 (neutral) decides the label.
+    """
+    if len(results) == 1:
+        return results[0]
+    signs = {"POSITIVE": 1, "NEGATIVE": -1}
+    total = sum(weights) or 1
+    polarity = sum(signs.get(result["label"].upper(), 0) * result["score"] * weight
+                   for result, weight in zip(results, weights)) / total
+    label = "POSITIVE" if polarity > 0 else "NEGATIVE" if polarity < 0 else "NEUTRAL"
+    return {"label": label, "score": abs(polarity)}
+
+
+def aggregate_issues(per_chunk: list) -> list:
+    """Merge per-chunk issue lists, keeping each issue's highest score."""
+    best = {}
+    for issues in per_chunk:
+        for issue in issues:
+            if issue["score"] > best.get(issue["issue"], 0.0):
+                best[issue["issue"]] = issue["score"]
+    return [{"issue": issue, "score": score} for issue, score in sorted(best.items(), key=lambda item: -item[1])]
@@ -0,0 +1,161 @@
+# feedback_rollups.py
+"""
+Per-tutor rollups of analyzed feedback over weekly buckets.
+
+TutorIssueRollups holds issue counts and score sums, TutorSentimentRollups
+sentiment counts and rating sums, per tutor and week (bucket_start is the
+Monday of the session's week). The feedback worker adds each analyzed
+feedback in the same transaction that stores its analysis, so trends and
+recurring-issue rankings read O(buckets) rows instead of every feedback.
+"""
+import json
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+
+from config import db
+from models import SessionFeedback, Session, TutorIssueRollup, TutorSentimentRollup
+from upserts import increment
+
+SENTIMENT_COLUMNS = {"Positive": "positive_count", "Neutral": "neutral_count", "Negative": "negative_count"}
+
+
+def bucket_start(when) -> date:
+    """Monday of the week containing `when` (today if None)."""
+    day = (when or datetime.now())
+    if isinstance(day, datetime):
+        day = day.date()
+    return day - timedelta(days=day.weekday())
+
+
+def record_feedback(tutor_id, when, sentiment: str, issues: list, star_rating=None):
+    """
+    Add one analyzed feedback to its tutor's rollups.
+
+    Args:
+        tutor_id (int): The tutor the feedback is about.
+        when (datetime): When the session took place; selects the bucket.
+        sentiment (str): Positive, Neutral or Negative.
+        issues (list): {"issue", "score"} dictionaries.
+        star_rating (int): The feedback's star rating, if any.
+    """
+    if tutor_id is None:
+        return
+    bucket = bucket_start(when)
+    counters = {"feedback_count": 1, "rating_sum": float(star_rating or 0)}
+    if sentiment in SENTIMENT_COLUMNS:
+        counters[SENTIMENT_COLUMNS[sentiment]] = 1
+    increment(db.session, TutorSentimentRollup.__table__, {"tutor_id": tutor_id, "bucket_start": bucket}, counters)
+    for issue in issues:
+        increment(db.session, TutorIssueRollup.__table__,
+                  {"tutor_id": tutor_id, "bucket_start": bucket, "issue": issue["issue"]},
+                  {"issue_count": 1, "score_sum": float(issue["score"])})
+
+
+def recurring_issues(tutor_id, weeks: int = 8, limit: int = 3) -> list:
+    """
+    The tutor's most frequent issues over the last `weeks` weeks.
+
+    Returns:
+        list: {"issue", "count", "mean_score"} dictionaries, most frequent first.
+    """
+    since = bucket_start(None) - timedelta(weeks=weeks - 1)
+    count = db.func.sum(TutorIssueRollup.issue_count)
+    score_sum = db.func.sum(TutorIssueRollup.score_sum)
+    rows = (
+        db.session.query(TutorIssueRollup.issue, count, score_sum)
+        .filter(TutorIssueRollup.tutor_id == tutor_id, TutorIssueRollup.bucket_start >= since)
+        .group_by(TutorIssueRollup.issue)
+        .order_by(count.desc(), score_sum.desc())
+        .limit(limit)
+        .all()
+    )
+    return [{"issue": issue, "count": int(total), "mean_score": float(scores) / total if total else 0.0}
+            for issue, total, scores in rows]
+
+
+def tutor_trends(tutor_id, weeks: int = 12, top_issues: int = 3) -> list:
+    """
+    Weekly feedback trends for a tutor, newest week first.
+
+    Returns:
+        list: One dictionary per week with feedback: 'week', 'feedback_count',
+              'average_rating', 'positive_share', 'negative_share' and
+              'top_issues' ({"issue", "count"}).
+    """
+    since = bucket_start(None) - timedelta(weeks=weeks - 1)
+    issues_by_week = defaultdict(list)
+    for row in (TutorIssueRollup.query
+                .filter(TutorIssueRollup.tutor_id == tutor_id, TutorIssueRollup.bucket_start >= since)
+                .order_by(TutorIssueRollup.issue_count.desc(), TutorIssueRollup.score_sum.desc())):
+        if len(issues_by_week[row.bucket_start]) < top_issues:
+            issues_by_week[row.bucket_start].append({"issue": row.issue, "count": row.issue_count})
+
+    trends = []
+    for row in (TutorSentimentRollup.query
+                .filter(TutorSentimentRollup.tutor_id == tutor_id, TutorSentimentRollup.bucket_start >= since)
+                .order_by(TutorSentimentRollup.bucket_start.desc())):
+        total = row.feedback_count or 1
+        trends.append({
+            "week": row.bucket_start,
+            "feedback_count": row.feedback_count,
+            "average_rating": round(row.rating_sum / total, 2),
+            "positive_share": row.positive_count / total,
+            "negative_share": row.negative_count / total,
+            "top_issues": issues_by_week.get(row.bucket_start, [])
+        })
+    return trends
+
+
+def rebuild_rollups() -> int:
+    """
+    Recompute all rollups from the analyzed SessionFeedback rows, e.g. after
+    reanalyze-feedback. Rows analyzed before issue scores were stored count
+    their issues with a score of 0. The caller commits.
+
+    Returns:
+        int: Number of feedback rows rolled up.
+    """
+    sentiment_rows = defaultdict(lambda: defaultdict(float))
+    issue_rows = defaultdict(lambda: defaultdict(float))
+    rows = (
+        db.session.query(Session.tutor_id, Session.scheduled_time, SessionFeedback.feedback_sentiment,
+                         SessionFeedback.star_rating, SessionFeedback.issue_scores, SessionFeedback.feedback_issues)
+        .join(Session, Session.session_id == SessionFeedback.session_id)
+        .filter(SessionFeedback.analysis_status == 'done', SessionFeedback.feedback_sentiment.isnot(None))
+        .yield_per(1000)
+    )
+    total = 0
+    for tutor_id, scheduled_time, sentiment, star_rating, issue_scores, feedback_issues in rows:
+        key = (tutor_id, bucket_start(scheduled_time))
+        counters = sentiment_rows[key]
+        counters["feedback_count"] += 1
+        counters["rating_sum"] += float(star_rating or 0)
+        if sentiment in SENTIMENT_COLUMNS:
+            counters[SENTIMENT_COLUMNS[sentiment]] += 1
+        if issue_scores:
+            issues = json.loads(issue_scores)
+        else:
+            issues = [{"issue": label.strip(), "score": 0.0} for label in (feedback_issues or "").split(",") if label.strip()]
+        for issue in issues:
+            counters = issue_rows[key + (issue["issue"],)]
+            counters["issue_count"] += 1
+            counters["score_sum"] += issue["score"]
+        total += 1
+
+    db.session.query(TutorIssueRollup).delete(synchronize_session=False)
+    db.session.query(TutorSentimentRollup).delete(synchronize_session=False)
+    if sentiment_rows:
+        db.session.execute(insert(TutorSentimentRollup), [
+            dict(tutor_id=tutor_id, bucket_start=bucket, **{column: int(value) if column != "rating_sum" else value
+                                                            for column, value in counters.items()})
+            for (tutor_id, bucket), counters in sentiment_rows.items()
+        ])
+    if issue_rows:
+        db.session.execute(insert(TutorIssueRollup), [
+            dict(tutor_id=tutor_id, bucket_start=bucket, issue=issue,
+                 issue_count=int(counters["issue_count"]), score_sum=counters["score_sum"])
+            for (tutor_id, bucket, issue), counters in issue_rows.items()
+        ])
+    return total
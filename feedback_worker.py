@@ -0,0 +1,101 @@
+# feedback_worker.py
+import json
+import logging
+from datetime import datetime, timedelta
+
+from config import (db, FEEDBACK_BATCH_SIZE, FEEDBACK_ANALYSIS_LEASE_SECONDS,
+                    FEEDBACK_ANALYSIS_MAX_ATTEMPTS)
+from models import SessionFeedback, Session
+from feedback_analysis import analyze_feedback_batch
+from offload import offload
+from feedback_rollups import record_feedback
+
+ANALYSIS_PENDING = 'pending'
+ANALYSIS_PROCESSING = 'processing'
+ANALYSIS_DONE = 'done'
+ANALYSIS_FAILED = 'failed'
+
+
+def claim_pending_feedback(limit=FEEDBACK_BATCH_SIZE):
+    """
+    Mark up to `limit` feedback rows as processing and return them.
+    Picks rows that are pending, or that have been processing for longer than
+    the lease (their worker died). Rows out of attempts are marked failed.
+    Uses SKIP LOCKED so several web workers never claim the same row.
+    """
+    now = datetime.now()
+    stale = now - timedelta(seconds=FEEDBACK_ANALYSIS_LEASE_SECONDS)
+    rows = (
+        SessionFeedback.query
+        .filter(
+            (SessionFeedback.analysis_status == ANALYSIS_PENDING) |
+            ((SessionFeedback.analysis_status == ANALYSIS_PROCESSING) &
+             (SessionFeedback.analysis_started_at < stale))
+        )
+        .order_by(SessionFeedback.feedback_id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    claimed = []
+    for row in rows:
+        if row.analysis_attempts >= FEEDBACK_ANALYSIS_MAX_ATTEMPTS:
+            row.analysis_status = ANALYSIS_FAILED
+            logging.error(f"Giving up on analysis of feedback {row.feedback_id} after {row.analysis_attempts} attempts")
+            continue
+        row.analysis_status = ANALYSIS_PROCESSING
+        row.analysis_attempts += 1
+        row.analysis_started_at = now
+        claimed.append(row)
+    db.session.commit()
+    return claimed
+
+
+def process_pending_feedback():
+    """
+    Analyze one batch of claimed feedback and store the results.
+    Must run inside an app context.
+
+    Returns:
+        list: (tutor_id, payload) pairs for the feedback that was analyzed.
+    """
+    claimed = claim_pending_feedback()
+    if not claimed:
+        return []
+    try:
+        results = offload("inference", analyze_feedback_batch, [row.student_feedback or "" for row in claimed])
+    except Exception as e:
+        logging.error(f"Feedback analysis failed, will retry: {e}")
+        for row in claimed:
+            row.analysis_status = (ANALYSIS_FAILED if row.analysis_attempts >= FEEDBACK_ANALYSIS_MAX_ATTEMPTS
+                                   else ANALYSIS_PENDING)
+        db.session.commit()
+        return []
+
+    sessions = {
+        session_id: (tutor_id, scheduled_time)
+        for session_id, tutor_id, scheduled_time in
+        db.session.query(Session.session_id, Session.tutor_id, Session.scheduled_time)
+        .filter(Session.session_id.in_({row.session_id for row in claimed}))
+        .all()
+    }
+    notifications = []
+    for row, result in zip(claimed, results):
+        tutor_id, scheduled_time = sessions.get(row.session_id, (None, None))
+        row.feedback_sentiment = result["sentiment"]
+        row.feedback_issues = ", ".join(issue["issue"] for issue in result["issues"])
+        row.improvement_tip = result["improvement_tip"]
+        row.issue_sentences = json.dumps(result["issue_sentences"])
+        row.issue_scores = json.dumps(result["issues"])
+        record_feedback(tutor_id, scheduled_time, result["sentiment"], result["issues"], row.star_rating)
+        row.analysis_status = ANALYSIS_DONE
+        notifications.append((tutor_id, {
+            "feedback_id": row.feedback_id,
+            "session_id": row.session_id,
+            "sentiment": result["sentiment"],
+            "issues": result["issues"],
+            "issue_sentences": result["issue_sentences"],
+            "improvement_tip": result["improvement_tip"]
+        }))
+    db.session.commit()
+    return notifications
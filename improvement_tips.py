@@ -46,6 +46,26 @@ def generate_improvement_tip(issues: list) -> str:
             tips.append(tip)
     return " ".join(tips) if tips else "Great, no improvement suggestions needed."
 
+def rank_improvement_tips(recurring_issues: list, limit: int = 3) -> list:
+    """
+    Improvement tips for a tutor's recurring issues, most frequent first.
+
+    Args:
+        recurring_issues (list): Dictionaries with 'issue' and 'count' keys,
+                                 e.g. from feedback_rollups.recurring_issues.
+        limit (int): Maximum number of tips.
+
+    Returns:
+        list: Dictionaries with 'issue', 'count' and 'tip' keys.
+    """
+    ranked = sorted(recurring_issues, key=lambda issue: issue["count"], reverse=True)
+    tips = []
+    for issue_dict in ranked:
+        tip = improvement_mapping.get(issue_dict["issue"])
+        if tip:
+            tips.append({"issue": issue_dict["issue"], "count": issue_dict["count"], "tip": tip})
+    return tips[:limit]
+
 if __name__ == "__main__":
     sample_issues = [
         {"issue": "pacing", "score": 0.75},
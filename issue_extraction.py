@@ -1,7 +1,25 @@
 # issue_extraction.py
-from transformers import pipeline
+import threading
 
-classifier = pipeline("zero-shot-classification", model="facebook/bart-large-mnli")
+import numpy as np
+
+from config import (ISSUE_CLASSIFIER, ISSUE_MODEL_REVISION, ISSUE_EMBEDDING_MODEL, ISSUE_EMBEDDING_TEMPERATURE,
+                    ISSUE_FAST_PATH_MIN_CONFIDENCE)
+from nlp_models import LazyPipeline, LazySentenceEncoder
+from nlp_cache import cached
+
+ISSUE_MODEL = "facebook/bart-large-mnli"
+LABEL_TEMPLATE = "This feedback is about {}."
+
+classifier = LazyPipeline("zero-shot-classification", ISSUE_MODEL, revision=ISSUE_MODEL_REVISION)
+encoder = LazySentenceEncoder(ISSUE_EMBEDDING_MODEL, register=(ISSUE_CLASSIFIER == "embedding"))
+
+# Label embeddings, computed once per candidate label list.
+_label_embeddings = {}
+# How often the embedding fast path was confident enough to skip zero-shot.
+# Updated from several threads, under the lock.
+fast_path_stats = {"fast": 0, "fallback": 0}
+_fast_path_stats_lock = threading.Lock()
 
 
 CANDIDATE_LABELS = [
@@ -32,7 +50,8 @@ CANDIDATE_LABELS = [
 
 def extract_issues(text: str, candidate_labels=CANDIDATE_LABELS, threshold: float = 0.1) -> list:
     """
-    Extract issues from the feedback text using zero-shot classification.
+    Extract issues from the feedback text using zero-shot classification
+    (or the embedding fast path when ISSUE_CLASSIFIER is "embedding").
 
     Args:
         text (str): The input feedback text.
@@ -42,11 +61,123 @@ def extract_issues(text: str, candidate_labels=CANDIDATE_LABELS, threshold: floa
     Returns:
         list: A list of dictionaries, each containing an issue and its confidence score.
     """
-    result = classifier(text, candidate_labels)
-    
-    print("Raw classifier output:")
-    print(result)
-    
+    return extract_issues_batch([text], candidate_labels, threshold)[0]
+
+def extract_issues_batch(texts: list, candidate_labels=CANDIDATE_LABELS, threshold: float = 0.1, batch_size: int = 8) -> list:
+    """
+    Extract issues from several feedback texts in batched forward passes.
+
+    Args:
+        texts (list): The input feedback texts.
+        candidate_labels (list): A list of candidate issue labels.
+        threshold (float): Confidence threshold to consider a label valid.
+        batch_size (int): Number of (text, label) pairs per forward pass.
+
+    Returns:
+        list: One list of issue dictionaries per text, in input order.
+    """
+    if not texts:
+        return []
+    if ISSUE_CLASSIFIER == "embedding":
+        compute = lambda missing: extract_issues_embedding_batch(missing, candidate_labels, threshold, batch_size)
+    else:
+        compute = lambda missing: extract_issues_zero_shot_batch(missing, candidate_labels, threshold, batch_size)
+    return cached("issues", _cache_params(candidate_labels, threshold), list(texts), compute)
+
+def extract_issues_zero_shot_batch(texts: list, candidate_labels=CANDIDATE_LABELS, threshold: float = 0.1, batch_size: int = 8) -> list:
+    """Zero-shot NLI issue extraction for several texts (one encoder pass per text and label)."""
+    if not texts:
+        return []
+    results = classifier(list(texts), candidate_labels, batch_size=batch_size)
+    if isinstance(results, dict):
+        results = [results]
+    return [_issues_from_result(result, threshold) for result in results]
+
+def extract_issues_embedding_batch(texts: list, candidate_labels=CANDIDATE_LABELS, threshold: float = 0.1,
+                                   batch_size: int = 8, fallback: bool = True) -> list:
+    """
+    Issue extraction via embedding similarity: each text is encoded once and
+    scored against precomputed label embeddings with a single matrix multiply.
+    The similarities are turned into a distribution over labels with a
+    temperature softmax, so `threshold` means the same as for zero-shot.
+    Texts whose top label probability is below ISSUE_FAST_PATH_MIN_CONFIDENCE
+    are re-classified with the zero-shot model when `fallback` is True.
+    """
+    if not texts:
+        return []
+    labels = list(candidate_labels)
+    text_embeddings = encoder(list(texts), batch_size=batch_size, normalize_embeddings=True)
+    probabilities = _softmax(text_embeddings @ _get_label_embeddings(labels).T / ISSUE_EMBEDDING_TEMPERATURE)
+
+    issues_per_text = []
+    ambiguous = []
+    for index, row in enumerate(probabilities):
+        order = np.argsort(row)[::-1]
+        issues_per_text.append(_issues_from_result(
+            {"labels": [labels[i] for i in order], "scores": [float(row[i]) for i in order]}, threshold))
+        if fallback and row[order[0]] < ISSUE_FAST_PATH_MIN_CONFIDENCE:
+            ambiguous.append(index)
+
+    with _fast_path_stats_lock:
+        fast_path_stats["fast"] += len(texts) - len(ambiguous)
+        fast_path_stats["fallback"] += len(ambiguous)
+    if ambiguous:
+        fallback_issues = extract_issues_zero_shot_batch([texts[i] for i in ambiguous], labels, threshold, batch_size)
+        for index, issues in zip(ambiguous, fallback_issues):
+            issues_per_text[index] = issues
+    return issues_per_text
+
+def issue_scores_batch(texts: list, labels: list, batch_size: int = 8) -> list:
+    """
+    Score each text against each label independently, to tell which sentences
+    of a feedback an issue found in it came from. Zero-shot scores every label
+    on its own (multi-label entailment, one encoder pass per text and label);
+    the embedding classifier uses the cosine similarity. Scores are only
+    comparable between texts scored with the same classifier and labels.
+
+    Args:
+        texts (list): The texts to score.
+        labels (list): The issue labels, usually few: those already found.
+        batch_size (int): Inference batch size.
+
+    Returns:
+        list: One {label: score} dictionary per text.
+    """
+    labels = list(labels)
+    if not texts or not labels:
+        return [{} for _ in texts]
+
+    def compute(missing):
+        if ISSUE_CLASSIFIER == "embedding":
+            text_embeddings = encoder(list(missing), batch_size=batch_size, normalize_embeddings=True)
+            similarities = text_embeddings @ _get_label_embeddings(labels).T
+            return [{label: float(score) for label, score in zip(labels, row)} for row in similarities]
+        results = classifier(list(missing), labels, multi_label=True, batch_size=batch_size)
+        if isinstance(results, dict):
+            results = [results]
+        return [dict(zip(result["labels"], map(float, result["scores"]))) for result in results]
+
+    return cached("issue_scores", _cache_params(labels, None), list(texts), compute)
+
+def _cache_params(candidate_labels, threshold: float) -> list:
+    """Everything besides the text that determines the extracted issues."""
+    params = [ISSUE_CLASSIFIER, ISSUE_MODEL, ISSUE_MODEL_REVISION, *classifier.fingerprint, list(candidate_labels), threshold]
+    if ISSUE_CLASSIFIER == "embedding":
+        params += [ISSUE_EMBEDDING_MODEL, LABEL_TEMPLATE, ISSUE_EMBEDDING_TEMPERATURE, ISSUE_FAST_PATH_MIN_CONFIDENCE]
+    return params
+
+def _get_label_embeddings(labels: list):
+    key = tuple(labels)
+    if key not in _label_embeddings:
+        _label_embeddings[key] = encoder([LABEL_TEMPLATE.format(label) for label in labels], normalize_embeddings=True)
+    return _label_embeddings[key]
+
+def _softmax(logits):
+    logits = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(logits)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+def _issues_from_result(result: dict, threshold: float) -> list:
     issues = []
     for label, score in zip(result["labels"], result["scores"]):
         if score >= threshold:
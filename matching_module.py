@@ -2,19 +2,50 @@
 import numpy as np
 from datetime import datetime
 
-def get_tutors_for_subject(subject_name, cursor):
-    """
-    Retrieve tutors that teach the given subject.
-    Returns a list of dictionaries with tutor info and the subject price.
-    """
-    query = """
+# Queries of the matching flow; query_plans.py checks that they use indexes.
+TUTORS_FOR_SUBJECT_QUERY = """
     SELECT t.tutor_id, t.name, t.profile_pic_url, t.average_star_rating, ts.price, t.preferred_language, t.teaching_style
     FROM Tutors t
     JOIN TutorSubjects ts ON t.tutor_id = ts.tutor_id
     JOIN Subjects s ON ts.subject_id = s.subject_id
     WHERE s.subject_name = %s;
     """
-    cursor.execute(query, (subject_name,))
+SLOTS_ON_DATE_QUERY = """
+    SELECT COUNT(*) FROM TutorAvailableSlots
+    WHERE tutor_id = %s AND available_date = %s;
+    """
+PREREQUISITE_QUERY = "SELECT prerequisite_id FROM Subjects WHERE subject_name = %s"
+SUBJECT_NAME_QUERY = "SELECT subject_name FROM Subjects WHERE subject_id = %s"
+
+
+def to_paramstyle(sql, paramstyle):
+    """One of the queries above, with %s placeholders rewritten for the driver's paramstyle."""
+    return sql.replace("%s", "?") if paramstyle == "qmark" else sql
+
+
+class PortableCursor:
+    """
+    DB-API cursor wrapper that runs the %s-placeholder queries above on any
+    driver (mysql-connector uses %s, sqlite3 uses ?).
+    """
+
+    def __init__(self, cursor, paramstyle):
+        self.cursor = cursor
+        self.paramstyle = paramstyle
+
+    def execute(self, sql, params=()):
+        return self.cursor.execute(to_paramstyle(sql, self.paramstyle), params)
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+
+def get_tutors_for_subject(subject_name, cursor):
+    """
+    Retrieve tutors that teach the given subject.
+    Returns a list of dictionaries with tutor info and the subject price.
+    """
+    cursor.execute(TUTORS_FOR_SUBJECT_QUERY, (subject_name,))
     tutors = []
     for (tutor_id, name, profile_pic_url, avg_rating, price, language, teaching_style) in cursor.fetchall():
         tutors.append({
@@ -45,11 +76,7 @@ def check_availability(tutor_id, desired_date, cursor):
     elif hasattr(desired_date, 'strftime'):
         desired_date = desired_date.strftime('%Y-%m-%d')
     
-    query = """
-    SELECT COUNT(*) FROM TutorAvailableSlots
-    WHERE tutor_id = %s AND available_date = %s;
-    """
-    cursor.execute(query, (tutor_id, desired_date))
+    cursor.execute(SLOTS_ON_DATE_QUERY, (tutor_id, desired_date))
     count = cursor.fetchone()[0]
     return count > 0
 
@@ -100,11 +127,11 @@ def get_learning_path(subject_name, cursor):
     learning_path = []
     current_subject = subject_name
     while True:
-        cursor.execute("SELECT prerequisite_id FROM Subjects WHERE subject_name = %s", (current_subject,))
+        cursor.execute(PREREQUISITE_QUERY, (current_subject,))
         row = cursor.fetchone()
         if row and row[0]:
             prerequisite_id = row[0]
-            cursor.execute("SELECT subject_name FROM Subjects WHERE subject_id = %s", (prerequisite_id,))
+            cursor.execute(SUBJECT_NAME_QUERY, (prerequisite_id,))
             prereq_row = cursor.fetchone()
             if prereq_row:
                 prereq_subject = prereq_row[0]
@@ -0,0 +1,158 @@
+# migrations/0001_baseline.py
+"""Create the tables that existed before versioned migrations.
+
+The definitions below are frozen copies of the schema at that point, not
+the current models: the original application tables as they were first
+created, plus ExperimentArmStats and the feedback rollup tables, which
+startup create_all() added before migrations existed. Everything since
+(new columns, indexes and tables) is added by the migrations that follow,
+so a fresh install runs exactly the steps an existing database ran.
+Tables that already exist are left alone.
+"""
+from sqlalchemy import (Column, Date, DateTime, Enum, Float, ForeignKey, Integer, MetaData, Numeric, String, Table,
+                        Text, Time)
+
+LEARNING_STYLES = ('Read/Write', 'Auditory', 'Visual')
+
+baseline = MetaData()
+
+Table(
+    "Subjects", baseline,
+    Column("subject_id", Integer, primary_key=True, autoincrement=True),
+    Column("subject_name", String(255), nullable=False),
+    Column("prerequisite_id", Integer, ForeignKey("Subjects.subject_id"), nullable=True),
+)
+
+Table(
+    "Tutors", baseline,
+    Column("tutor_id", Integer, primary_key=True, autoincrement=True),
+    Column("name", String(255), nullable=False),
+    Column("profile_pic_url", String(255)),
+    Column("preferred_language", String(50), nullable=False),
+    Column("teaching_style", Enum(*LEARNING_STYLES), nullable=False),
+    Column("average_star_rating", Numeric(3, 2)),
+    Column("completed_sessions", Integer, nullable=False),
+    Column("email", String(255), nullable=False, unique=True),
+    Column("earnings", Numeric(10, 2)),
+    Column("qualifications", Text),
+    Column("expertise", Text),
+    Column("password", String(255), nullable=False),
+    Column("bio", Text),
+)
+
+Table(
+    "Students", baseline,
+    Column("student_id", Integer, primary_key=True, autoincrement=True),
+    Column("name", String(255), nullable=False),
+    Column("email", String(255), nullable=False, unique=True),
+    Column("profile_pic_url", String(255)),
+    Column("preferred_language", String(50), nullable=False),
+    Column("preferred_learning_style", Enum(*LEARNING_STYLES), nullable=False),
+    Column("budget", Numeric(10, 2)),
+    Column("about_me", Text),
+    Column("password", String(255), nullable=False),
+)
+
+Table(
+    "TutorSubjects", baseline,
+    Column("tutor_id", Integer, ForeignKey("Tutors.tutor_id"), primary_key=True),
+    Column("subject_id", Integer, ForeignKey("Subjects.subject_id"), primary_key=True),
+    Column("price", Numeric(10, 2), nullable=False),
+)
+
+Table(
+    "TutorAvailableSlots", baseline,
+    Column("slot_id", Integer, primary_key=True, autoincrement=True),
+    Column("tutor_id", Integer, ForeignKey("Tutors.tutor_id")),
+    Column("available_date", Date, nullable=False),
+    Column("start_time", Time, nullable=False),
+    Column("end_time", Time, nullable=False),
+)
+
+Table(
+    "TutorReviews", baseline,
+    Column("review_id", Integer, primary_key=True, autoincrement=True),
+    Column("tutor_id", Integer, ForeignKey("Tutors.tutor_id")),
+    Column("student_name", String(255)),
+    Column("rating", Numeric(3, 2)),
+    Column("comment", Text),
+)
+
+Table(
+    "Sessions", baseline,
+    Column("session_id", Integer, primary_key=True, autoincrement=True),
+    Column("student_id", Integer, ForeignKey("Students.student_id"), nullable=False),
+    Column("tutor_id", Integer, ForeignKey("Tutors.tutor_id"), nullable=False),
+    Column("subject_id", Integer, ForeignKey("Subjects.subject_id"), nullable=False),
+    Column("scheduled_time", DateTime, nullable=False),
+    Column("session_status", Enum('Scheduled', 'Completed', 'Canceled'), nullable=False),
+)
+
+Table(
+    "SessionFeedback", baseline,
+    Column("feedback_id", Integer, primary_key=True, autoincrement=True),
+    Column("session_id", Integer, ForeignKey("Sessions.session_id")),
+    Column("student_feedback", Text),
+    Column("star_rating", Integer, nullable=False),
+    Column("feedback_sentiment", String(20)),
+    Column("feedback_issues", Text),
+    Column("improvement_tip", Text),
+)
+
+Table(
+    "StudentSubjects", baseline,
+    Column("student_id", Integer, ForeignKey("Students.student_id"), primary_key=True),
+    Column("subject_id", Integer, ForeignKey("Subjects.subject_id"), primary_key=True),
+)
+
+Table(
+    "StudentAvailableSlots", baseline,
+    Column("slot_id", Integer, primary_key=True, autoincrement=True),
+    Column("student_id", Integer, ForeignKey("Students.student_id")),
+    Column("available_date", Date, nullable=False),
+    Column("start_time", Time, nullable=False),
+    Column("end_time", Time, nullable=False),
+)
+
+Table(
+    "StudentLearningPaths", baseline,
+    Column("learning_path_id", Integer, primary_key=True, autoincrement=True),
+    Column("student_id", Integer, ForeignKey("Students.student_id")),
+    Column("learning_item", String(255)),
+    Column("step_order", Integer),
+)
+
+Table(
+    "ExperimentArmStats", baseline,
+    Column("experiment_name", String(100), primary_key=True),
+    Column("arm_name", String(100), primary_key=True),
+    Column("exposures", Integer, nullable=False),
+    Column("bookings", Integer, nullable=False),
+    Column("rating_count", Integer, nullable=False),
+    Column("rating_sum", Float, nullable=False),
+    Column("rating_sq_sum", Float, nullable=False),
+)
+
+Table(
+    "TutorIssueRollups", baseline,
+    Column("tutor_id", Integer, ForeignKey("Tutors.tutor_id"), primary_key=True),
+    Column("bucket_start", Date, primary_key=True),
+    Column("issue", String(50), primary_key=True),
+    Column("issue_count", Integer, nullable=False),
+    Column("score_sum", Float, nullable=False),
+)
+
+Table(
+    "TutorSentimentRollups", baseline,
+    Column("tutor_id", Integer, ForeignKey("Tutors.tutor_id"), primary_key=True),
+    Column("bucket_start", Date, primary_key=True),
+    Column("feedback_count", Integer, nullable=False),
+    Column("positive_count", Integer, nullable=False),
+    Column("neutral_count", Integer, nullable=False),
+    Column("negative_count", Integer, nullable=False),
+    Column("rating_sum", Float, nullable=False),
+)
+
+
+def upgrade(conn):
+    baseline.create_all(conn, checkfirst=True)
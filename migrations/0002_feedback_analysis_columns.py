@@ -0,0 +1,19 @@
+# migrations/0002_feedback_analysis_columns.py
+"""Add the background-analysis, issue and review sentiment columns.
+
+Tables created before these columns were added to the models only gained
+them through drop_all/create_all or the ad-hoc ALTER in
+backfill-review-sentiment.
+"""
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from migrations import add_column
+
+
+def upgrade(conn):
+    add_column(conn, "SessionFeedback", Column("issue_sentences", Text))
+    add_column(conn, "SessionFeedback", Column("issue_scores", Text))
+    add_column(conn, "SessionFeedback", Column("analysis_status", String(20), nullable=False, server_default="done"))
+    add_column(conn, "SessionFeedback", Column("analysis_attempts", Integer, nullable=False, server_default="0"))
+    add_column(conn, "SessionFeedback", Column("analysis_started_at", DateTime))
+    add_column(conn, "TutorReviews", Column("sentiment", String(20)))
@@ -0,0 +1,16 @@
+# migrations/0003_hot_path_indexes.py
+"""Add composite indexes for the dashboard, booking, review and matching queries.
+
+`flask --app app check-query-plans` verifies that the hot queries use them.
+"""
+from migrations import create_index
+
+
+def upgrade(conn):
+    create_index(conn, "ix_sessions_tutor_status_time", "Sessions", ["tutor_id", "session_status", "scheduled_time"])
+    create_index(conn, "ix_sessions_student_status_time", "Sessions", ["student_id", "session_status", "scheduled_time"])
+    create_index(conn, "ix_tutor_slots_tutor_date_start", "TutorAvailableSlots", ["tutor_id", "available_date", "start_time"])
+    create_index(conn, "ix_session_feedback_session", "SessionFeedback", ["session_id"])
+    create_index(conn, "ix_tutor_subjects_subject", "TutorSubjects", ["subject_id"])
+    create_index(conn, "ix_subjects_subject_name", "Subjects", ["subject_name"])
+    create_index(conn, "ix_tutor_reviews_tutor", "TutorReviews", ["tutor_id"])
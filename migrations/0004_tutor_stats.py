@@ -0,0 +1,64 @@
+# migrations/0004_tutor_stats.py
+"""Create TutorStats and fill it from the existing feedback and reviews.
+
+The table and the query that fills it are frozen here as of this version;
+tutor_stats.rebuild_tutor_stats() computes the same rows from the current
+models.
+"""
+from sqlalchemy import Column, Float, ForeignKey, Integer, MetaData, Table, text
+
+schema = MetaData()
+Table("Tutors", schema, Column("tutor_id", Integer, primary_key=True))
+tutor_stats = Table(
+    "TutorStats", schema,
+    Column("tutor_id", Integer, ForeignKey("Tutors.tutor_id"), primary_key=True),
+    Column("review_count", Integer, nullable=False),
+    Column("rating_sum", Float, nullable=False),
+    Column("star_1_count", Integer, nullable=False),
+    Column("star_2_count", Integer, nullable=False),
+    Column("star_3_count", Integer, nullable=False),
+    Column("star_4_count", Integer, nullable=False),
+    Column("star_5_count", Integer, nullable=False),
+    Column("positive_count", Integer, nullable=False),
+    Column("neutral_count", Integer, nullable=False),
+    Column("negative_count", Integer, nullable=False),
+    Column("feedback_count", Integer, nullable=False),
+    Column("feedback_rating_sum", Float, nullable=False),
+)
+
+# Session feedback and tutor reviews as (tutor, rating, sentiment, is_feedback)
+# rows, summed per tutor. Missing or unknown sentiments count as neutral.
+FILL_TUTOR_STATS = text("""
+INSERT INTO TutorStats (tutor_id, review_count, rating_sum,
+                        star_1_count, star_2_count, star_3_count, star_4_count, star_5_count,
+                        positive_count, neutral_count, negative_count, feedback_count, feedback_rating_sum)
+SELECT tutor_id,
+       COUNT(*),
+       COALESCE(SUM(rating), 0),
+       SUM(CASE WHEN ROUND(rating) = 1 THEN 1 ELSE 0 END),
+       SUM(CASE WHEN ROUND(rating) = 2 THEN 1 ELSE 0 END),
+       SUM(CASE WHEN ROUND(rating) = 3 THEN 1 ELSE 0 END),
+       SUM(CASE WHEN ROUND(rating) = 4 THEN 1 ELSE 0 END),
+       SUM(CASE WHEN ROUND(rating) = 5 THEN 1 ELSE 0 END),
+       SUM(CASE WHEN sentiment = 'positive' THEN 1 ELSE 0 END),
+       SUM(CASE WHEN sentiment IN ('positive', 'negative') THEN 0 ELSE 1 END),
+       SUM(CASE WHEN sentiment = 'negative' THEN 1 ELSE 0 END),
+       SUM(is_feedback),
+       COALESCE(SUM(CASE WHEN is_feedback = 1 THEN rating ELSE 0 END), 0)
+FROM (
+    SELECT s.tutor_id AS tutor_id, f.star_rating AS rating,
+           LOWER(COALESCE(f.feedback_sentiment, 'neutral')) AS sentiment, 1 AS is_feedback
+    FROM SessionFeedback f JOIN Sessions s ON s.session_id = f.session_id
+    UNION ALL
+    SELECT r.tutor_id, r.rating, LOWER(COALESCE(r.sentiment, 'neutral')), 0
+    FROM TutorReviews r
+    WHERE r.tutor_id IS NOT NULL
+) reviews
+GROUP BY tutor_id
+""")
+
+
+def upgrade(conn):
+    tutor_stats.create(conn, checkfirst=True)
+    conn.execute(tutor_stats.delete())
+    conn.execute(FILL_TUTOR_STATS)
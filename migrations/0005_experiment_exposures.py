@@ -0,0 +1,28 @@
+# migrations/0005_experiment_exposures.py
+"""Count experiment exposures and conversions per student.
+
+Creates ExperimentExposures and adds ExperimentArmStats.booking_students.
+The exposures counter used to count page views, which cannot be turned into
+distinct students, so it is reset and counts students from now on. The
+table definitions are frozen here as of this version.
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, MetaData, String, Table, text
+
+from migrations import add_column
+
+schema = MetaData()
+Table("Students", schema, Column("student_id", Integer, primary_key=True))
+experiment_exposures = Table(
+    "ExperimentExposures", schema,
+    Column("experiment_name", String(100), primary_key=True),
+    Column("student_id", Integer, ForeignKey("Students.student_id"), primary_key=True),
+    Column("arm_name", String(100), nullable=False),
+    Column("exposed_at", DateTime, nullable=False),
+    Column("first_booked_at", DateTime),
+)
+
+
+def upgrade(conn):
+    experiment_exposures.create(conn, checkfirst=True)
+    add_column(conn, "ExperimentArmStats", Column("booking_students", Integer, nullable=False, server_default="0"))
+    conn.execute(text("UPDATE ExperimentArmStats SET exposures = 0, booking_students = 0"))
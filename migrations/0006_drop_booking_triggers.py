@@ -0,0 +1,16 @@
+# migrations/0006_drop_booking_triggers.py
+"""Drop the MySQL booking triggers replaced by booking_rules.py.
+
+Databases created by the old startup seeding have before_session_insert and
+after_session_insert on Sessions. booking_rules.py now checks and removes
+the booked slots itself, so the triggers would check every booking twice
+and delete its slots twice. Other databases never had them.
+"""
+from sqlalchemy import text
+
+
+def upgrade(conn):
+    if conn.dialect.name != "mysql":
+        return
+    conn.execute(text("DROP TRIGGER IF EXISTS before_session_insert"))
+    conn.execute(text("DROP TRIGGER IF EXISTS after_session_insert"))
@@ -0,0 +1,109 @@
+# migrations/__init__.py
+"""
+Versioned schema migrations.
+
+Each migration is a module in this package named NNNN_description.py with a
+docstring describing it and an upgrade(conn) function that receives an open
+SQLAlchemy connection. Applied versions are recorded in the schema_migrations
+table; `flask --app app migrate` applies the pending ones in version order,
+each in its own transaction.
+
+MySQL commits DDL implicitly, so a migration that fails halfway cannot be
+rolled back. Migrations therefore only add what is missing (add_column and
+create_index below check first) and can simply be re-run after a failure.
+"""
+import importlib
+import os
+import re
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, MetaData, String, Table, inspect, select, text
+from sqlalchemy.schema import CreateColumn
+
+MIGRATION_PATTERN = re.compile(r"^(\d{4})_(\w+)\.py$")
+
+schema_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations", schema_metadata,
+    Column("version", String(4), primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def available_migrations() -> list:
+    """
+    The migration modules in this package.
+
+    Returns:
+        list: (version, module) tuples in version order.
+    """
+    migrations = []
+    for filename in sorted(os.listdir(os.path.dirname(__file__))):
+        match = MIGRATION_PATTERN.match(filename)
+        if match:
+            migrations.append((match.group(1), importlib.import_module(f"{__name__}.{filename[:-3]}")))
+    return migrations
+
+
+def applied_versions(conn) -> set:
+    """Versions recorded in schema_migrations (empty if the table does not exist yet)."""
+    if not inspect(conn).has_table(schema_migrations.name):
+        return set()
+    return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def pending_migrations(engine) -> list:
+    """(version, module) tuples of the migrations not applied to the database yet."""
+    with engine.connect() as conn:
+        applied = applied_versions(conn)
+    return [(version, module) for version, module in available_migrations() if version not in applied]
+
+
+def describe(module) -> str:
+    return (module.__doc__ or "").strip().splitlines()[0] if module.__doc__ else module.__name__
+
+
+def upgrade(engine, on_apply=None) -> list:
+    """
+    Apply the pending migrations in version order.
+
+    Args:
+        engine: The SQLAlchemy engine of the database to migrate.
+        on_apply (callable): Called with (version, description) before each migration runs.
+
+    Returns:
+        list: The versions that were applied.
+    """
+    schema_metadata.create_all(engine)
+    applied = []
+    for version, module in pending_migrations(engine):
+        description = describe(module)
+        if on_apply:
+            on_apply(version, description)
+        with engine.begin() as conn:
+            module.upgrade(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=version, description=description[:255], applied_at=datetime.now()
+            ))
+        applied.append(version)
+    return applied
+
+
+def add_column(conn, table_name: str, column: Column):
+    """ALTER TABLE ... ADD COLUMN, unless the table already has the column."""
+    inspector = inspect(conn)
+    if column.name in {existing["name"] for existing in inspector.get_columns(table_name)}:
+        return
+    Table(table_name, MetaData(), column)
+    preparer = conn.dialect.identifier_preparer
+    conn.execute(text(f"ALTER TABLE {preparer.quote(table_name)} "
+                      f"ADD COLUMN {CreateColumn(column).compile(dialect=conn.dialect)}"))
+
+
+def create_index(conn, name: str, table_name: str, columns: list, unique: bool = False):
+    """CREATE INDEX on the existing table, unless an index of that name exists."""
+    if name in {index["name"] for index in inspect(conn).get_indexes(table_name)}:
+        return
+    table = Table(table_name, MetaData(), autoload_with=conn)
+    Index(name, *(table.c[column] for column in columns), unique=unique).create(conn)
@@ -0,0 +1,102 @@
+# nlp_backends.py
+"""
+Inference backends for the transformer pipelines.
+
+"pytorch" (the default) builds a regular transformers pipeline.
+"onnx" runs the same model exported to ONNX, with dynamic int8
+quantization, on ONNX Runtime. Exported models are stored under
+ONNX_MODEL_DIR, one file per quantization (model.onnx unquantized,
+model_<quantization>.onnx otherwise), and the file matching
+ONNX_QUANTIZATION is exported on first use if missing; export it ahead of
+deployment with:
+
+    python nlp_backends.py export
+"""
+import argparse
+import os
+import re
+
+from config import NLP_BACKEND, ONNX_MODEL_DIR, ONNX_QUANTIZATION
+
+BACKENDS = ("pytorch", "onnx")
+
+
+def onnx_model_path(model: str, revision: str = None) -> str:
+    name = re.sub(r"[^\w.-]+", "--", f"{model}@{revision or 'main'}")
+    return os.path.join(ONNX_MODEL_DIR, name)
+
+
+def onnx_file_name(quantization: str) -> str:
+    """File of the exported model with this quantization, inside its onnx_model_path() directory."""
+    return "model.onnx" if quantization == "none" else f"model_{quantization}.onnx"
+
+
+def export_onnx_model(model: str, revision: str = None, quantization: str = ONNX_QUANTIZATION) -> str:
+    """
+    Export a sequence-classification model to ONNX, int8-quantized unless
+    quantization is "none", and return its directory. The model file is
+    onnx_file_name(quantization), which load_pipeline() reads with the same
+    quantization setting.
+    """
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+
+    path = onnx_model_path(model, revision)
+    ort_model = ORTModelForSequenceClassification.from_pretrained(model, revision=revision, export=True)
+    ort_model.save_pretrained(path)
+    AutoTokenizer.from_pretrained(model, revision=revision).save_pretrained(path)
+    if quantization != "none":
+        quantization_config = getattr(AutoQuantizationConfig, quantization)(is_static=False, per_channel=False)
+        ORTQuantizer.from_pretrained(ort_model).quantize(save_dir=path, quantization_config=quantization_config,
+                                                         file_suffix=quantization)
+    return path
+
+
+def backend_fingerprint(model: str, revision: str = None, backend: str = NLP_BACKEND,
+                        quantization: str = ONNX_QUANTIZATION) -> list:
+    """Everything about the backend that changes a pipeline's outputs, for result cache keys."""
+    if backend == "onnx":
+        return [backend, quantization, os.path.join(onnx_model_path(model, revision), onnx_file_name(quantization))]
+    return [backend]
+
+
+def load_pipeline(task: str, model: str, revision: str = None, backend: str = NLP_BACKEND,
+                  quantization: str = ONNX_QUANTIZATION):
+    """Build a transformers pipeline for `task`/`model` on the requested backend."""
+    from transformers import pipeline
+
+    if backend == "pytorch":
+        return pipeline(task, model=model, revision=revision)
+    if backend == "onnx":
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+        from transformers import AutoTokenizer
+
+        path = onnx_model_path(model, revision)
+        file_name = onnx_file_name(quantization)
+        if not os.path.exists(os.path.join(path, file_name)):
+            export_onnx_model(model, revision, quantization)
+        ort_model = ORTModelForSequenceClassification.from_pretrained(path, file_name=file_name)
+        return pipeline(task, model=ort_model, tokenizer=AutoTokenizer.from_pretrained(path))
+    raise ValueError(f"Unknown NLP backend '{backend}', expected one of {BACKENDS}.")
+
+
+def main():
+    from sentiment_analysis import sentiment_pipeline
+    from issue_extraction import classifier
+
+    parser = argparse.ArgumentParser(description="Export the NLP models for the ONNX Runtime backend.")
+    parser.add_argument("command", choices=["export"])
+    parser.add_argument("--quantization", default=ONNX_QUANTIZATION,
+                        help="avx2, avx512, avx512_vnni, arm64 or none (default: %(default)s)")
+    args = parser.parse_args()
+    for handle in (sentiment_pipeline, classifier):
+        path = export_onnx_model(handle.model, handle.revision, args.quantization)
+        print(f"Exported {handle.model} to {os.path.join(path, onnx_file_name(args.quantization))}")
+    if args.quantization != ONNX_QUANTIZATION:
+        print(f"The app loads the {ONNX_QUANTIZATION} export; run it with ONNX_QUANTIZATION={args.quantization} "
+              f"to use this one.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# nlp_cache.py
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+from config import NLP_CACHE_ENABLED, NLP_CACHE_PATH, NLP_CACHE_MEMORY_ENTRIES, NLP_CACHE_MAX_DISK_ENTRIES
+
+
+def normalize_text(text: str) -> str:
+    """Collapse trivially different copies of a text (case, spacing, repeated punctuation)."""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"([^\w\s])\1+", r"\1", text)
+    return text.strip()
+
+
+def make_key(namespace: str, text: str, params) -> str:
+    """
+    Cache key for a model result: hash of the normalized text plus everything
+    that changes the output (model id, revision, threshold, labels...).
+    """
+    payload = json.dumps([namespace, normalize_text(text), params], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    A bounded in-memory LRU in front of a SQLite table that every worker
+    process on the node shares. Values must be JSON-serializable.
+    """
+
+    def __init__(self, path: str, memory_entries: int = 10000, max_disk_entries: int = 1000000):
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS results_created_at ON results (created_at)")
+            self._local.conn = conn
+        return conn
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def get_many(self, keys: list) -> dict:
+        found = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+                else:
+                    missing.append(key)
+            self.hits_memory += len(found)
+        if missing:
+            try:
+                placeholders = ",".join("?" * len(missing))
+                rows = self._connection().execute(
+                    f"SELECT key, value FROM results WHERE key IN ({placeholders})", missing).fetchall()
+            except sqlite3.Error as e:
+                logging.warning(f"NLP cache read failed: {e}")
+                rows = []
+            for key, value in rows:
+                found[key] = json.loads(value)
+                self._remember(key, found[key])
+            self.hits_disk += len(rows)
+            self.misses += len(missing) - len(rows)
+        return found
+
+    def set_many(self, items: dict):
+        for key, value in items.items():
+            self._remember(key, value)
+        now = time.time()
+        try:
+            conn = self._connection()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO results (key, value, created_at) VALUES (?, ?, ?)",
+                                 [(key, json.dumps(value), now) for key, value in items.items()])
+            self._writes += len(items)
+            if self._writes >= 1000:
+                self._writes = 0
+                self.prune()
+        except sqlite3.Error as e:
+            logging.warning(f"NLP cache write failed: {e}")
+
+    def prune(self):
+        """Drop the oldest on-disk entries beyond max_disk_entries (e.g. results of retired models)."""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                         (self.max_disk_entries,))
+
+    def get_or_compute(self, keys: list, items: list, compute_batch) -> list:
+        """
+        Return one result per item, computing only the items whose key is not cached.
+        `compute_batch` takes the list of missing items and returns their results in order.
+        """
+        found = self.get_many(keys)
+        first_index = {}
+        for i, key in enumerate(keys):
+            if key not in found:
+                first_index.setdefault(key, i)
+        missing = list(first_index.values())
+        if missing:
+            computed = compute_batch([items[i] for i in missing])
+            new = {}
+            for i, result in zip(missing, computed):
+                found[keys[i]] = result
+                new[keys[i]] = result
+            self.set_many(new)
+        return [found[key] for key in keys]
+
+    def stats(self) -> dict:
+        return {
+            "memory_entries": len(self._memory),
+            "hits_memory": self.hits_memory,
+            "hits_disk": self.hits_disk,
+            "misses": self.misses
+        }
+
+
+result_cache = ResultCache(NLP_CACHE_PATH, NLP_CACHE_MEMORY_ENTRIES, NLP_CACHE_MAX_DISK_ENTRIES) if NLP_CACHE_ENABLED else None
+
+
+def cached(namespace: str, params, texts: list, compute_batch) -> list:
+    """Look texts up in the shared cache under `namespace`/`params`, computing the misses."""
+    if result_cache is None:
+        return compute_batch(texts)
+    keys = [make_key(namespace, text, params) for text in texts]
+    return result_cache.get_or_compute(keys, texts, compute_batch)
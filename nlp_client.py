@@ -0,0 +1,82 @@
+# nlp_client.py
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+
+from config import NLP_SERVER_SOCKET, NLP_SERVER_AUTHKEY, NLP_SERVER_TIMEOUT_SECONDS
+
+
+class NLPServerError(RuntimeError):
+    pass
+
+
+class NLPClient:
+    """
+    Client for nlp_server. Mirrors analyze_sentiment/extract_issues; each
+    thread keeps its own connection and reconnects once if it was dropped.
+    """
+
+    def __init__(self, address: str = NLP_SERVER_SOCKET, authkey: bytes = NLP_SERVER_AUTHKEY,
+                 timeout: float = NLP_SERVER_TIMEOUT_SECONDS):
+        self.address = address
+        self.authkey = authkey
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if not self.authkey:
+                raise NLPServerError("NLP_SERVER_AUTHKEY is not set")
+            try:
+                conn = Client(self.address, family="AF_UNIX", authkey=self.authkey)
+            except AuthenticationError:
+                raise NLPServerError(f"NLP server at {self.address} rejected NLP_SERVER_AUTHKEY")
+            self._local.conn = conn
+        return conn
+
+    def _reset(self):
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            conn.close()
+
+    def _call(self, request: dict):
+        for attempt in range(2):
+            try:
+                conn = self._connection()
+                conn.send(request)
+                if not conn.poll(self.timeout):
+                    self._reset()
+                    raise NLPServerError(f"NLP server did not answer within {self.timeout}s")
+                reply = conn.recv()
+                break
+            except (EOFError, ConnectionError, OSError) as e:
+                self._reset()
+                if attempt == 1:
+                    raise NLPServerError(f"NLP server at {self.address} unavailable: {e}")
+        if not reply["ok"]:
+            raise NLPServerError(reply["error"])
+        return reply["result"]
+
+    def health(self) -> dict:
+        return self._call({"op": "health"})
+
+    def analyze_sentiment(self, text: str) -> dict:
+        return self.analyze_sentiments([text])[0]
+
+    def analyze_sentiments(self, texts: list) -> list:
+        return self._call({"op": "sentiment", "texts": list(texts)})
+
+    def extract_issues(self, text: str, candidate_labels=None, threshold: float = 0.1) -> list:
+        return self.extract_issues_batch([text], candidate_labels, threshold)[0]
+
+    def extract_issues_batch(self, texts: list, candidate_labels=None, threshold: float = 0.1) -> list:
+        return self._call({"op": "issues", "texts": list(texts),
+                           "candidate_labels": candidate_labels, "threshold": threshold})
+
+    def analyze_feedback_batch(self, texts: list) -> list:
+        return self._call({"op": "analyze", "texts": list(texts)})
+
+
+nlp_client = NLPClient()
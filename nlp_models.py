@@ -0,0 +1,94 @@
+# nlp_models.py
+import logging
+import threading
+import time
+
+from config import NLP_BACKEND
+
+_registry = []
+
+
+class LazyPipeline:
+    """
+    A transformers pipeline that is only built on first use (or by warm_up).
+    Importing this module, or a module that declares a LazyPipeline, does not
+    import transformers or load any model weights. `backend` selects the
+    inference backend (see nlp_backends).
+    """
+
+    def __init__(self, task: str, model: str, revision: str = None, register: bool = True, backend: str = NLP_BACKEND):
+        self.task = task
+        self.model = model
+        self.revision = revision
+        self.backend = backend
+        self.load_seconds = None
+        self._pipeline = None
+        self._lock = threading.Lock()
+        if register:
+            _registry.append(self)
+
+    @property
+    def ready(self) -> bool:
+        return self._pipeline is not None
+
+    def get(self):
+        if self._pipeline is None:
+            with self._lock:
+                if self._pipeline is None:
+                    start = time.perf_counter()
+                    self._pipeline = self._load()
+                    self.load_seconds = time.perf_counter() - start
+                    logging.info(f"Loaded {self.task} pipeline ({self.model}, {self.backend}) in {self.load_seconds:.2f}s")
+        return self._pipeline
+
+    def __call__(self, *args, **kwargs):
+        return self.get()(*args, **kwargs)
+
+    @property
+    def fingerprint(self) -> list:
+        """The backend settings and model file this pipeline's results depend on (see nlp_backends)."""
+        from nlp_backends import backend_fingerprint
+        return backend_fingerprint(self.model, self.revision, self.backend)
+
+    def _load(self):
+        from nlp_backends import load_pipeline
+        return load_pipeline(self.task, self.model, self.revision, self.backend)
+
+
+class LazySentenceEncoder(LazyPipeline):
+    """A sentence-transformers encoder, loaded on first use; call it like SentenceTransformer.encode."""
+
+    def __init__(self, model: str, register: bool = True):
+        super().__init__("sentence-embedding", model, register=register, backend="pytorch")
+
+    def __call__(self, *args, **kwargs):
+        return self.get().encode(*args, **kwargs)
+
+    def _load(self):
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(self.model, device="cpu")
+
+
+def warm_up():
+    """Load every registered pipeline now."""
+    for model in _registry:
+        model.get()
+
+
+def start_warm_up():
+    """Load the pipelines on a background thread so startup is not blocked."""
+    thread = threading.Thread(target=warm_up, name="nlp-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def is_ready() -> bool:
+    return all(model.ready for model in _registry)
+
+
+def status() -> list:
+    return [
+        {"task": model.task, "model": model.model, "revision": model.revision, "backend": model.backend,
+         "ready": model.ready, "load_seconds": model.load_seconds}
+        for model in _registry
+    ]
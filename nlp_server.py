@@ -0,0 +1,144 @@
+# nlp_server.py
+"""
+Shared NLP model server.
+
+One process per node owns the sentiment and issue-extraction models; web
+workers talk to it over a Unix socket through nlp_client instead of each
+loading their own copy. Requests from all connections are micro-batched.
+
+Usage:
+    NLP_SERVER_SOCKET=instance/nlp.sock python nlp_server.py
+
+Protocol: each request is a dict {"op": ..., ...} sent with
+multiprocessing.connection; the reply is {"ok": True, "result": ...} or
+{"ok": False, "error": "..."}. Ops: "health", "sentiment", "issues", "analyze".
+
+Messages are pickled, so a connected client can run code in the server.
+Clients must authenticate with NLP_SERVER_AUTHKEY (required), and the socket
+is created readable and writable by its owner and group only.
+"""
+import argparse
+import logging
+import os
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener
+
+import nlp_models
+from config import NLP_SERVER_SOCKET, NLP_SERVER_AUTHKEY, FEEDBACK_BATCH_SIZE, FEEDBACK_BATCH_WAIT_MS
+from sentiment_analysis import analyze_sentiments, cascade_metrics
+from issue_extraction import extract_issues_batch, CANDIDATE_LABELS
+from feedback_analysis import analyze_feedback_batch_local
+from inference_queue import InferenceQueue
+
+
+class NLPServer:
+    def __init__(self, address: str, authkey: bytes = NLP_SERVER_AUTHKEY,
+                 max_batch_size: int = FEEDBACK_BATCH_SIZE, max_wait_ms: float = FEEDBACK_BATCH_WAIT_MS):
+        if not authkey:
+            raise ValueError("NLP_SERVER_AUTHKEY must be set to start the NLP server")
+        self.address = address
+        self.authkey = authkey
+        self.started_at = time.time()
+        self.requests = 0
+        self.queues = {
+            "sentiment": InferenceQueue(analyze_sentiments, max_batch_size, max_wait_ms, name="server-sentiment"),
+            "issues": InferenceQueue(extract_issues_batch, max_batch_size, max_wait_ms, name="server-issues"),
+            "analyze": InferenceQueue(analyze_feedback_batch_local, max_batch_size, max_wait_ms, name="server-analyze"),
+        }
+        self._listener = None
+
+    def health(self) -> dict:
+        return {
+            "status": "ok" if nlp_models.is_ready() else "loading",
+            "ready": nlp_models.is_ready(),
+            "pid": os.getpid(),
+            "uptime_seconds": time.time() - self.started_at,
+            "requests": self.requests,
+            "models": nlp_models.status(),
+            "queues": {name: q.stats() for name, q in self.queues.items()},
+            "sentiment_cascade": cascade_metrics()
+        }
+
+    def handle(self, request: dict):
+        op = request.get("op")
+        if op == "health":
+            return self.health()
+        texts = list(request.get("texts", []))
+        if op == "issues":
+            labels = request.get("candidate_labels") or CANDIDATE_LABELS
+            threshold = request.get("threshold", 0.1)
+            if list(labels) != CANDIDATE_LABELS or threshold != 0.1:
+                return extract_issues_batch(texts, labels, threshold)
+        if op not in self.queues:
+            raise ValueError(f"Unknown op '{op}'")
+        futures = [self.queues[op].submit(text) for text in texts]
+        return [future.result() for future in futures]
+
+    def _serve_connection(self, conn):
+        with conn:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                self.requests += 1
+                try:
+                    reply = {"ok": True, "result": self.handle(request)}
+                except Exception as e:
+                    logging.exception("NLP server request failed")
+                    reply = {"ok": False, "error": str(e)}
+                try:
+                    conn.send(reply)
+                except (EOFError, OSError):
+                    return
+
+    def serve_forever(self, warm_up: bool = True):
+        if os.path.exists(self.address):
+            os.unlink(self.address)
+        directory = os.path.dirname(self.address)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Bind with the final permissions so that no one else can connect in between.
+        umask = os.umask(0o117)
+        try:
+            self._listener = Listener(self.address, family="AF_UNIX", authkey=self.authkey)
+        finally:
+            os.umask(umask)
+        if warm_up:
+            nlp_models.start_warm_up()
+        logging.info(f"NLP server listening on {self.address}")
+        try:
+            while True:
+                try:
+                    conn = self._listener.accept()
+                except AuthenticationError:
+                    logging.warning("NLP server rejected a client with a wrong authkey")
+                    continue
+                except OSError:
+                    # Closed listener (shutdown) or a client dropping during the handshake.
+                    if self._listener is None:
+                        return
+                    continue
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+        finally:
+            self.close()
+
+    def close(self):
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the NLP models over a Unix socket.")
+    parser.add_argument("--socket", default=NLP_SERVER_SOCKET or "instance/nlp.sock")
+    parser.add_argument("--no-warm-up", action="store_true", help="load the models on the first request instead")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    NLPServer(args.socket).serve_forever(warm_up=not args.no_warm_up)
+
+
+if __name__ == "__main__":
+    main()
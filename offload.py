@@ -0,0 +1,88 @@
+# offload.py
+"""
+Run CPU-bound calls without stalling the eventlet hub.
+
+Socket.IO runs every request and event as a green thread on one OS thread, so
+a transformer forward pass or a PBKDF2/scrypt hash made from a view blocks all
+signaling and whiteboard traffic until it returns. `offload` moves such calls
+onto eventlet's pool of real threads; the calling green thread yields until
+the result is ready. Each kind of work has its own concurrency limit so a
+burst of logins cannot take every thread away from inference or vice versa.
+
+Called from a plain OS thread (e.g. the APScheduler worker) or without
+eventlet, the function simply runs inline.
+"""
+import time
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from config import OFFLOAD_THREADS, INFERENCE_MAX_CONCURRENCY, PASSWORD_HASH_MAX_CONCURRENCY
+
+try:
+    from eventlet import tpool
+    from eventlet.semaphore import Semaphore
+    from greenlet import getcurrent
+except ImportError:
+    tpool = None
+
+LIMITS = {
+    "inference": INFERENCE_MAX_CONCURRENCY,
+    "password": PASSWORD_HASH_MAX_CONCURRENCY,
+}
+
+if tpool is not None:
+    # Only takes effect if the pool has not been started yet.
+    tpool.set_num_threads(OFFLOAD_THREADS)
+    _semaphores = {kind: Semaphore(limit) for kind, limit in LIMITS.items()}
+
+_stats = {kind: {"calls": 0, "running": 0, "waiting": 0, "total_seconds": 0.0} for kind in LIMITS}
+
+
+def on_green_thread() -> bool:
+    """True when running in a green thread scheduled by the eventlet hub."""
+    return tpool is not None and getcurrent().parent is not None
+
+
+def offload(kind: str, func, *args, **kwargs):
+    """
+    Run a CPU-bound call on a real thread, at most LIMITS[kind] at a time.
+
+    Args:
+        kind (str): "inference" or "password".
+        func: The callable to run; remaining arguments are passed to it.
+
+    Returns:
+        Whatever func returns; exceptions are re-raised in the caller.
+    """
+    stats = _stats[kind]
+    stats["calls"] += 1
+    if not on_green_thread():
+        return func(*args, **kwargs)
+    stats["waiting"] += 1
+    with _semaphores[kind]:
+        stats["waiting"] -= 1
+        stats["running"] += 1
+        start = time.perf_counter()
+        try:
+            return tpool.execute(func, *args, **kwargs)
+        finally:
+            stats["running"] -= 1
+            stats["total_seconds"] += time.perf_counter() - start
+
+
+def hash_password(password: str) -> str:
+    """generate_password_hash, off the hub."""
+    return offload("password", generate_password_hash, password)
+
+
+def verify_password(pwhash: str, password: str) -> bool:
+    """check_password_hash, off the hub."""
+    return offload("password", check_password_hash, pwhash, password)
+
+
+def stats() -> dict:
+    return {
+        "threads": OFFLOAD_THREADS,
+        "limits": dict(LIMITS),
+        "kinds": {kind: dict(values) for kind, values in _stats.items()}
+    }
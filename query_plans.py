@@ -0,0 +1,177 @@
+# query_plans.py
+"""
+EXPLAIN checks for the hot queries of app.py and matching_module.py.
+
+Each entry of HOT_QUERIES reproduces one query shape (the ORM queries as
+selects, the matching queries as their exact SQL) and names the tables that
+must be reached through an index rather than a full scan. check_query_plans()
+EXPLAINs them against the current database; `flask --app app check-query-plans`
+runs it and fails when a query scans.
+
+MySQL plans are read from EXPLAIN (access type and chosen key), SQLite plans
+from EXPLAIN QUERY PLAN (SEARCH ... USING INDEX / PRIMARY KEY).
+"""
+import re
+from datetime import date, datetime, time
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from config import db
+from models import Session, TutorAvailableSlot
+import matching_module
+from review_feed import review_feed_query
+
+# MySQL access types that read a whole table or index.
+FULL_SCAN_TYPES = {"ALL", "index"}
+
+SQLITE_PLAN_PATTERN = re.compile(r"^(SCAN|SEARCH)(?: TABLE)? (\w+)(?: AS (\w+))?")
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (QUERY PLAN on SQLite) of a select, executable like the select itself."""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    prefix = "EXPLAIN QUERY PLAN " if compiler.dialect.name == "sqlite" else "EXPLAIN "
+    return prefix + compiler.process(element.statement, **kw)
+
+
+def _upcoming_sessions(column):
+    return (db.select(Session)
+            .where(column == 1, Session.session_status == 'Scheduled', Session.scheduled_time > datetime.now())
+            .order_by(Session.scheduled_time))
+
+
+HOT_QUERIES = [
+    {
+        "name": "student upcoming sessions",
+        "source": "app.py: dashboard_student, upcoming_sessions_dates, get_user_booked_dates",
+        "statement": lambda: _upcoming_sessions(Session.student_id),
+        "tables": ["Sessions"],
+    },
+    {
+        "name": "tutor upcoming sessions",
+        "source": "app.py: dashboard_tutor, session_feedback, get_user_booked_dates",
+        "statement": lambda: _upcoming_sessions(Session.tutor_id),
+        "tables": ["Sessions"],
+    },
+    {
+        "name": "student sessions",
+        "source": "app.py: get_sessions_for_student, api_student_sessions",
+        "statement": lambda: db.select(Session).where(Session.student_id == 1).order_by(Session.scheduled_time),
+        "tables": ["Sessions"],
+    },
+    {
+        "name": "tutor sessions",
+        "source": "app.py: get_sessions_for_tutor",
+        "statement": lambda: db.select(Session).where(Session.tutor_id == 1).order_by(Session.scheduled_time),
+        "tables": ["Sessions"],
+    },
+    {
+        "name": "tutor review feed",
+        "source": "app.py: dashboard_tutor, session_feedback, tutor_feedback; tutor_profile_cache.py (review_feed.py)",
+        "statement": lambda: review_feed_query(1, 21, (100, "session")),
+        "tables": ["Sessions", "SessionFeedback", "TutorReviews"],
+    },
+    {
+        "name": "booked slot lookup",
+        "source": "app.py: book_session",
+        "statement": lambda: (db.select(TutorAvailableSlot)
+                              .where(TutorAvailableSlot.tutor_id == 1,
+                                     TutorAvailableSlot.available_date == date.today(),
+                                     TutorAvailableSlot.start_time == time(10, 0),
+                                     TutorAvailableSlot.end_time == time(11, 0))
+                              .limit(1)),
+        "tables": ["TutorAvailableSlots"],
+    },
+    {
+        "name": "tutor slots",
+        "source": "app.py: api_booking_page, available_slots",
+        "statement": lambda: db.select(TutorAvailableSlot).where(TutorAvailableSlot.tutor_id == 1),
+        "tables": ["TutorAvailableSlots"],
+    },
+    {
+        "name": "tutors for subject",
+        "source": "matching_module.py: get_tutors_for_subject",
+        "sql": (matching_module.TUTORS_FOR_SUBJECT_QUERY, ("Mathematics",)),
+        "tables": ["s", "ts", "t"],
+    },
+    {
+        "name": "tutor slots on date",
+        "source": "matching_module.py: check_availability",
+        "sql": (matching_module.SLOTS_ON_DATE_QUERY, (1, date.today().isoformat())),
+        "tables": ["TutorAvailableSlots"],
+    },
+    {
+        "name": "subject prerequisite",
+        "source": "matching_module.py: get_learning_path",
+        "sql": (matching_module.PREREQUISITE_QUERY, ("Mathematics",)),
+        "tables": ["Subjects"],
+    },
+    {
+        "name": "subject name",
+        "source": "matching_module.py: get_learning_path",
+        "sql": (matching_module.SUBJECT_NAME_QUERY, (1,)),
+        "tables": ["Subjects"],
+    },
+]
+
+
+def _explain(conn, query) -> list:
+    if "statement" in query:
+        return [dict(row) for row in conn.execute(Explain(query["statement"]())).mappings()]
+    sql, params = query["sql"]
+    sql = matching_module.to_paramstyle(sql.strip().rstrip(";"), conn.dialect.paramstyle)
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    return [dict(row) for row in conn.exec_driver_sql(prefix + sql, params).mappings()]
+
+
+def table_access(dialect_name: str, plan: list) -> dict:
+    """
+    How each table of a plan is read.
+
+    Returns:
+        dict: Table name or alias -> (uses_index, description).
+    """
+    access = {}
+    for row in plan:
+        if dialect_name == "sqlite":
+            detail = row["detail"]
+            match = SQLITE_PLAN_PATTERN.match(detail)
+            if not match:
+                continue
+            uses_index = match.group(1) == "SEARCH" and " USING " in detail
+            for name in filter(None, match.group(2, 3)):
+                access[name] = (uses_index, detail)
+        else:
+            uses_index = row.get("key") is not None and row.get("type") not in FULL_SCAN_TYPES
+            access[row["table"]] = (uses_index, f"type={row.get('type')} key={row.get('key')}")
+    return access
+
+
+def check_query_plans(engine) -> list:
+    """
+    EXPLAIN every hot query.
+
+    Returns:
+        list: One dictionary per query with 'name', 'source', 'ok' and 'tables'
+              (table -> description of how it is read, or 'not in plan').
+    """
+    results = []
+    with engine.connect() as conn:
+        for query in HOT_QUERIES:
+            access = table_access(conn.dialect.name, _explain(conn, query))
+            tables = {}
+            ok = True
+            for table in query["tables"]:
+                uses_index, description = access.get(table, (False, "not in plan"))
+                ok = ok and uses_index
+                tables[table] = description
+            results.append({"name": query["name"], "source": query["source"], "ok": ok, "tables": tables})
+    return results
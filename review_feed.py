@@ -0,0 +1,110 @@
+# review_feed.py
+"""
+One newest-first feed over a tutor's session feedback and tutor reviews.
+
+Both kinds of review are projected onto the same columns and combined with
+UNION ALL, sorted by (review_id, source) descending: the id ordering the
+pages have always used, with the source breaking ties between a feedback
+and a review that share an id. Each branch is limited before the union and
+the union again after it, so a page costs one bounded query however many
+reviews the tutor has. Pages continue from a cursor (the last row's sort
+key) instead of an OFFSET.
+"""
+from config import db
+from models import SessionFeedback, Session, Student, TutorReview
+
+SOURCE_SESSION = "session"
+SOURCE_TUTOR = "tutor"
+
+
+def encode_cursor(row) -> str:
+    return f"{row.review_id}-{row.source}"
+
+
+def decode_cursor(cursor):
+    """(review_id, source) from encode_cursor's output, or None if it is malformed."""
+    review_id, _, source = (cursor or "").partition("-")
+    if not review_id.isdigit() or source not in (SOURCE_SESSION, SOURCE_TUTOR):
+        return None
+    return int(review_id), source
+
+
+def _after_cursor(id_column, source, before):
+    """Rows of this branch that sort after the cursor."""
+    if before is None:
+        return db.true()
+    review_id, cursor_source = before
+    # Within an id, rows sort by source descending.
+    return id_column <= review_id if source < cursor_source else id_column < review_id
+
+
+def review_feed_query(tutor_id, fetch: int, before=None):
+    """The feed's select: up to `fetch` rows after the decoded cursor `before`."""
+    session_reviews = (
+        db.select(
+            SessionFeedback.feedback_id.label("review_id"),
+            db.literal(SOURCE_SESSION).label("source"),
+            Student.name.label("student_name"),
+            Student.profile_pic_url.label("profile_pic_url"),
+            SessionFeedback.student_feedback.label("comment"),
+            SessionFeedback.star_rating.label("rating"),
+            SessionFeedback.feedback_sentiment.label("sentiment"),
+            SessionFeedback.analysis_status.label("analysis_status"),
+            SessionFeedback.improvement_tip.label("improvement_tip"),
+            SessionFeedback.issue_sentences.label("issue_sentences"),
+            Session.scheduled_time.label("date_posted"),
+        )
+        .join(Session, Session.session_id == SessionFeedback.session_id)
+        .join(Student, Student.student_id == Session.student_id)
+        .where(Session.tutor_id == tutor_id,
+               _after_cursor(SessionFeedback.feedback_id, SOURCE_SESSION, before))
+        .order_by(SessionFeedback.feedback_id.desc())
+        .limit(fetch)
+        .subquery()
+    )
+    tutor_reviews = (
+        db.select(
+            TutorReview.review_id.label("review_id"),
+            db.literal(SOURCE_TUTOR).label("source"),
+            TutorReview.student_name.label("student_name"),
+            db.null().label("profile_pic_url"),
+            TutorReview.comment.label("comment"),
+            TutorReview.rating.label("rating"),
+            TutorReview.sentiment.label("sentiment"),
+            db.null().label("analysis_status"),
+            db.null().label("improvement_tip"),
+            db.null().label("issue_sentences"),
+            db.null().label("date_posted"),
+        )
+        .where(TutorReview.tutor_id == tutor_id,
+               _after_cursor(TutorReview.review_id, SOURCE_TUTOR, before))
+        .order_by(TutorReview.review_id.desc())
+        .limit(fetch)
+        .subquery()
+    )
+    # Branches are wrapped in subqueries: SQLite rejects ORDER BY/LIMIT on a union member.
+    feed = db.union_all(db.select(session_reviews), db.select(tutor_reviews)).subquery()
+    return db.select(feed).order_by(feed.c.review_id.desc(), feed.c.source.desc()).limit(fetch)
+
+
+def review_feed(tutor_id, limit: int = 20, before: str = None):
+    """
+    A page of the tutor's reviews, newest first.
+
+    Args:
+        tutor_id (int): The tutor whose reviews to list.
+        limit (int): Page size.
+        before (str): Cursor returned with the previous page; None for the first page.
+
+    Returns:
+        tuple: (rows, next_cursor). Rows have review_id, source, student_name,
+               profile_pic_url, comment, rating, sentiment, analysis_status,
+               improvement_tip, issue_sentences and date_posted; the analysis
+               columns and date_posted are NULL for tutor reviews.
+               next_cursor is None on the last page.
+    """
+    before = decode_cursor(before) if before else None
+    rows = db.session.execute(review_feed_query(tutor_id, limit + 1, before)).all()
+    if len(rows) > limit:
+        return rows[:limit], encode_cursor(rows[limit - 1])
+    return rows, None
@@ -0,0 +1,131 @@
+# seeding.py
+"""
+Schema verification and idempotent bulk seeding.
+
+Seed rows live in a JSON data file (SEED_DATA_FILE, default seed_data.json)
+that maps table names to lists of rows with explicit primary keys. Tables are
+loaded in foreign-key order with one executemany INSERT per run of rows that
+set the same columns and one transaction per table; rows whose primary key
+already exists are skipped, so seeding can be re-run safely against a
+populated database.
+"""
+import datetime
+import json
+from decimal import Decimal
+from itertools import groupby
+
+from sqlalchemy import inspect, insert, tuple_
+from sqlalchemy.types import Date, DateTime, Time, Numeric
+
+from config import db, SEED_DATA_FILE
+from models import vader_sentiment
+
+
+def _derive_review_sentiment(row):
+    # TutorReviews.sentiment is normally set by an ORM listener, which bulk
+    # inserts bypass.
+    row.setdefault("sentiment", vader_sentiment(row.get("comment")))
+
+
+# Columns computed at load time instead of being stored in the data file.
+DERIVED_COLUMNS = {
+    "TutorReviews": _derive_review_sentiment,
+}
+
+
+def load_seed_file(path: str = SEED_DATA_FILE) -> dict:
+    """Read the seed data file: {table name: [row dictionaries]}."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _convert(column, value):
+    """Turn a JSON value into the Python type the column expects."""
+    if value is None:
+        return None
+    if isinstance(column.type, DateTime):
+        return datetime.datetime.fromisoformat(value)
+    if isinstance(column.type, Date):
+        return datetime.date.fromisoformat(value)
+    if isinstance(column.type, Time):
+        return datetime.time.fromisoformat(value)
+    if isinstance(column.type, Numeric) and column.type.asdecimal:
+        return Decimal(str(value))
+    return value
+
+
+def seed_database(data: dict) -> dict:
+    """
+    Insert the seed rows that are not in the database yet.
+
+    Args:
+        data (dict): Table name -> list of row dictionaries, as in the data file.
+
+    Returns:
+        dict: Table name -> number of rows inserted.
+    """
+    unknown = set(data) - set(db.metadata.tables)
+    if unknown:
+        raise ValueError(f"Seed data for unknown tables: {', '.join(sorted(unknown))}")
+
+    inserted = {}
+    for table in db.metadata.sorted_tables:
+        rows = data.get(table.name)
+        if not rows:
+            continue
+        key_columns = list(table.primary_key.columns)
+        rows = [{name: _convert(table.c[name], value) for name, value in row.items()} for row in rows]
+        for row in rows:
+            if table.name in DERIVED_COLUMNS:
+                DERIVED_COLUMNS[table.name](row)
+
+        keys = [tuple(row[column.name] for column in key_columns) for row in rows]
+        existing = set()
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            if len(key_columns) == 1:
+                condition = key_columns[0].in_([key[0] for key in chunk])
+            else:
+                condition = tuple_(*key_columns).in_(chunk)
+            existing.update(tuple(found) for found in db.session.execute(db.select(*key_columns).where(condition)))
+        missing = [row for row, key in zip(rows, keys) if key not in existing]
+
+        # An executemany takes its column list from the first row, so rows that
+        # set different columns (e.g. only some Subjects have a prerequisite)
+        # go in separate statements. Consecutive runs keep the file's order.
+        for _, run in groupby(missing, key=lambda row: tuple(sorted(row))):
+            db.session.execute(insert(table), list(run))
+        db.session.commit()
+        inserted[table.name] = len(missing)
+    return inserted
+
+
+def verify_schema(engine=None) -> dict:
+    """
+    Compare the database with the models without changing anything.
+
+    Args:
+        engine: The engine of the database to check (defaults to db.engine).
+
+    Returns:
+        dict: {"missing_tables": [...], "missing_columns": {table: [...]},
+               "missing_indexes": {table: [...]}}; all empty when the schema matches.
+    """
+    inspector = inspect(engine if engine is not None else db.engine)
+    existing_tables = set(inspector.get_table_names())
+    missing_tables = []
+    missing_columns = {}
+    missing_indexes = {}
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            missing_tables.append(table.name)
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        absent = [column.name for column in table.columns if column.name not in columns]
+        if absent:
+            missing_columns[table.name] = absent
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        absent = [index.name for index in table.indexes if index.name not in indexes]
+        if absent:
+            missing_indexes[table.name] = absent
+    return {"missing_tables": missing_tables, "missing_columns": missing_columns, "missing_indexes": missing_indexes}
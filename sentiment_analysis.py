@@ -1,7 +1,19 @@
 # sentiment_analysis.py
-from transformers import pipeline
+import threading
 
-sentiment_pipeline = pipeline("sentiment-analysis", model="distilbert-base-uncased-finetuned-sst-2-english")
+from config import SENTIMENT_MODEL_REVISION, SENTIMENT_ENGINE, SENTIMENT_VADER_THRESHOLD
+from nlp_models import LazyPipeline
+from nlp_cache import cached
+from models import get_vader_analyzer
+
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+
+sentiment_pipeline = LazyPipeline("sentiment-analysis", SENTIMENT_MODEL, revision=SENTIMENT_MODEL_REVISION)
+
+# How often VADER was confident enough to skip the transformer. Updated from
+# the feedback worker, offload threads and NLP server threads, under the lock.
+cascade_stats = {"vader": 0, "escalated": 0}
+_cascade_stats_lock = threading.Lock()
 
 def analyze_sentiment(text: str) -> dict:
     """
@@ -14,8 +26,67 @@ def analyze_sentiment(text: str) -> dict:
         dict: A dictionary containing the sentiment label and confidence score.
               Example: {'label': 'POSITIVE', 'score': 0.998}
     """
-    result = sentiment_pipeline(text)
-    return result[0]
+    return analyze_sentiments([text])[0]
+
+def analyze_sentiments(texts: list, batch_size: int = 8) -> list:
+    """
+    Analyze the sentiment of several texts with the engine selected by
+    SENTIMENT_ENGINE ("cascade" or "transformer").
+
+    Args:
+        texts (list): The input feedback texts.
+        batch_size (int): Number of texts per forward pass.
+
+    Returns:
+        list: One {'label', 'score'} dictionary per text, in input order.
+    """
+    if SENTIMENT_ENGINE == "cascade":
+        return analyze_sentiments_cascaded(texts, SENTIMENT_VADER_THRESHOLD, batch_size)
+    return analyze_sentiments_transformer(texts, batch_size)
+
+def analyze_sentiments_transformer(texts: list, batch_size: int = 8) -> list:
+    """Transformer sentiment for several texts in batched forward passes."""
+    if not texts:
+        return []
+    return cached("sentiment", [SENTIMENT_MODEL, SENTIMENT_MODEL_REVISION, *sentiment_pipeline.fingerprint], list(texts),
+                  lambda missing: sentiment_pipeline(missing, batch_size=batch_size))
+
+def analyze_sentiments_cascaded(texts: list, threshold: float = SENTIMENT_VADER_THRESHOLD, batch_size: int = 8) -> list:
+    """
+    VADER first, transformer only when VADER is unsure. A text whose VADER
+    compound score has an absolute value of at least `threshold` is labelled
+    from VADER (score = |compound|); the others are escalated to the
+    transformer. Each result carries a 'source' key, "vader" or "transformer".
+    """
+    if not texts:
+        return []
+    analyzer = get_vader_analyzer()
+    results = []
+    escalated = []
+    for index, text in enumerate(texts):
+        compound = analyzer.polarity_scores(text or "")["compound"] if text else 0.0
+        if abs(compound) >= threshold:
+            results.append({"label": "POSITIVE" if compound > 0 else "NEGATIVE", "score": abs(compound), "source": "vader"})
+        else:
+            results.append(None)
+            escalated.append(index)
+
+    with _cascade_stats_lock:
+        cascade_stats["vader"] += len(texts) - len(escalated)
+        cascade_stats["escalated"] += len(escalated)
+    if escalated:
+        transformer_results = analyze_sentiments_transformer([texts[i] for i in escalated], batch_size)
+        for index, result in zip(escalated, transformer_results):
+            results[index] = dict(result, source="transformer")
+    return results
+
+def cascade_metrics() -> dict:
+    """Counts of VADER-labelled and escalated texts and the escalation rate."""
+    with _cascade_stats_lock:
+        counts = dict(cascade_stats)
+    total = counts["vader"] + counts["escalated"]
+    return dict(counts, engine=SENTIMENT_ENGINE, threshold=SENTIMENT_VADER_THRESHOLD,
+                escalation_rate=counts["escalated"] / total if total else 0.0)
 
 if __name__ == "__main__":
     test_text = "The tutor was great but spoke too fast."
@@ -0,0 +1,171 @@
+# sql_stats.py
+"""
+Per-request SQL instrumentation.
+
+Cursor events on every engine time each statement and attribute it to the
+Flask request that ran it; statements outside a request (scheduler jobs,
+CLI commands) are only checked against the slow-query threshold. When a
+request finishes, its statement count, DB time and slowest statements are
+added to per-endpoint totals for /internal/sql-stats, slow requests are
+logged, and with SQL_STATS_HEADER the response carries an X-SQL-Stats header.
+
+Raw DB-API cursors bypass the engine events; wrap them in InstrumentedCursor.
+"""
+import heapq
+import logging
+import threading
+import time
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from config import SQL_SLOW_QUERY_MS, SQL_SLOW_REQUEST_MS, SQL_STATS_HEADER, SQL_STATS_SLOWEST
+
+# Statements are stored and logged truncated to this many characters.
+STATEMENT_PREVIEW_CHARS = 300
+
+_START_TIMES = "sql_stats_start_times"
+
+
+def _keep_slowest(heap: list, seconds: float, statement: str):
+    """Keep the SQL_STATS_SLOWEST slowest (seconds, statement) pairs in a min-heap."""
+    item = (seconds, statement)
+    if len(heap) < SQL_STATS_SLOWEST:
+        heapq.heappush(heap, item)
+    elif heap and item > heap[0]:
+        heapq.heapreplace(heap, item)
+
+
+def _slowest_ms(heap: list) -> list:
+    return [{"ms": seconds * 1000, "statement": statement} for seconds, statement in sorted(heap, reverse=True)]
+
+
+class RequestSQL:
+    """Statements of one request."""
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+        self.slowest = []
+
+    def record(self, statement: str, seconds: float):
+        self.statements += 1
+        self.seconds += seconds
+        _keep_slowest(self.slowest, seconds, statement)
+
+
+class EndpointSQLStats:
+    """Statement counts and DB time per endpoint, aggregated over requests."""
+
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, current: RequestSQL):
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, {
+                "requests": 0, "statements": 0, "seconds": 0.0, "max_statements": 0, "max_seconds": 0.0,
+                "slowest": [],
+            })
+            stats["requests"] += 1
+            stats["statements"] += current.statements
+            stats["seconds"] += current.seconds
+            stats["max_statements"] = max(stats["max_statements"], current.statements)
+            stats["max_seconds"] = max(stats["max_seconds"], current.seconds)
+            for seconds, statement in current.slowest:
+                _keep_slowest(stats["slowest"], seconds, statement)
+
+    def summary(self) -> dict:
+        """Endpoint -> totals, most total DB time first."""
+        with self._lock:
+            endpoints = sorted(self._endpoints.items(), key=lambda item: item[1]["seconds"], reverse=True)
+            return {
+                endpoint: {
+                    "requests": stats["requests"],
+                    "statements": stats["statements"],
+                    "mean_statements": stats["statements"] / stats["requests"],
+                    "max_statements": stats["max_statements"],
+                    "db_ms": stats["seconds"] * 1000,
+                    "mean_db_ms": stats["seconds"] / stats["requests"] * 1000,
+                    "max_db_ms": stats["max_seconds"] * 1000,
+                    "slowest": _slowest_ms(stats["slowest"]),
+                }
+                for endpoint, stats in endpoints
+            }
+
+
+endpoint_stats = EndpointSQLStats()
+
+
+def record_statement(statement: str, seconds: float):
+    """Attribute one executed statement to the current request and log it if it was slow."""
+    statement = statement.strip()[:STATEMENT_PREVIEW_CHARS]
+    current = g.get("sql_stats") if has_request_context() else None
+    if current is not None:
+        current.record(statement, seconds)
+    if seconds * 1000 >= SQL_SLOW_QUERY_MS:
+        where = request.endpoint if has_request_context() else "background"
+        logging.warning(f"Slow SQL statement ({seconds * 1000:.1f} ms, {where}): {statement}")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get(_START_TIMES)
+    if start_times:
+        record_statement(statement, time.perf_counter() - start_times.pop())
+
+
+def _cursor_execute_failed(context):
+    start_times = context.connection.info.get(_START_TIMES) if context.connection is not None else None
+    if start_times and context.statement:
+        record_statement(context.statement, time.perf_counter() - start_times.pop())
+
+
+class InstrumentedCursor:
+    """DB-API cursor wrapper whose statements are recorded like the engine's."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def execute(self, sql, params=()):
+        start = time.perf_counter()
+        try:
+            return self.cursor.execute(sql, params)
+        finally:
+            record_statement(sql, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+
+def _start_request():
+    g.sql_stats = RequestSQL()
+
+
+def _finish_request(response):
+    current = g.pop("sql_stats", None)
+    if current is None:
+        return response
+    endpoint = request.endpoint or "<unmatched>"
+    endpoint_stats.record(endpoint, current)
+    if current.seconds * 1000 >= SQL_SLOW_REQUEST_MS:
+        slowest = "; ".join(f"{item['ms']:.1f} ms: {item['statement']}" for item in _slowest_ms(current.slowest))
+        logging.warning(f"Slow request {request.method} {request.path} ({endpoint}): {current.statements} statements, "
+                        f"{current.seconds * 1000:.1f} ms in the database. Slowest: {slowest}")
+    if SQL_STATS_HEADER:
+        response.headers["X-SQL-Stats"] = f"statements={current.statements}; db_ms={current.seconds * 1000:.1f}"
+    return response
+
+
+def init_sql_stats(app):
+    """Instrument every engine's cursor executions and attribute them to the app's requests."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _cursor_execute_failed)
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
@@ -0,0 +1,69 @@
+# tests/conftest.py
+"""
+Shared fixtures. The app is imported once per test run against a scratch
+SQLite database (DATABASE_URL), with the feedback worker effectively idle
+and the profile cache off. Each test module that uses seeded_app starts
+from a freshly migrated and seeded database.
+
+Seeding derives TutorReviews.sentiment with VADER, so tests that need the
+seeded database are skipped when NLTK's vader_lexicon is not installed.
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+_scratch = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_scratch.name, 'tests.sqlite3')}"
+os.environ.setdefault("NLP_CACHE_PATH", os.path.join(_scratch.name, "nlp_cache.sqlite3"))
+os.environ["NLP_WARMUP_ON_START"] = "false"
+os.environ["FEEDBACK_WORKER_INTERVAL_SECONDS"] = "3600"
+os.environ["TUTOR_PROFILE_CACHE_BACKEND"] = "none"
+os.chdir(ROOT)
+
+
+def vader_lexicon_installed() -> bool:
+    import nltk
+    try:
+        nltk.data.find("sentiment/vader_lexicon.zip")
+    except LookupError:
+        return False
+    return True
+
+
+@pytest.fixture(scope="session")
+def app():
+    import app as tutoreal
+    yield tutoreal.app
+    tutoreal.scheduler.shutdown(wait=False)
+    _scratch.cleanup()
+
+
+@pytest.fixture(scope="module")
+def seeded_app(app):
+    """The app with a freshly migrated and seeded database, rebuilt for every test module."""
+    if not vader_lexicon_installed():
+        pytest.skip("NLTK vader_lexicon is not installed")
+    from config import db
+    from migrations import schema_migrations, upgrade
+    from seeding import load_seed_file, seed_database
+    from feedback_rollups import rebuild_rollups
+    from tutor_stats import rebuild_tutor_stats
+    with app.app_context():
+        db.drop_all()
+        schema_migrations.drop(db.engine, checkfirst=True)
+        upgrade(db.engine)
+        seed_database(load_seed_file())
+        rebuild_rollups()
+        rebuild_tutor_stats(db.session.connection())
+        db.session.commit()
+    return app
+
+
+@pytest.fixture
+def client(seeded_app):
+    return seeded_app.test_client()
@@ -0,0 +1,100 @@
+# tests/test_booking.py
+"""Booking only ever uses one-hour slots (booking_rules.py)."""
+from datetime import date, datetime, time
+
+import pytest
+
+from config import db
+from models import Session, StudentAvailableSlot, TutorAvailableSlot, TutorSubject
+
+SLOT_DATE = date(2030, 1, 7)
+STUDENT_ID = 1
+
+
+@pytest.fixture
+def offer(seeded_app):
+    """A (tutor_id, subject_id) the tutor teaches, with no slots on SLOT_DATE."""
+    with seeded_app.app_context():
+        tutor_subject = db.session.scalars(db.select(TutorSubject).order_by(TutorSubject.tutor_id)).first()
+        offer = (tutor_subject.tutor_id, tutor_subject.subject_id)
+        yield offer
+        TutorAvailableSlot.query.filter_by(tutor_id=offer[0], available_date=SLOT_DATE).delete()
+        StudentAvailableSlot.query.filter_by(student_id=STUDENT_ID, available_date=SLOT_DATE).delete()
+        Session.query.filter(Session.tutor_id == offer[0],
+                             db.func.date(Session.scheduled_time) == SLOT_DATE).delete(synchronize_session=False)
+        db.session.commit()
+
+
+def _add_slot(tutor_id, start, end):
+    db.session.add(TutorAvailableSlot(tutor_id=tutor_id, available_date=SLOT_DATE, start_time=start, end_time=end))
+    db.session.commit()
+
+
+def _add_student_slot(start, end):
+    db.session.add(StudentAvailableSlot(student_id=STUDENT_ID, available_date=SLOT_DATE, start_time=start, end_time=end))
+    db.session.commit()
+
+
+def _book(client, tutor_id, subject_id, start):
+    with client.session_transaction() as session:
+        session["student_id"] = STUDENT_ID
+    return client.post("/book_session", data={
+        "tutor_id": tutor_id, "subject_id": subject_id,
+        "selected_date": SLOT_DATE.isoformat(), "selected_time": start.strftime("%H:%M"),
+    })
+
+
+def test_booking_a_one_hour_slot_removes_it(seeded_app, client, offer):
+    tutor_id, subject_id = offer
+    with seeded_app.app_context():
+        _add_slot(tutor_id, time(10), time(11))
+        _add_student_slot(time(10), time(11))
+    response = _book(client, tutor_id, subject_id, time(10))
+    assert response.status_code == 302
+    with seeded_app.app_context():
+        assert not TutorAvailableSlot.query.filter_by(tutor_id=tutor_id, available_date=SLOT_DATE).count()
+        assert not StudentAvailableSlot.query.filter_by(student_id=STUDENT_ID, available_date=SLOT_DATE).count()
+        assert Session.query.filter_by(tutor_id=tutor_id, scheduled_time=datetime.combine(SLOT_DATE, time(10))).count()
+
+
+def test_booking_requires_a_student_slot(seeded_app, client, offer):
+    tutor_id, subject_id = offer
+    with seeded_app.app_context():
+        _add_slot(tutor_id, time(12), time(13))
+    response = _book(client, tutor_id, subject_id, time(12))
+    assert response.status_code == 400
+    assert b"Student not available at the scheduled time" in response.data
+    with seeded_app.app_context():
+        # The rejected booking kept the tutor's slot and created no session.
+        assert TutorAvailableSlot.query.filter_by(tutor_id=tutor_id, start_time=time(12)).count()
+        assert not Session.query.filter_by(tutor_id=tutor_id, scheduled_time=datetime.combine(SLOT_DATE, time(12))).count()
+
+
+def test_booking_a_longer_slot_is_a_bad_request(seeded_app, client, offer):
+    tutor_id, subject_id = offer
+    with seeded_app.app_context():
+        _add_slot(tutor_id, time(14), time(15, 30))
+    response = _book(client, tutor_id, subject_id, time(14))
+    assert response.status_code == 400
+    assert b"Selected time slot is not available." in response.data
+
+
+def test_profile_settings_reject_slots_that_are_not_one_hour(seeded_app, client, offer):
+    tutor_id, _ = offer
+    with seeded_app.app_context():
+        _add_slot(tutor_id, time(16), time(17))
+    with client.session_transaction() as session:
+        session["tutor_id"] = tutor_id
+    form = {"available_date[]": [SLOT_DATE.isoformat()], "start_time[]": ["09:00"], "end_time[]": ["10:30"]}
+    response = client.post("/api/tutor/update", data=form)
+    assert response.status_code == 400
+    with seeded_app.app_context():
+        # The existing slots are kept.
+        assert TutorAvailableSlot.query.filter_by(tutor_id=tutor_id, start_time=time(16)).count()
+
+    form["end_time[]"] = ["10:00"]
+    assert client.post("/api/tutor/update", data=form).status_code == 200
+    with seeded_app.app_context():
+        slots = TutorAvailableSlot.query.filter_by(tutor_id=tutor_id).all()
+        assert [(slot.available_date, slot.start_time, slot.end_time) for slot in slots] == \
+            [(SLOT_DATE, time(9), time(10))]
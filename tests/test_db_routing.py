@@ -0,0 +1,132 @@
+# tests/test_db_routing.py
+"""
+Read-replica routing (db_routing.py) with two SQLite files: a seeded primary
+and a copy of it as the replica. The copies give one tutor different names,
+so every read shows which database answered.
+"""
+import shutil
+
+import pytest
+from flask import Flask, request
+
+from config import db, engine_options
+from conftest import vader_lexicon_installed
+from db_routing import REPLICA_BIND, init_read_routing
+import tutor_profile_cache
+from matching_module import PortableCursor, get_tutors_for_subject
+from models import Subject, Tutor, TutorSubject
+
+
+@pytest.fixture
+def routed_app(app, tmp_path):
+    if not vader_lexicon_installed():
+        pytest.skip("NLTK vader_lexicon is not installed")
+    from migrations import upgrade
+    from seeding import load_seed_file, seed_database
+
+    primary_url = f"sqlite:///{tmp_path / 'primary.sqlite3'}"
+    replica_url = f"sqlite:///{tmp_path / 'replica.sqlite3'}"
+    routed = Flask(__name__)
+    routed.secret_key = "test"
+    routed.config["SQLALCHEMY_DATABASE_URI"] = primary_url
+    routed.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(primary_url)
+    routed.config["SQLALCHEMY_BINDS"] = {REPLICA_BIND: {"url": replica_url, **engine_options(replica_url)}}
+    db.init_app(routed)
+    init_read_routing(routed, db, read_after_write_seconds=60)
+
+    with routed.app_context():
+        upgrade(db.engine)
+        seed_database(load_seed_file())
+        tutor_subject = db.session.scalars(db.select(TutorSubject).order_by(TutorSubject.tutor_id)).first()
+        routed.config["TUTOR_ID"] = tutor_subject.tutor_id
+        routed.config["SUBJECT"] = db.session.get(Subject, tutor_subject.subject_id).subject_name
+        db.session.remove()
+        db.engine.dispose()
+        shutil.copy(tmp_path / "primary.sqlite3", tmp_path / "replica.sqlite3")
+        for bind, name in ((None, "primary"), (REPLICA_BIND, "replica")):
+            with db.engines[bind].begin() as conn:
+                conn.execute(db.update(Tutor).where(Tutor.tutor_id == routed.config["TUTOR_ID"]).values(name=name))
+
+    def tutor_name():
+        return db.session.scalar(db.select(Tutor.name).where(Tutor.tutor_id == routed.config["TUTOR_ID"]))
+
+    @routed.route("/tutor", methods=["GET", "POST"])
+    def read_tutor():
+        return tutor_name()
+
+    @routed.route("/tutor/write", methods=["GET", "POST"])
+    def write_then_read():
+        before = tutor_name()
+        db.session.execute(db.update(Tutor).where(Tutor.tutor_id == routed.config["TUTOR_ID"])
+                           .values(bio=request.method))
+        after = tutor_name()
+        db.session.commit()
+        return f"{before},{after}"
+
+    @routed.route("/matching", methods=["GET", "POST"])
+    def matching():
+        engine = db.session.get_bind()
+        conn = engine.raw_connection()
+        try:
+            cursor = PortableCursor(conn.cursor(), engine.dialect.paramstyle)
+            tutors = get_tutors_for_subject(routed.config["SUBJECT"], cursor)
+            cursor.close()
+        finally:
+            conn.close()
+        return next(tutor["name"] for tutor in tutors if tutor["tutor_id"] == routed.config["TUTOR_ID"])
+
+    @routed.route("/profile")
+    def profile():
+        return f"{tutor_profile_cache.cached_tutor_profile(routed.config['TUTOR_ID'])['name']},{tutor_name()}"
+
+    yield routed
+    with routed.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+    # init_app registered (empty) metadata for the replica bind, which the
+    # main test app, configured without a replica, cannot create or drop.
+    db.metadatas.pop(REPLICA_BIND, None)
+
+
+def test_get_reads_from_the_replica(routed_app):
+    client = routed_app.test_client()
+    assert client.get("/tutor").text == "replica"
+    assert client.get("/tutor").text == "replica"
+
+
+def test_post_reads_from_the_primary(routed_app):
+    assert routed_app.test_client().post("/tutor").text == "primary"
+
+
+def test_reads_after_a_write_use_the_primary(routed_app):
+    client = routed_app.test_client()
+    # The read before the write may use the replica; the one after it may not.
+    assert client.get("/tutor/write").text == "replica,primary"
+    # The write went to the primary only.
+    with routed_app.app_context():
+        bios = {}
+        for bind in (None, REPLICA_BIND):
+            with db.engines[bind].connect() as conn:
+                bios[bind] = conn.execute(
+                    db.select(Tutor.bio).where(Tutor.tutor_id == routed_app.config["TUTOR_ID"])).scalar()
+    assert bios[None] == "GET"
+    assert bios[REPLICA_BIND] != "GET"
+    # The client that wrote keeps reading from the primary; others do not.
+    assert client.get("/tutor").text == "primary"
+    assert routed_app.test_client().get("/tutor").text == "replica"
+
+
+def test_raw_matching_queries_follow_the_request(routed_app):
+    client = routed_app.test_client()
+    assert client.get("/matching").text == "replica"
+    assert client.post("/matching").text == "primary"
+    client.get("/tutor/write")
+    assert client.get("/matching").text == "primary"
+
+
+def test_profile_cache_entries_are_built_from_the_primary(routed_app, monkeypatch):
+    monkeypatch.setattr(tutor_profile_cache, "backend", tutor_profile_cache.MemoryBackend())
+    client = routed_app.test_client()
+    # A lagging replica must not be cached; the request's other reads still use it.
+    assert client.get("/profile").text == "primary,replica"
+    assert client.get("/profile").text == "primary,replica"
@@ -0,0 +1,73 @@
+# tests/test_experiments.py
+"""Experiment counters, report intervals and the cached experiment definition."""
+import json
+import os
+
+import pytest
+
+import experiments
+from config import db
+from models import ExperimentArmStats
+
+
+def test_exposures_and_conversions_count_students(seeded_app):
+    with seeded_app.app_context():
+        for _ in range(3):
+            experiments.record_exposure(1)
+        experiments.record_booking(1)
+        experiments.record_booking(1)
+        # A booking without a prior recommendation page still exposes the student.
+        experiments.record_booking(2)
+        db.session.commit()
+
+        # (exposures, booking_students, bookings) per arm.
+        expected = {}
+        for student_id, bookings in ((1, 2), (2, 1)):
+            arm = experiments.assign_arm(student_id)["name"]
+            exposures, students, total = expected.get(arm, (0, 0, 0))
+            expected[arm] = (exposures + 1, students + 1, total + bookings)
+        rows = db.session.scalars(db.select(ExperimentArmStats)).all()
+        assert {row.arm_name: (row.exposures, row.booking_students, row.bookings) for row in rows} == expected
+
+        report = experiments.experiment_report()
+    for arm in report["arms"]:
+        if arm["exposures"]:
+            low, high = arm["booking_rate_ci"]
+            assert 0.0 <= low <= arm["booking_rate"] <= high <= 1.0
+
+
+@pytest.mark.parametrize("successes, trials, expected", [
+    (0, 10, [0.0, 0.2775]),
+    (5, 10, [0.2366, 0.7634]),
+    (10, 10, [0.7225, 1.0]),
+    (1, 1000, [0.0002, 0.0056]),
+])
+def test_booking_rate_uses_the_wilson_interval(successes, trials, expected):
+    rate, se, interval = experiments._proportion(successes, trials)
+    assert rate == successes / trials
+    assert interval == pytest.approx(expected, abs=1e-4)
+
+
+def test_proportion_without_trials():
+    assert experiments._proportion(0, 0) == (None, None, None)
+
+
+def test_experiment_file_is_cached_until_it_changes(tmp_path, monkeypatch):
+    path = tmp_path / "experiments.json"
+    definition = {"name": "exp", "arms": [{"name": "control", "allocation": 100, "weights": {"a": 1}}]}
+    path.write_text(json.dumps(definition))
+    opened = []
+    real_open = open
+    monkeypatch.setattr("builtins.open", lambda *args, **kwargs: opened.append(args[0]) or real_open(*args, **kwargs))
+
+    first = experiments.load_experiment(str(path))
+    first["arms"][0]["allocation"] = 0  # callers get their own copy
+    assert experiments.load_experiment(str(path)) == definition
+    assert opened == [str(path)]
+
+    definition["name"] = "exp-2"
+    path.write_text(json.dumps(definition))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert experiments.load_experiment(str(path))["name"] == "exp-2"
+    assert len(opened) == 2
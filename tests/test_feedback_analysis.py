@@ -0,0 +1,109 @@
+# tests/test_feedback_analysis.py
+"""Chunked feedback analysis and the attribution of issues to sentences, with stub models."""
+import pytest
+
+import feedback_analysis
+
+# Issue label -> the word that signals it in the stub models.
+KEYWORDS = {"fast": "fast", "explanation": "examples"}
+
+
+@pytest.fixture
+def models(monkeypatch):
+    calls = {"sentiment": [], "issues": [], "scores": [], "batch_sizes": set()}
+
+    def analyze_sentiments(texts, batch_size=8):
+        calls["sentiment"].append(list(texts))
+        calls["batch_sizes"].add(batch_size)
+        return [{"label": "NEGATIVE" if "not" in text else "POSITIVE", "score": 0.9} for text in texts]
+
+    def extract_issues_batch(texts, batch_size=8):
+        calls["issues"].append(list(texts))
+        calls["batch_sizes"].add(batch_size)
+        return [[{"issue": label, "score": 0.5 + 0.1 * text.count(word)}
+                 for label, word in KEYWORDS.items() if word in text] for text in texts]
+
+    def issue_scores_batch(texts, labels, batch_size=8):
+        calls["scores"].append((list(texts), list(labels)))
+        calls["batch_sizes"].add(batch_size)
+        return [{label: 0.9 if KEYWORDS[label] in text else 0.1 for label in labels} for text in texts]
+
+    monkeypatch.setattr(feedback_analysis, "analyze_sentiments", analyze_sentiments)
+    monkeypatch.setattr(feedback_analysis, "extract_issues_batch", extract_issues_batch)
+    monkeypatch.setattr(feedback_analysis, "issue_scores_batch", issue_scores_batch)
+    return calls
+
+
+def _sentences(text, result):
+    return [(text[sentence["start"]:sentence["end"]], sentence["issues"]) for sentence in result["issue_sentences"]]
+
+
+def test_short_feedback_runs_issues_once_and_attributes_them(models):
+    text = "The tutor was kind. She spoke too fast. I did not get the examples."
+    [result] = feedback_analysis.analyze_feedback_batch_local([text])
+
+    assert models["issues"] == [[text]]
+    assert models["sentiment"] == [[text]]
+    # Only the two issues found are scored, for the chunk's three sentences.
+    assert models["scores"] == [(["The tutor was kind.", "She spoke too fast.", "I did not get the examples."],
+                                 ["fast", "explanation"])]
+    assert {issue["issue"] for issue in result["issues"]} == {"fast", "explanation"}
+    assert _sentences(text, result) == [("She spoke too fast.", ["fast"]),
+                                        ("I did not get the examples.", ["explanation"])]
+    assert result["sentiment"] == "Negative"
+
+
+def test_single_sentences_and_clean_feedback_need_no_attribution(models):
+    texts = ["Way too fast for me.", "Great session. Thanks a lot!"]
+    results = feedback_analysis.analyze_feedback_batch_local(texts)
+
+    assert models["issues"] == [texts]
+    assert models["scores"] == []
+    assert _sentences(texts[0], results[0]) == [("Way too fast for me.", ["fast"])]
+    assert results[1]["issues"] == [] and results[1]["issue_sentences"] == []
+
+
+def test_long_feedback_is_chunked(models):
+    first = " ".join(["The pace was fast."] * 15)
+    second = " ".join(["I liked the examples."] * 15)
+    text = f"{first} {second}"
+    [result] = feedback_analysis.analyze_feedback_batch_local([text])
+
+    [chunks] = models["issues"]
+    assert len(chunks) > 1 and all(len(chunk) <= 400 for chunk in chunks)
+    assert models["sentiment"] == [chunks]
+    # Each chunk's sentences are scored only against that chunk's issues.
+    assert all(set(labels) in ({"fast"}, {"explanation"}, {"fast", "explanation"}) for _, labels in models["scores"])
+    assert sum(len(texts) for texts, _ in models["scores"]) <= text.count(".")
+    # Issues keep their best chunk score, and each lands on a sentence that mentions it.
+    scores = {issue["issue"]: issue["score"] for issue in result["issues"]}
+    assert scores["fast"] == pytest.approx(0.5 + 0.1 * max(chunk.count("fast") for chunk in chunks))
+    for sentence, issues in _sentences(text, result):
+        assert all(KEYWORDS[issue] in sentence for issue in issues)
+    assert {issue for _, issues in _sentences(text, result) for issue in issues} == {"fast", "explanation"}
+    assert result["sentiment"] == "Positive"
+
+
+def test_batch_size_reaches_every_model_call(models):
+    text = "The tutor was kind. She spoke too fast."
+    feedback_analysis.analyze_feedback_batch_local([text], batch_size=3)
+    assert models["scores"] and models["batch_sizes"] == {3}
+
+
+def test_issue_scores_score_each_label_on_its_own(monkeypatch):
+    import issue_extraction
+
+    class FakeClassifier:
+        fingerprint = ["fake"]
+        calls = []
+
+        def __call__(self, texts, labels, **kwargs):
+            self.calls.append(kwargs)
+            return [{"labels": list(labels), "scores": [0.7 for _ in labels]} for _ in texts]
+
+    monkeypatch.setattr(issue_extraction, "ISSUE_CLASSIFIER", "zero-shot")
+    monkeypatch.setattr(issue_extraction, "classifier", FakeClassifier())
+    texts = ["Scored on its own label set once.", "And another sentence."]
+    assert issue_extraction.issue_scores_batch(texts, ["pace", "tone"]) == [{"pace": 0.7, "tone": 0.7}] * 2
+    assert FakeClassifier.calls[0]["multi_label"] is True
+    assert issue_extraction.issue_scores_batch(["x"], []) == [{}]
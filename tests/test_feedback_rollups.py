@@ -0,0 +1,85 @@
+# tests/test_feedback_rollups.py
+"""Weekly rollups maintained by the feedback worker equal a full rebuild."""
+import pytest
+
+import app as tutoreal
+import feedback_worker
+from config import db
+from feedback_rollups import rebuild_rollups
+from feedback_worker import ANALYSIS_DONE, process_pending_feedback
+from models import Session, SessionFeedback, TutorIssueRollup, TutorSentimentRollup
+
+# Stub analysis by feedback text: (sentiment, issues).
+ANALYSES = {
+    "Way too slow, I got bored.": ("Negative", [{"issue": "fast", "score": 0.7}]),
+    "Great session, thanks!": ("Positive", []),
+    "It was ok, the examples were unclear.": ("Neutral", [{"issue": "explanation", "score": 0.4},
+                                                           {"issue": "fast", "score": 0.2}]),
+}
+
+
+def _stub_analysis(texts):
+    return [{"sentiment": ANALYSES[text][0], "issues": ANALYSES[text][1], "issue_sentences": [],
+             "improvement_tip": None} for text in texts]
+
+
+def _rollups():
+    db.session.expire_all()
+    sentiments = {(row.tutor_id, row.bucket_start): (row.feedback_count, row.positive_count, row.neutral_count,
+                                                     row.negative_count, row.rating_sum)
+                  for row in TutorSentimentRollup.query}
+    issues = {(row.tutor_id, row.bucket_start, row.issue): (row.issue_count, row.score_sum)
+              for row in TutorIssueRollup.query}
+    return sentiments, issues
+
+
+def _assert_same(actual, expected):
+    assert set(actual) == set(expected)
+    for key, values in actual.items():
+        assert values == pytest.approx(expected[key]), key
+
+
+@pytest.fixture
+def submitted(seeded_app, client, monkeypatch):
+    """Feedback submitted through /analyze-feedback for sessions of several tutors and weeks."""
+    monkeypatch.setattr(tutoreal, "wake_feedback_worker", lambda: None)
+    monkeypatch.setattr(feedback_worker, "analyze_feedback_batch", _stub_analysis)
+    with seeded_app.app_context():
+        sessions = db.session.scalars(db.select(Session).order_by(Session.session_id)).all()
+        targets = [(session.session_id, session.tutor_id) for session in sessions[:4]]
+    texts = list(ANALYSES)
+    feedback_ids = []
+    for index, (session_id, tutor_id) in enumerate(targets * 2):
+        response = client.post("/analyze-feedback", data={
+            "session_id": session_id, "tutor_id": tutor_id,
+            "student_feedback": texts[index % len(texts)], "star_rating": 1 + index % 5,
+        })
+        assert response.status_code == 202
+        feedback_ids.append(response.get_json()["feedback_id"])
+    yield feedback_ids
+    with seeded_app.app_context():
+        for feedback_id in feedback_ids:
+            db.session.delete(db.session.get(SessionFeedback, feedback_id))
+        rebuild_rollups()
+        db.session.commit()
+
+
+def test_incremental_rollups_match_a_rebuild(seeded_app, submitted):
+    with seeded_app.app_context():
+        before = _rollups()
+        while process_pending_feedback():
+            pass
+        statuses = db.session.scalars(db.select(SessionFeedback.analysis_status)
+                                      .where(SessionFeedback.feedback_id.in_(submitted))).all()
+        assert statuses == [ANALYSIS_DONE] * len(submitted)
+
+        incremental = _rollups()
+        assert incremental != before
+        assert sum(counts[0] for counts in incremental[0].values()) == \
+            sum(counts[0] for counts in before[0].values()) + len(submitted)
+
+        rebuild_rollups()
+        rebuilt = _rollups()
+        db.session.rollback()
+    _assert_same(incremental[0], rebuilt[0])
+    _assert_same(incremental[1], rebuilt[1])
@@ -0,0 +1,98 @@
+# tests/test_feedback_worker.py
+"""Claiming, retrying and giving up on background feedback analysis, with a stub analyzer."""
+from datetime import datetime, timedelta
+
+import pytest
+
+import feedback_worker
+from config import FEEDBACK_ANALYSIS_LEASE_SECONDS, FEEDBACK_ANALYSIS_MAX_ATTEMPTS, db
+from feedback_worker import (ANALYSIS_DONE, ANALYSIS_FAILED, ANALYSIS_PENDING, ANALYSIS_PROCESSING,
+                             claim_pending_feedback, process_pending_feedback)
+from models import Session, SessionFeedback
+
+# Above every seeded id.
+BASE_ID = 3_000_000
+
+
+@pytest.fixture
+def add_feedback(seeded_app):
+    """Adds a feedback row in the given analysis state; the rows are removed afterwards."""
+    added = []
+    with seeded_app.app_context():
+        session_id = db.session.scalars(db.select(Session.session_id).order_by(Session.session_id)).first()
+
+        def add(status, attempts=0, started_at=None):
+            row = SessionFeedback(feedback_id=BASE_ID + len(added), session_id=session_id, star_rating=3,
+                                  student_feedback="The pace was too fast.", analysis_status=status,
+                                  analysis_attempts=attempts, analysis_started_at=started_at)
+            db.session.add(row)
+            db.session.commit()
+            added.append(row.feedback_id)
+            return row.feedback_id
+
+        yield add
+        SessionFeedback.query.filter(SessionFeedback.feedback_id.in_(added)).delete()
+        db.session.commit()
+
+
+def _row(feedback_id):
+    db.session.expire_all()
+    return db.session.get(SessionFeedback, feedback_id)
+
+
+def _stub_analysis(texts):
+    return [{"sentiment": "Negative", "issues": [{"issue": "fast", "score": 0.8}], "issue_sentences": [],
+             "improvement_tip": "Slow down."} for _ in texts]
+
+
+def test_expired_leases_are_reclaimed(seeded_app, add_feedback):
+    expired = datetime.now() - timedelta(seconds=FEEDBACK_ANALYSIS_LEASE_SECONDS + 60)
+    stale = add_feedback(ANALYSIS_PROCESSING, attempts=1, started_at=expired)
+    leased = add_feedback(ANALYSIS_PROCESSING, attempts=1, started_at=datetime.now())
+    with seeded_app.app_context():
+        claimed = [row.feedback_id for row in claim_pending_feedback()]
+        assert claimed == [stale]
+        row = _row(stale)
+        assert row.analysis_status == ANALYSIS_PROCESSING
+        assert row.analysis_attempts == 2
+        assert row.analysis_started_at > expired
+        assert _row(leased).analysis_attempts == 1
+
+
+def test_failures_are_retried_until_max_attempts(seeded_app, add_feedback, monkeypatch):
+    def failing(texts):
+        raise RuntimeError("model crashed")
+
+    monkeypatch.setattr(feedback_worker, "analyze_feedback_batch", failing)
+    feedback_id = add_feedback(ANALYSIS_PENDING)
+    with seeded_app.app_context():
+        for attempt in range(1, FEEDBACK_ANALYSIS_MAX_ATTEMPTS + 1):
+            assert process_pending_feedback() == []
+            row = _row(feedback_id)
+            assert row.analysis_attempts == attempt
+            assert row.analysis_status == (ANALYSIS_FAILED if attempt == FEEDBACK_ANALYSIS_MAX_ATTEMPTS
+                                           else ANALYSIS_PENDING)
+        assert claim_pending_feedback() == []
+        assert _row(feedback_id).analysis_attempts == FEEDBACK_ANALYSIS_MAX_ATTEMPTS
+
+
+def test_expired_lease_out_of_attempts_is_failed(seeded_app, add_feedback):
+    expired = datetime.now() - timedelta(seconds=FEEDBACK_ANALYSIS_LEASE_SECONDS + 60)
+    feedback_id = add_feedback(ANALYSIS_PROCESSING, attempts=FEEDBACK_ANALYSIS_MAX_ATTEMPTS, started_at=expired)
+    with seeded_app.app_context():
+        assert claim_pending_feedback() == []
+        assert _row(feedback_id).analysis_status == ANALYSIS_FAILED
+
+
+def test_done_rows_are_never_reclaimed(seeded_app, add_feedback, monkeypatch):
+    monkeypatch.setattr(feedback_worker, "analyze_feedback_batch", _stub_analysis)
+    expired = datetime.now() - timedelta(seconds=FEEDBACK_ANALYSIS_LEASE_SECONDS + 60)
+    done = add_feedback(ANALYSIS_DONE, attempts=1, started_at=expired)
+    pending = add_feedback(ANALYSIS_PENDING)
+    with seeded_app.app_context():
+        notifications = process_pending_feedback()
+        assert [payload["feedback_id"] for _, payload in notifications] == [pending]
+        row = _row(pending)
+        assert (row.analysis_status, row.analysis_attempts, row.feedback_sentiment) == (ANALYSIS_DONE, 1, "Negative")
+        assert process_pending_feedback() == []
+        assert _row(done).analysis_attempts == 1
@@ -0,0 +1,24 @@
+# tests/test_internal_endpoints.py
+"""Operational endpoints only respond when INTERNAL_ENDPOINTS_ENABLED is set."""
+import pytest
+
+INTERNAL_ENDPOINTS = ["/internal/db-pool", "/internal/sql-stats", "/api/experiments/report"]
+
+
+@pytest.fixture
+def internal_enabled(seeded_app):
+    seeded_app.config["INTERNAL_ENDPOINTS_ENABLED"] = True
+    yield
+    seeded_app.config["INTERNAL_ENDPOINTS_ENABLED"] = False
+
+
+@pytest.mark.parametrize("path", INTERNAL_ENDPOINTS)
+def test_hidden_by_default(client, path):
+    assert client.get(path).status_code == 404
+
+
+@pytest.mark.parametrize("path", INTERNAL_ENDPOINTS)
+def test_served_when_enabled(client, internal_enabled, path):
+    response = client.get(path)
+    assert response.status_code == 200
+    assert response.is_json
@@ -0,0 +1,84 @@
+# tests/test_migrations.py
+"""A fresh database is built by the migrations one step at a time."""
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+import migrations
+from seeding import verify_schema
+from tutor_stats import rebuild_tutor_stats
+
+
+@pytest.fixture
+def engine(app, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    yield engine
+    engine.dispose()
+
+
+def test_baseline_is_the_pre_migration_schema(engine):
+    baseline = dict(migrations.available_migrations())["0001"]
+    with engine.begin() as conn:
+        baseline.upgrade(conn)
+
+    inspector = inspect(engine)
+    assert "TutorStats" not in inspector.get_table_names()
+    assert "ExperimentExposures" not in inspector.get_table_names()
+    columns = {column["name"] for column in inspector.get_columns("SessionFeedback")}
+    assert "issue_scores" not in columns
+    assert "analysis_status" not in columns
+    assert "booking_students" not in {column["name"] for column in inspector.get_columns("ExperimentArmStats")}
+    assert not any(inspector.get_indexes(table) for table in inspector.get_table_names())
+
+
+def _apply(engine, versions):
+    modules = dict(migrations.available_migrations())
+    for version in versions:
+        with engine.begin() as conn:
+            modules[version].upgrade(conn)
+
+
+def _tutor_stats(conn):
+    return {row["tutor_id"]: dict(row) for row in conn.execute(text("SELECT * FROM TutorStats")).mappings()}
+
+
+def test_tutor_stats_migration_matches_a_rebuild(engine):
+    _apply(engine, ["0001", "0002", "0003"])
+    with engine.begin() as conn:
+        for tutor_id in (1, 2, 3):
+            conn.execute(text(
+                "INSERT INTO Tutors (tutor_id, name, preferred_language, teaching_style, completed_sessions, email, password) "
+                "VALUES (:id, 'T', 'English', 'Visual', 0, :email, 'x')"), {"id": tutor_id, "email": f"t{tutor_id}@x"})
+        conn.execute(text("INSERT INTO Students (student_id, name, email, preferred_language, preferred_learning_style, "
+                          "password) VALUES (1, 'S', 's@x', 'English', 'Visual', 'x')"))
+        conn.execute(text("INSERT INTO Subjects (subject_id, subject_name) VALUES (1, 'Math')"))
+        for session_id, tutor_id in ((1, 1), (2, 1), (3, 2)):
+            conn.execute(text("INSERT INTO Sessions (session_id, student_id, tutor_id, subject_id, scheduled_time, "
+                              "session_status) VALUES (:id, 1, :tutor, 1, '2025-01-01 10:00:00', 'Completed')"),
+                         {"id": session_id, "tutor": tutor_id})
+        for session_id, rating, sentiment in ((1, 5, "Positive"), (2, 2, None), (3, 3, "NEGATIVE")):
+            conn.execute(text("INSERT INTO SessionFeedback (session_id, star_rating, feedback_sentiment) "
+                              "VALUES (:session, :rating, :sentiment)"),
+                         {"session": session_id, "rating": rating, "sentiment": sentiment})
+        for tutor_id, rating, sentiment in ((1, 4.49, "negative"), (1, 2.5, "mixed"), (3, None, "positive"),
+                                            (None, 5, "positive")):
+            conn.execute(text("INSERT INTO TutorReviews (tutor_id, student_name, rating, sentiment) "
+                              "VALUES (:tutor, 'S', :rating, :sentiment)"),
+                         {"tutor": tutor_id, "rating": rating, "sentiment": sentiment})
+    _apply(engine, ["0004"])
+
+    with engine.begin() as conn:
+        migrated = _tutor_stats(conn)
+        rebuild_tutor_stats(conn)
+        rebuilt = _tutor_stats(conn)
+    assert set(migrated) == set(rebuilt) == {1, 2, 3}
+    for tutor_id, row in migrated.items():
+        assert row == pytest.approx(rebuilt[tutor_id])
+    assert migrated[1]["review_count"] == 4 and migrated[1]["feedback_count"] == 2
+
+
+def test_upgrade_builds_the_current_schema(engine):
+    applied = migrations.upgrade(engine)
+
+    assert applied == [version for version, _ in migrations.available_migrations()]
+    assert verify_schema(engine) == {"missing_tables": [], "missing_columns": {}, "missing_indexes": {}}
+    assert migrations.pending_migrations(engine) == []
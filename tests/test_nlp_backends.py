@@ -0,0 +1,44 @@
+# tests/test_nlp_backends.py
+"""ONNX export/load file naming, result cache keys, and PyTorch/ONNX parity."""
+import pytest
+
+import nlp_backends
+from nlp_models import LazyPipeline
+
+
+def test_each_quantization_has_its_own_file():
+    names = {quantization: nlp_backends.onnx_file_name(quantization)
+             for quantization in ("none", "avx2", "avx512", "avx512_vnni", "arm64")}
+    assert names["none"] == "model.onnx"
+    assert len(set(names.values())) == len(names)
+
+
+def test_fingerprint_covers_quantization_and_model_file():
+    pytorch = nlp_backends.backend_fingerprint("org/model", "v1", "pytorch", "avx2")
+    avx2 = nlp_backends.backend_fingerprint("org/model", "v1", "onnx", "avx2")
+    unquantized = nlp_backends.backend_fingerprint("org/model", "v1", "onnx", "none")
+    other_revision = nlp_backends.backend_fingerprint("org/model", "v2", "onnx", "avx2")
+    assert pytorch == ["pytorch"]
+    assert avx2[:2] == ["onnx", "avx2"]
+    assert avx2[2].endswith(nlp_backends.onnx_file_name("avx2"))
+    assert len({str(avx2), str(unquantized), str(other_revision)}) == 3
+
+
+def test_pipeline_fingerprint_follows_its_backend():
+    handle = LazyPipeline("sentiment-analysis", "org/model", "v1", register=False, backend="onnx")
+    assert handle.fingerprint == nlp_backends.backend_fingerprint("org/model", "v1", "onnx")
+
+
+@pytest.mark.parametrize("name", ["sentiment", "issues"])
+def test_onnx_matches_pytorch(name):
+    pytest.importorskip("torch")
+    pytest.importorskip("optimum.onnxruntime")
+    from benchmarks.corpus import FEEDBACK_SAMPLES, synthetic_texts
+    from benchmarks.onnx_parity import CHECKS, compare, top_predictions
+
+    task, model, revision, labels = CHECKS[name]
+    texts = FEEDBACK_SAMPLES + synthetic_texts(20)
+    reference = top_predictions(LazyPipeline(task, model, revision, register=False, backend="pytorch"), texts, labels)
+    candidate = top_predictions(LazyPipeline(task, model, revision, register=False, backend="onnx"), texts, labels)
+    result = compare(name, reference, candidate, min_agreement=0.95, score_tolerance=0.05)
+    assert result["passed"], result
@@ -0,0 +1,99 @@
+# tests/test_nlp_cache.py
+"""The NLP result cache: memory and shared-file hits, eviction, and turning it off."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import nlp_cache
+from nlp_cache import ResultCache, make_key
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Model:
+    """Stub compute_batch that records the texts it was asked for."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [{"label": text.upper()} for text in texts]
+
+
+def _lookup(cache, texts, model, params="v1"):
+    keys = [make_key("test", text, params) for text in texts]
+    return cache.get_or_compute(keys, texts, model)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cache" / "nlp.sqlite3")
+
+
+def test_hits_skip_the_model(path):
+    cache, model = ResultCache(path), Model()
+    assert _lookup(cache, ["good", "bad"], model) == [{"label": "GOOD"}, {"label": "BAD"}]
+    # Known texts, including normalized copies, are not computed again; a batch
+    # with the same new text twice computes it once.
+    assert _lookup(cache, ["  GOOD ", "bad", "new", "new"], model) == \
+        [{"label": "GOOD"}, {"label": "BAD"}, {"label": "NEW"}, {"label": "NEW"}]
+    assert model.calls == [["good", "bad"], ["new"]]
+    assert cache.stats() == {"memory_entries": 3, "hits_memory": 2, "hits_disk": 0, "misses": 4}
+
+    # Other parameters (another model revision) are a different entry.
+    _lookup(cache, ["good"], model, params="v2")
+    assert model.calls[-1] == ["good"]
+
+
+def test_other_processes_hit_the_shared_file(path):
+    _lookup(ResultCache(path), ["good"], Model())
+    other, model = ResultCache(path), Model()
+    assert _lookup(other, ["good"], model) == [{"label": "GOOD"}]
+    assert model.calls == []
+    assert other.stats()["hits_disk"] == 1
+
+
+def test_memory_is_an_lru(path):
+    cache = ResultCache(path, memory_entries=2)
+    _lookup(cache, ["a", "b"], Model())
+    _lookup(cache, ["a"], Model())      # a is now the most recent
+    _lookup(cache, ["c"], Model())      # evicts b
+    assert cache.stats()["memory_entries"] == 2
+    keys = {text: make_key("test", text, "v1") for text in "abc"}
+    assert set(cache._memory) == {keys["a"], keys["c"]}
+    # b is still on disk.
+    model = Model()
+    _lookup(cache, ["b"], model)
+    assert model.calls == [] and cache.stats()["hits_disk"] == 1
+
+
+def test_prune_keeps_the_newest_disk_entries(path, monkeypatch):
+    clock = iter(range(1000))
+    monkeypatch.setattr(nlp_cache.time, "time", lambda: next(clock))
+    cache = ResultCache(path, memory_entries=1, max_disk_entries=2)
+    for text in ("old", "newer", "newest"):
+        _lookup(cache, [text], Model())
+    cache.prune()
+    model = Model()
+    assert _lookup(ResultCache(path), ["old", "newer", "newest"], model)
+    assert model.calls == [["old"]]
+
+
+def test_disabled_cache_always_computes(monkeypatch):
+    monkeypatch.setattr(nlp_cache, "result_cache", None)
+    model = Model()
+    assert nlp_cache.cached("test", "v1", ["good"], model) == [{"label": "GOOD"}]
+    assert nlp_cache.cached("test", "v1", ["good"], model) == [{"label": "GOOD"}]
+    assert model.calls == [["good"], ["good"]]
+
+
+def test_nlp_cache_enabled_false_turns_the_cache_off(tmp_path):
+    env = dict(os.environ, NLP_CACHE_ENABLED="false", NLP_CACHE_PATH=str(tmp_path / "off.sqlite3"))
+    code = "import nlp_cache; print(nlp_cache.result_cache)"
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True,
+                            check=True).stdout
+    assert output.strip() == "None"
+    assert not (tmp_path / "off.sqlite3").exists()
@@ -0,0 +1,156 @@
+# tests/test_nlp_server.py
+"""
+NLPClient against a real NLPServer process on a temporary socket. The
+server's pipelines are replaced with stubs, so no model is loaded.
+"""
+import multiprocessing
+import os
+import shutil
+import stat
+import tempfile
+import time
+
+import pytest
+
+from nlp_client import NLPClient, NLPServerError
+from nlp_server import NLPServer
+
+AUTHKEY = b"test-nlp-server"
+
+
+def _stub_sentiments(texts):
+    return [{"label": "NEGATIVE" if "bad" in text else "POSITIVE", "score": 0.9} for text in texts]
+
+
+def _stub_issues(texts, candidate_labels=None, threshold=0.1):
+    labels = candidate_labels or ["pace"]
+    return [[{"issue": labels[0], "score": threshold + 0.5}] if "slow" in text else [] for text in texts]
+
+
+def _stub_analyze(texts):
+    return [{"sentiment": _stub_sentiments([text])[0]["label"], "issues": _stub_issues([text])[0],
+             "improvement_tip": None, "issue_sentences": {}} for text in texts]
+
+
+def _serve(address):
+    import nlp_models
+    import nlp_server
+    nlp_models.is_ready = lambda: True
+    nlp_server.analyze_sentiments = _stub_sentiments
+    nlp_server.extract_issues_batch = _stub_issues
+    nlp_server.analyze_feedback_batch_local = _stub_analyze
+    nlp_server.NLPServer(address, authkey=AUTHKEY).serve_forever(warm_up=False)
+
+
+class ServerProcess:
+    def __init__(self, address):
+        self.address = address
+        self.process = None
+
+    def start(self):
+        self.process = multiprocessing.get_context("spawn").Process(target=_serve, args=(self.address,), daemon=True)
+        self.process.start()
+        deadline = time.monotonic() + 60
+        probe = NLPClient(self.address, authkey=AUTHKEY, timeout=5)
+        while True:
+            try:
+                probe.health()
+                probe._reset()
+                return
+            except NLPServerError:
+                if time.monotonic() > deadline or not self.process.is_alive():
+                    raise
+                time.sleep(0.1)
+
+    def stop(self):
+        self.process.kill()
+        self.process.join()
+
+
+@pytest.fixture
+def server():
+    # A short directory: Unix socket paths are limited to about 100 characters.
+    directory = tempfile.mkdtemp(prefix="nlp")
+    server = ServerProcess(os.path.join(directory, "nlp.sock"))
+    server.start()
+    yield server
+    server.stop()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def client(server):
+    return NLPClient(server.address, authkey=AUTHKEY, timeout=10)
+
+
+def test_health(server, client):
+    health = client.health()
+    assert health["status"] == "ok"
+    assert health["pid"] == server.process.pid
+    assert set(health["queues"]) == {"sentiment", "issues", "analyze"}
+
+
+def test_socket_is_private_to_owner_and_group(server):
+    assert stat.S_IMODE(os.stat(server.address).st_mode) == 0o660
+
+
+def test_server_requires_an_authkey():
+    with pytest.raises(ValueError, match="NLP_SERVER_AUTHKEY"):
+        NLPServer("unused.sock", authkey=b"")
+
+
+def test_client_requires_an_authkey(server):
+    with pytest.raises(NLPServerError, match="NLP_SERVER_AUTHKEY"):
+        NLPClient(server.address, authkey=b"").health()
+
+
+def test_wrong_authkey_is_rejected(server, client):
+    with pytest.raises(NLPServerError, match="rejected"):
+        NLPClient(server.address, authkey=b"wrong", timeout=5).health()
+    # The server keeps serving the other clients.
+    assert client.health()["status"] == "ok"
+
+
+def test_sentiment(client):
+    assert client.analyze_sentiment("a bad session")["label"] == "NEGATIVE"
+    assert [result["label"] for result in client.analyze_sentiments(["good", "bad", "fine"])] == \
+        ["POSITIVE", "NEGATIVE", "POSITIVE"]
+
+
+def test_issues(client):
+    assert client.extract_issues("too slow") == [{"issue": "pace", "score": 0.6}]
+    assert client.extract_issues_batch(["ok", "slow"]) == [[], [{"issue": "pace", "score": 0.6}]]
+    # Non-default labels bypass the server's batching queue.
+    assert client.extract_issues("slow", candidate_labels=["clarity"], threshold=0.2) == \
+        [{"issue": "clarity", "score": 0.7}]
+
+
+def test_analyze(client):
+    results = client.analyze_feedback_batch(["bad and slow", "great"])
+    assert [result["sentiment"] for result in results] == ["NEGATIVE", "POSITIVE"]
+    assert results[0]["issues"] == [{"issue": "pace", "score": 0.6}]
+
+
+def test_unknown_op_is_reported(client):
+    with pytest.raises(NLPServerError, match="Unknown op"):
+        client._call({"op": "translate", "texts": ["hi"]})
+    # The connection is still usable afterwards.
+    assert client.health()["status"] == "ok"
+
+
+def test_reconnects_after_server_restart(server, client):
+    first_pid = client.health()["pid"]
+    server.stop()
+    server.start()
+    # The first send goes to the dead connection; the client reconnects and retries.
+    assert client.analyze_sentiments(["bad"])[0]["label"] == "NEGATIVE"
+    assert client.health()["pid"] != first_pid
+
+
+def test_server_down_is_reported(server, client):
+    client.health()
+    server.stop()
+    with pytest.raises(NLPServerError, match="unavailable"):
+        client.analyze_sentiments(["good"])
+    server.start()
+    assert client.analyze_sentiments(["good"])[0]["label"] == "POSITIVE"
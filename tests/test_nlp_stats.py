@@ -0,0 +1,52 @@
+# tests/test_nlp_stats.py
+"""The cascade and fast-path counters add up exactly when several threads update them."""
+import threading
+
+import numpy as np
+import pytest
+
+import issue_extraction
+import sentiment_analysis
+
+THREADS = 8
+CALLS = 500
+
+
+class Vader:
+    """Stub analyzer: confident about texts mentioning "great", unsure about the rest."""
+
+    def polarity_scores(self, text):
+        return {"compound": 0.9 if "great" in text else 0.1}
+
+
+def _hammer(function):
+    threads = [threading.Thread(target=lambda: [function() for _ in range(CALLS)]) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_cascade_counts_are_exact(monkeypatch):
+    monkeypatch.setattr(sentiment_analysis, "cascade_stats", {"vader": 0, "escalated": 0})
+    monkeypatch.setattr(sentiment_analysis, "get_vader_analyzer", lambda: Vader())
+    monkeypatch.setattr(sentiment_analysis, "analyze_sentiments_transformer",
+                        lambda texts, batch_size: [{"label": "NEUTRAL", "score": 0.5} for _ in texts])
+    _hammer(lambda: sentiment_analysis.analyze_sentiments_cascaded(["great tutor", "ok", "fine"], threshold=0.5))
+    metrics = sentiment_analysis.cascade_metrics()
+    assert (metrics["vader"], metrics["escalated"]) == (THREADS * CALLS, 2 * THREADS * CALLS)
+    assert metrics["escalation_rate"] == pytest.approx(2 / 3)
+
+
+def test_fast_path_counts_are_exact(monkeypatch):
+    labels = ["pace", "clarity"]
+    monkeypatch.setattr(issue_extraction, "fast_path_stats", {"fast": 0, "fallback": 0})
+    monkeypatch.setattr(issue_extraction, "encoder", lambda texts, **kwargs: np.ones((len(texts), 4)) / 2)
+    monkeypatch.setattr(issue_extraction, "_label_embeddings", {})
+    # Equal similarity to both labels: every text is ambiguous and falls back.
+    monkeypatch.setattr(issue_extraction, "ISSUE_FAST_PATH_MIN_CONFIDENCE", 0.9)
+    monkeypatch.setattr(issue_extraction, "extract_issues_zero_shot_batch",
+                        lambda texts, labels, threshold, batch_size: [[] for _ in texts])
+    _hammer(lambda: issue_extraction.extract_issues_embedding_batch(["a", "b"], labels))
+    _hammer(lambda: issue_extraction.extract_issues_embedding_batch(["a"], labels, fallback=False))
+    assert issue_extraction.fast_path_stats == {"fast": THREADS * CALLS, "fallback": 2 * THREADS * CALLS}
@@ -0,0 +1,21 @@
+# tests/test_query_counts.py
+"""Session listings run a fixed number of statements however many sessions there are."""
+import pytest
+
+from benchmarks.query_counts import ENDPOINTS, count_statements, grow_sessions
+
+
+@pytest.fixture(scope="module")
+def counts(seeded_app):
+    grow_sessions(seeded_app, 5)
+    small = count_statements(seeded_app)
+    grow_sessions(seeded_app, 50)
+    large = count_statements(seeded_app)
+    return small, large
+
+
+@pytest.mark.parametrize("path", ENDPOINTS)
+def test_statement_count_stays_flat(counts, path):
+    small, large = counts
+    assert large[path] <= small[path], f"{path}: {small[path]} statements at 5 sessions, {large[path]} at 50"
+    assert large[path] <= 3
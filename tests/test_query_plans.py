@@ -0,0 +1,27 @@
+# tests/test_query_plans.py
+"""The hot queries are answered through indexes on a migrated database."""
+import pytest
+
+from config import db
+from models import SessionFeedback
+from query_plans import HOT_QUERIES, Explain, check_query_plans, table_access
+
+
+@pytest.fixture(scope="module")
+def plans(seeded_app):
+    with seeded_app.app_context():
+        return {result["name"]: result for result in check_query_plans(db.engine)}
+
+
+@pytest.mark.parametrize("name", [query["name"] for query in HOT_QUERIES])
+def test_hot_query_uses_indexes(plans, name):
+    result = plans[name]
+    assert result["ok"], result["tables"]
+
+
+def test_a_full_scan_is_reported(seeded_app):
+    statement = db.select(SessionFeedback).where(SessionFeedback.student_feedback.like("%slow%"))
+    with seeded_app.app_context(), db.engine.connect() as conn:
+        plan = [dict(row) for row in conn.execute(Explain(statement)).mappings()]
+        uses_index, _ = table_access(conn.dialect.name, plan)["SessionFeedback"]
+    assert not uses_index
@@ -0,0 +1,59 @@
+# tests/test_reanalyze_feedback.py
+"""reanalyze-feedback walks SessionFeedback in keyset batches and resumes from its checkpoint."""
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import commands
+from config import db
+from feedback_worker import ANALYSIS_DONE
+from models import SessionFeedback
+
+
+def _fake_batch(rows):
+    return [{"feedback_id": feedback_id, "feedback_sentiment": "POSITIVE", "feedback_issues": "",
+             "improvement_tip": f"tip {feedback_id}", "issue_sentences": "{}", "issue_scores": "[]",
+             "analysis_status": ANALYSIS_DONE}
+            for feedback_id, _ in rows]
+
+
+@pytest.fixture
+def analyzed(monkeypatch):
+    """Analyze on threads with a stub instead of model worker processes; records the batches."""
+    batches = []
+
+    def reanalyze_batch(rows):
+        batches.append([feedback_id for feedback_id, _ in rows])
+        return _fake_batch(rows)
+
+    monkeypatch.setattr(commands, "ProcessPoolExecutor",
+                        lambda max_workers, **kwargs: ThreadPoolExecutor(max_workers=max_workers))
+    monkeypatch.setattr(commands, "_reanalyze_batch", reanalyze_batch)
+    return batches
+
+
+def test_every_row_once_in_order(seeded_app, analyzed, tmp_path):
+    checkpoint = tmp_path / "checkpoint.json"
+    result = seeded_app.test_cli_runner().invoke(commands.reanalyze_feedback, [
+        "--workers", "2", "--batch-size", "7", "--checkpoint", str(checkpoint), "--reset"])
+    assert result.exit_code == 0, result.output
+
+    with seeded_app.app_context():
+        ids = db.session.scalars(db.select(SessionFeedback.feedback_id).order_by(SessionFeedback.feedback_id)).all()
+        tips = db.session.scalars(db.select(SessionFeedback.improvement_tip)).all()
+    assert [feedback_id for batch in analyzed for feedback_id in batch] == ids
+    assert all(len(batch) <= 7 for batch in analyzed)
+    assert sorted(tips) == sorted(f"tip {feedback_id}" for feedback_id in ids)
+    assert json.loads(checkpoint.read_text()) == {"last_feedback_id": ids[-1], "processed": len(ids)}
+
+
+def test_resumes_after_the_checkpoint(seeded_app, analyzed, tmp_path):
+    with seeded_app.app_context():
+        ids = db.session.scalars(db.select(SessionFeedback.feedback_id).order_by(SessionFeedback.feedback_id)).all()
+    checkpoint = tmp_path / "checkpoint.json"
+    checkpoint.write_text(json.dumps({"last_feedback_id": ids[9], "processed": 10}))
+    result = seeded_app.test_cli_runner().invoke(commands.reanalyze_feedback, [
+        "--workers", "1", "--batch-size", "5", "--checkpoint", str(checkpoint)])
+    assert result.exit_code == 0, result.output
+    assert [feedback_id for batch in analyzed for feedback_id in batch] == ids[10:]
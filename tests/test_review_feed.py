@@ -0,0 +1,78 @@
+# tests/test_review_feed.py
+"""The combined review feed pages through feedback and reviews without duplicates or gaps."""
+from datetime import datetime
+
+import pytest
+
+from config import db
+from models import Session, SessionFeedback, TutorReview
+from review_feed import SOURCE_SESSION, SOURCE_TUTOR, review_feed
+
+# Above every seeded id; feedback and reviews share some of these ids.
+BASE_ID = 2_000_000
+FEEDBACK_IDS = [BASE_ID + offset for offset in range(5)]
+REVIEW_IDS = [BASE_ID + offset for offset in (0, 2, 4, 5)]
+
+
+@pytest.fixture
+def tutor_id(seeded_app):
+    with seeded_app.app_context():
+        first = db.session.scalars(db.select(Session).order_by(Session.session_id)).first()
+        tutor_id = first.tutor_id
+        # Sessions at the same time, so the feed cannot rely on timestamps.
+        sessions = [Session(student_id=first.student_id, tutor_id=tutor_id, subject_id=first.subject_id,
+                            scheduled_time=datetime(2024, 1, 1, 10), session_status="Completed") for _ in FEEDBACK_IDS]
+        db.session.add_all(sessions)
+        db.session.flush()
+        db.session.add_all(SessionFeedback(feedback_id=feedback_id, session_id=session.session_id, star_rating=4,
+                                           student_feedback=f"Feedback {feedback_id}", feedback_sentiment="Positive",
+                                           analysis_status="done")
+                           for feedback_id, session in zip(FEEDBACK_IDS, sessions))
+        db.session.add_all(TutorReview(review_id=review_id, tutor_id=tutor_id, student_name="Reviewer", rating=2,
+                                       comment=f"Review {review_id}")
+                           for review_id in REVIEW_IDS)
+        db.session.commit()
+        session_ids = [session.session_id for session in sessions]
+    yield tutor_id
+    with seeded_app.app_context():
+        SessionFeedback.query.filter(SessionFeedback.feedback_id.in_(FEEDBACK_IDS)).delete()
+        TutorReview.query.filter(TutorReview.review_id.in_(REVIEW_IDS)).delete()
+        Session.query.filter(Session.session_id.in_(session_ids)).delete()
+        db.session.commit()
+
+
+def _expected(tutor_id):
+    feedback_ids = db.session.scalars(db.select(SessionFeedback.feedback_id).join(Session)
+                                      .where(Session.tutor_id == tutor_id)).all()
+    review_ids = db.session.scalars(db.select(TutorReview.review_id).where(TutorReview.tutor_id == tutor_id)).all()
+    keys = [(review_id, SOURCE_SESSION) for review_id in feedback_ids] + \
+           [(review_id, SOURCE_TUTOR) for review_id in review_ids]
+    return sorted(keys, reverse=True)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 4, 7])
+def test_pages_cover_every_review_once(seeded_app, tutor_id, limit):
+    with seeded_app.app_context():
+        expected = _expected(tutor_id)
+        seen = []
+        cursor = None
+        while True:
+            rows, cursor = review_feed(tutor_id, limit=limit, before=cursor)
+            assert len(rows) <= limit
+            seen += [(row.review_id, row.source) for row in rows]
+            if cursor is None:
+                break
+    assert seen == expected
+    # A shared id appears once per source: the review, then the feedback (source descending).
+    assert seen.index((BASE_ID, SOURCE_TUTOR)) + 1 == seen.index((BASE_ID, SOURCE_SESSION))
+
+
+def test_tutor_reviews_keep_their_sentiment(seeded_app, tutor_id):
+    with seeded_app.app_context():
+        rows, _ = review_feed(tutor_id, limit=len(FEEDBACK_IDS) + len(REVIEW_IDS))
+        stored = dict(db.session.execute(db.select(TutorReview.review_id, TutorReview.sentiment)
+                                         .where(TutorReview.review_id.in_(REVIEW_IDS))).all())
+    sentiments = {(row.review_id, row.source): row.sentiment for row in rows}
+    assert all(stored.values())
+    assert {review_id: sentiments[(review_id, SOURCE_TUTOR)] for review_id in REVIEW_IDS} == stored
+    assert sentiments[(BASE_ID, SOURCE_SESSION)] == "Positive"
@@ -0,0 +1,43 @@
+# tests/test_seeding.py
+"""The seeded database holds exactly the rows of the seed data file."""
+import pytest
+
+from config import db
+from seeding import _convert, load_seed_file, seed_database
+
+
+def _db_rows(table):
+    key_columns = list(table.primary_key.columns)
+    rows = db.session.execute(db.select(table)).mappings()
+    return {tuple(row[column.name] for column in key_columns): dict(row) for row in rows}
+
+
+@pytest.mark.parametrize("table_name", sorted(load_seed_file()))
+def test_seeded_rows_match_the_seed_file(seeded_app, table_name):
+    table = db.metadata.tables[table_name]
+    key_columns = list(table.primary_key.columns)
+    with seeded_app.app_context():
+        stored = _db_rows(table)
+    seed_rows = load_seed_file()[table_name]
+    assert len(stored) == len(seed_rows)
+    for row in seed_rows:
+        expected = {name: _convert(table.c[name], value) for name, value in row.items()}
+        key = tuple(expected[column.name] for column in key_columns)
+        actual = {name: stored[key][name] for name in expected}
+        assert actual == expected, f"{table_name} {key}"
+
+
+def test_subject_prerequisites(seeded_app):
+    # Only some Subjects rows set prerequisite_id; they used to lose it when
+    # the executemany took its columns from a row without one.
+    from models import Subject
+    with seeded_app.app_context():
+        prerequisites = dict(db.session.execute(
+            db.select(Subject.subject_id, Subject.prerequisite_id).where(Subject.prerequisite_id.is_not(None))).all())
+    assert prerequisites == {9: 7, 10: 2, 16: 13, 17: 16}
+
+
+def test_reseeding_inserts_nothing(seeded_app):
+    with seeded_app.app_context():
+        inserted = seed_database(load_seed_file())
+    assert sum(inserted.values()) == 0
@@ -0,0 +1,73 @@
+# tests/test_tutor_profile_cache.py
+"""Cached tutor profiles are dropped when a review or feedback commits."""
+import pytest
+
+import tutor_profile_cache
+from config import db
+from models import Session, SessionFeedback, TutorReview
+
+# Above every seeded id, so the new rows are the tutor's newest reviews.
+NEW_ID = 1_000_000
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    backend = tutor_profile_cache.MemoryBackend()
+    monkeypatch.setattr(tutor_profile_cache, "backend", backend)
+    return backend
+
+
+@pytest.fixture
+def tutor_id(seeded_app):
+    with seeded_app.app_context():
+        tutor_id = db.session.scalars(db.select(Session.tutor_id).order_by(Session.session_id)).first()
+    yield tutor_id
+    with seeded_app.app_context():
+        SessionFeedback.query.filter(SessionFeedback.feedback_id >= NEW_ID).delete()
+        TutorReview.query.filter(TutorReview.review_id >= NEW_ID).delete()
+        db.session.commit()
+
+
+def _profile_page(client, tutor_id):
+    with client.session_transaction() as session:
+        session["student_id"] = 1
+        session["view_tutor_id"] = tutor_id
+    response = client.get("/tutor")
+    assert response.status_code == 200
+    return response.text
+
+
+def test_review_commit_invalidates_the_profile(seeded_app, client, cache, tutor_id):
+    assert "A brand new review" not in _profile_page(client, tutor_id)
+    assert cache.get(tutor_id) is not None
+
+    with seeded_app.app_context():
+        db.session.add(TutorReview(review_id=NEW_ID, tutor_id=tutor_id, student_name="New student", rating=5,
+                                   comment="A brand new review"))
+        assert cache.get(tutor_id) is not None  # not before the commit
+        db.session.commit()
+    assert cache.get(tutor_id) is None
+    assert "A brand new review" in _profile_page(client, tutor_id)
+
+
+def test_feedback_commit_invalidates_the_profile(seeded_app, client, cache, tutor_id):
+    before = _profile_page(client, tutor_id)
+    assert "Brand new session feedback" not in before
+    with seeded_app.app_context():
+        count = tutor_profile_cache.cached_tutor_profile(tutor_id)["review_count"]
+        session_id = db.session.scalars(db.select(Session.session_id).where(Session.tutor_id == tutor_id)).first()
+        db.session.add(SessionFeedback(feedback_id=NEW_ID, session_id=session_id, star_rating=4,
+                                       student_feedback="Brand new session feedback", analysis_status="done"))
+        db.session.commit()
+        assert cache.get(tutor_id) is None
+        assert tutor_profile_cache.cached_tutor_profile(tutor_id)["review_count"] == count + 1
+    assert "Brand new session feedback" in _profile_page(client, tutor_id)
+
+
+def test_rolled_back_changes_keep_the_entry(seeded_app, client, cache, tutor_id):
+    _profile_page(client, tutor_id)
+    with seeded_app.app_context():
+        db.session.add(TutorReview(review_id=NEW_ID, tutor_id=tutor_id, student_name="New student", rating=1))
+        db.session.flush()
+        db.session.rollback()
+    assert cache.get(tutor_id) is not None
@@ -0,0 +1,72 @@
+# tests/test_tutor_stats.py
+"""TutorStats maintained from mapper events equals a full rebuild."""
+import pytest
+
+from config import db
+from models import Session, SessionFeedback, TutorReview, TutorStats
+from tutor_stats import rebuild_tutor_stats
+
+
+def _stats():
+    """TutorStats rows by tutor. Tutors whose last review was deleted keep an all-zero row, which a rebuild omits."""
+    db.session.expire_all()
+    rows = {}
+    for stats in db.session.scalars(db.select(TutorStats)):
+        row = {column.name: getattr(stats, column.name) for column in TutorStats.__table__.columns}
+        if row["review_count"]:
+            rows[stats.tutor_id] = row
+    return rows
+
+
+def _assert_matches_rebuild():
+    incremental = _stats()
+    rebuild_tutor_stats(db.session.connection())
+    rebuilt = _stats()
+    db.session.rollback()
+    assert set(incremental) == set(rebuilt)
+    for tutor_id, row in incremental.items():
+        assert row == pytest.approx(rebuilt[tutor_id]), tutor_id
+
+
+def test_incremental_stats_match_a_rebuild(seeded_app):
+    with seeded_app.app_context():
+        sessions = db.session.scalars(db.select(Session).order_by(Session.session_id)).all()
+        tutor_a = sessions[0].tutor_id
+        other = next(session for session in sessions if session.tutor_id != tutor_a)
+        tutor_b = other.tutor_id
+        _assert_matches_rebuild()
+
+        # Inserts.
+        review = TutorReview(tutor_id=tutor_a, student_name="Tester", rating=4.5, comment="Great", sentiment="Positive")
+        feedback = SessionFeedback(session_id=sessions[0].session_id, star_rating=2, student_feedback="Too slow",
+                                   feedback_sentiment="negative", analysis_status="done")
+        db.session.add_all([review, feedback])
+        db.session.commit()
+        _assert_matches_rebuild()
+
+        # Updates, including moving rows to another tutor. The instances are
+        # expired by the commit, so the previous values must be loaded.
+        review.rating = 1.4
+        review.sentiment = "NEGATIVE"
+        review.tutor_id = tutor_b
+        feedback.star_rating = 5
+        feedback.feedback_sentiment = None
+        feedback.session_id = other.session_id
+        db.session.commit()
+        _assert_matches_rebuild()
+
+        # An update that does not touch the counted columns.
+        review.comment = "Changed my mind"
+        db.session.commit()
+        _assert_matches_rebuild()
+
+        # Deletes, of the new rows and of seeded ones.
+        seeded_review = db.session.scalars(db.select(TutorReview).where(TutorReview.review_id != review.review_id)
+                                           .order_by(TutorReview.review_id)).first()
+        seeded_feedback = db.session.scalars(db.select(SessionFeedback)
+                                             .where(SessionFeedback.feedback_id != feedback.feedback_id)
+                                             .order_by(SessionFeedback.feedback_id)).first()
+        for row in (review, feedback, seeded_review, seeded_feedback):
+            db.session.delete(row)
+        db.session.commit()
+        _assert_matches_rebuild()
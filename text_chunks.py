@@ -0,0 +1,97 @@
+# text_chunks.py
+"""
+Sentence splitting and chunking for long feedback texts.
+
+Texts are split into sentences (character spans into the original text) and
+consecutive sentences are packed into chunks of at most FEEDBACK_CHUNK_MAX_CHARS
+characters, so model cost grows linearly with the length of the feedback
+instead of with the square of its sequence length.
+"""
+import re
+
+from config import FEEDBACK_CHUNK_MAX_CHARS
+
+# A sentence runs up to and including its terminal punctuation (and closing
+# quotes/brackets), or up to a line break.
+SENTENCE_PATTERN = re.compile(r'[^.!?\n]*(?:[.!?]+["\')\]]*|\n|$)')
+
+
+def split_sentences(text: str, max_chars: int = FEEDBACK_CHUNK_MAX_CHARS) -> list:
+    """
+    Split text into sentence spans.
+
+    Args:
+        text (str): The input text.
+        max_chars (int): Sentences longer than this are split at word boundaries.
+
+    Returns:
+        list: (start, end) character offsets of each sentence, whitespace trimmed.
+    """
+    spans = []
+    for match in SENTENCE_PATTERN.finditer(text or ""):
+        start, end = match.span()
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end:
+            spans.extend(_split_long(text, start, end, max_chars))
+    return spans
+
+
+def chunk_sentences(spans: list, max_chars: int = FEEDBACK_CHUNK_MAX_CHARS) -> list:
+    """
+    Pack consecutive sentence spans into chunks of at most max_chars characters.
+
+    Returns:
+        list: (start, end) character offsets of each chunk.
+    """
+    chunks = []
+    for start, end in spans:
+        if chunks and end - chunks[-1][0] <= max_chars:
+            chunks[-1] = (chunks[-1][0], end)
+        else:
+            chunks.append((start, end))
+    return chunks
+
+
+def highlight_segments(text: str, issue_sentences: list) -> list:
+    """
+    Cut text into consecutive segments for display, marking the sentences
+    that issues were attributed to.
+
+    Args:
+        text (str): The feedback text.
+        issue_sentences (list): {"start", "end", "issues"} dictionaries.
+
+    Returns:
+        list: {"text", "issues"} dictionaries covering the whole text in order;
+              "issues" is empty for unhighlighted segments.
+    """
+    segments = []
+    position = 0
+    for sentence in sorted(issue_sentences or [], key=lambda s: s["start"]):
+        start, end = max(sentence["start"], position), min(sentence["end"], len(text))
+        if start >= end:
+            continue
+        if start > position:
+            segments.append({"text": text[position:start], "issues": []})
+        segments.append({"text": text[start:end], "issues": sentence["issues"]})
+        position = end
+    if position < len(text):
+        segments.append({"text": text[position:], "issues": []})
+    return segments
+
+
+def _split_long(text, start, end, max_chars):
+    spans = []
+    while end - start > max_chars:
+        cut = text.rfind(" ", start + 1, start + max_chars + 1)
+        if cut == -1:
+            cut = start + max_chars
+        spans.append((start, cut))
+        start = cut
+        while start < end and text[start].isspace():
+            start += 1
+    spans.append((start, end))
+    return spans
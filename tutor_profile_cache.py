@@ -0,0 +1,252 @@
+# tutor_profile_cache.py
+"""
+Read-through cache of the tutor profile page's view model.
+
+The /tutor page shows the same tutor data to every student: profile fields,
+subjects, hourly rate, rating and review count, available slots and the two
+newest reviews. build_tutor_profile() builds that as a JSON-serializable dict once
+per tutor and cached_tutor_profile() keeps it in a pluggable backend:
+
+- MemoryBackend: a per-process LRU;
+- SQLiteBackend: a SQLite file shared by the worker processes of a node.
+
+Mapper events on Tutor, TutorSubject, TutorAvailableSlot, TutorReview,
+SessionFeedback and Session (booking a session removes the tutor's slot)
+collect the affected tutor ids on the ORM session, and the entries are
+dropped once that session commits, so a concurrent request cannot cache
+the pre-commit data again. Entries are built from the primary database even
+on GET requests: a lagging read replica would otherwise put the pre-commit
+profile back in the cache for the whole TTL. Writes that bypass mapper
+events (bulk statements, other processes with the memory backend) are
+bounded by the TTL.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session as OrmSession, object_session
+
+from config import (TUTOR_PROFILE_CACHE_BACKEND, TUTOR_PROFILE_CACHE_ENTRIES, TUTOR_PROFILE_CACHE_PATH,
+                    TUTOR_PROFILE_CACHE_TTL_SECONDS, db)
+from db_routing import primary_reads
+from models import SessionFeedback, Session, Tutor, TutorAvailableSlot, TutorReview, TutorSubject
+from review_feed import review_feed
+
+DEFAULT_PROFILE_PIC = "/static/images/default-profile-picture.png"
+
+# Session.info key of the tutor ids to invalidate when the session commits.
+_PENDING = "tutor_profile_cache_pending"
+
+
+class MemoryBackend:
+    """LRU of serialized profiles in this process."""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value: str, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+class SQLiteBackend:
+    """Serialized profiles in a SQLite file that every worker process on the node shares."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS profiles (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        try:
+            row = self._connection().execute("SELECT value FROM profiles WHERE key = ? AND expires_at > ?",
+                                             (str(key), time.time())).fetchone()
+        except sqlite3.Error as e:
+            logging.warning(f"Tutor profile cache read failed: {e}")
+            return None
+        return row[0] if row else None
+
+    def set(self, key, value: str, ttl: float):
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO profiles (key, value, expires_at) VALUES (?, ?, ?)",
+                             (str(key), value, time.time() + ttl))
+                self._writes += 1
+                if self._writes >= 1000:
+                    self._writes = 0
+                    conn.execute("DELETE FROM profiles WHERE expires_at <= ?", (time.time(),))
+        except sqlite3.Error as e:
+            logging.warning(f"Tutor profile cache write failed: {e}")
+
+    def delete(self, keys):
+        keys = [str(key) for key in keys]
+        if not keys:
+            return
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(f"DELETE FROM profiles WHERE key IN ({','.join('?' * len(keys))})", keys)
+        except sqlite3.Error as e:
+            logging.warning(f"Tutor profile cache invalidation failed: {e}")
+
+
+def _make_backend(name: str):
+    if name == "none":
+        return None
+    if name == "memory":
+        return MemoryBackend(TUTOR_PROFILE_CACHE_ENTRIES)
+    if name == "sqlite":
+        return SQLiteBackend(TUTOR_PROFILE_CACHE_PATH)
+    raise ValueError(f"Unknown TUTOR_PROFILE_CACHE_BACKEND {name!r}; expected memory, sqlite or none.")
+
+
+backend = _make_backend(TUTOR_PROFILE_CACHE_BACKEND)
+
+
+def build_tutor_profile(tutor_id):
+    """The profile page's view of a tutor, or None if there is no such tutor."""
+    tutor = Tutor.query.populate_existing().options(
+        db.selectinload(Tutor.subjects),
+        db.selectinload(Tutor.tutor_subjects_assoc),
+        db.selectinload(Tutor.available_slots),
+        db.joinedload(Tutor.stats),
+    ).get(tutor_id)
+    if not tutor:
+        return None
+    feed, _ = review_feed(tutor_id, limit=2)
+    reviews = []
+    for row in feed:
+        reviews.append({
+            "review_id": row.review_id,
+            "student_name": row.student_name,
+            "profile_pic_url": row.profile_pic_url or DEFAULT_PROFILE_PIC,
+            "comment": row.comment or "No review available.",
+            "rating": float(row.rating) if row.rating is not None else 0.0,
+            "sentiment": row.sentiment or "N/A",
+            "date_posted": row.date_posted.strftime('%d %b %Y') if row.date_posted else "N/A"
+        })
+    return {
+        "tutor_id": tutor.tutor_id,
+        "name": tutor.name,
+        "profile_pic_url": tutor.profile_pic_url,
+        "preferred_language": tutor.preferred_language,
+        "bio": tutor.bio,
+        "expertise": tutor.expertise,
+        "expertise_list": tutor.expertise_list,
+        "qualifications": tutor.qualifications,
+        "subjects_list": tutor.subjects_list,
+        "average_star_rating": float(tutor.average_star_rating) if tutor.average_star_rating is not None else None,
+        "review_count": tutor.review_count,
+        "hourly_rate": tutor.hourly_rate,
+        "available_slots": [{"date": slot.date, "time": slot.time} for slot in tutor.available_slots],
+        "last_two_reviews": reviews,
+    }
+
+
+def cached_tutor_profile(tutor_id):
+    """
+    The tutor's profile view model, from the cache or built and cached on a miss.
+
+    Args:
+        tutor_id (int): The tutor to show.
+
+    Returns:
+        dict: See build_tutor_profile(); None if the tutor does not exist.
+    """
+    if backend is None:
+        return build_tutor_profile(tutor_id)
+    cached = backend.get(tutor_id)
+    if cached is not None:
+        return json.loads(cached)
+    with primary_reads(db.session):
+        profile = build_tutor_profile(tutor_id)
+    if profile is not None:
+        backend.set(tutor_id, json.dumps(profile), TUTOR_PROFILE_CACHE_TTL_SECONDS)
+    return profile
+
+
+def invalidate(tutor_ids):
+    """Drop the cached profiles of these tutors."""
+    if backend is not None:
+        backend.delete([tutor_id for tutor_id in tutor_ids if tutor_id is not None])
+
+
+def _values(target, attribute) -> set:
+    """The attribute's current value and, if it changed in this flush, its previous one."""
+    history = inspect(target).attrs[attribute].history
+    return {getattr(target, attribute), *history.deleted}
+
+
+def _session_tutors(connection, session_ids) -> set:
+    session_ids = [session_id for session_id in session_ids if session_id is not None]
+    if not session_ids:
+        return set()
+    return set(connection.execute(select(Session.tutor_id).where(Session.session_id.in_(session_ids))).scalars())
+
+
+def _tutors_of(connection, target) -> set:
+    if isinstance(target, SessionFeedback):
+        return _session_tutors(connection, _values(target, "session_id"))
+    return _values(target, "tutor_id")
+
+
+def _changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING, set()).update(_tutors_of(connection, target))
+
+
+def _committed(session):
+    invalidate(session.info.pop(_PENDING, ()))
+
+
+def _rolled_back(session):
+    session.info.pop(_PENDING, None)
+
+
+for _model in (Tutor, TutorSubject, TutorAvailableSlot, TutorReview, SessionFeedback, Session):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event, _changed)
+event.listen(OrmSession, "after_commit", _committed)
+event.listen(OrmSession, "after_rollback", _rolled_back)
@@ -0,0 +1,188 @@
+# tutor_stats.py
+"""
+Per-tutor review statistics, maintained incrementally.
+
+Every SessionFeedback and TutorReview insert, update and delete adjusts the
+tutor's TutorStats row (review count, rating sum, 1-5 star histogram and
+sentiment counts) from mapper events, in the same transaction as the write.
+Dashboards, the review count and the feedback average then read one row
+instead of scanning every review.
+
+Bulk statements (seeding, reanalyze-feedback, backfill-review-sentiment)
+bypass mapper events; they call rebuild_tutor_stats() afterwards.
+"""
+import math
+from collections import defaultdict
+
+from sqlalchemy import case, event, func, insert, inspect, select
+
+from config import db
+from models import SessionFeedback, Session, TutorReview, TutorStats
+from upserts import increment
+
+SENTIMENT_COLUMNS = {"positive": "positive_count", "neutral": "neutral_count", "negative": "negative_count"}
+
+
+def star_bucket(rating):
+    """The 1-5 star a rating counts towards (half-up, like SQL ROUND), or None."""
+    if rating is None:
+        return None
+    star = math.floor(float(rating) + 0.5)
+    return star if 1 <= star <= 5 else None
+
+
+def sentiment_column(sentiment) -> str:
+    """Counter for a stored sentiment; missing or unknown values count as Neutral."""
+    return SENTIMENT_COLUMNS.get((sentiment or "").lower(), "neutral_count")
+
+
+def _contribution(rating, sentiment, feedback: bool) -> dict:
+    counters = {"review_count": 1, "rating_sum": float(rating or 0), sentiment_column(sentiment): 1}
+    star = star_bucket(rating)
+    if star:
+        counters[f"star_{star}_count"] = 1
+    if feedback:
+        counters["feedback_count"] = 1
+        counters["feedback_rating_sum"] = float(rating or 0)
+    return counters
+
+
+def _apply(connection, tutor_id, counters: dict, sign: int = 1):
+    """Add (sign=1) or subtract (sign=-1) counters from a tutor's row, creating it on first use."""
+    if tutor_id is None:
+        return
+    deltas = {column: sign * value for column, value in counters.items() if value}
+    increment(connection, TutorStats.__table__, {"tutor_id": tutor_id}, deltas)
+
+
+def _previous(target, attribute):
+    history = inspect(target).attrs[attribute].history
+    return history.deleted[0] if history.deleted else getattr(target, attribute)
+
+
+def _session_tutor(connection, session_id):
+    if session_id is None:
+        return None
+    return connection.execute(select(Session.tutor_id).where(Session.session_id == session_id)).scalar()
+
+
+def _feedback_inserted(mapper, connection, target):
+    _apply(connection, _session_tutor(connection, target.session_id),
+           _contribution(target.star_rating, target.feedback_sentiment, feedback=True))
+
+
+def _feedback_updated(mapper, connection, target):
+    old = (_previous(target, "session_id"), _previous(target, "star_rating"), _previous(target, "feedback_sentiment"))
+    new = (target.session_id, target.star_rating, target.feedback_sentiment)
+    if old == new:
+        return
+    _apply(connection, _session_tutor(connection, old[0]), _contribution(old[1], old[2], feedback=True), sign=-1)
+    _apply(connection, _session_tutor(connection, new[0]), _contribution(new[1], new[2], feedback=True))
+
+
+def _feedback_deleted(mapper, connection, target):
+    _apply(connection, _session_tutor(connection, _previous(target, "session_id")),
+           _contribution(_previous(target, "star_rating"), _previous(target, "feedback_sentiment"), feedback=True),
+           sign=-1)
+
+
+def _review_inserted(mapper, connection, target):
+    _apply(connection, target.tutor_id, _contribution(target.rating, target.sentiment, feedback=False))
+
+
+def _review_updated(mapper, connection, target):
+    old = (_previous(target, "tutor_id"), _previous(target, "rating"), _previous(target, "sentiment"))
+    new = (target.tutor_id, target.rating, target.sentiment)
+    if old == new:
+        return
+    _apply(connection, old[0], _contribution(old[1], old[2], feedback=False), sign=-1)
+    _apply(connection, new[0], _contribution(new[1], new[2], feedback=False))
+
+
+def _review_deleted(mapper, connection, target):
+    _apply(connection, _previous(target, "tutor_id"),
+           _contribution(_previous(target, "rating"), _previous(target, "sentiment"), feedback=False), sign=-1)
+
+
+event.listen(SessionFeedback, "after_insert", _feedback_inserted)
+event.listen(SessionFeedback, "after_update", _feedback_updated)
+event.listen(SessionFeedback, "after_delete", _feedback_deleted)
+event.listen(TutorReview, "after_insert", _review_inserted)
+event.listen(TutorReview, "after_update", _review_updated)
+event.listen(TutorReview, "after_delete", _review_deleted)
+
+# Load the previous value when one of these is set on an expired instance, so
+# the update listeners can subtract what the row counted before.
+for _attribute in (SessionFeedback.session_id, SessionFeedback.star_rating, SessionFeedback.feedback_sentiment,
+                   TutorReview.tutor_id, TutorReview.rating, TutorReview.sentiment):
+    event.listen(_attribute, "set", lambda target, value, oldvalue, initiator: None, active_history=True)
+
+
+def tutor_stats(tutor_id) -> TutorStats:
+    """The tutor's stats row, or an all-zero one if nothing was reviewed yet."""
+    stats = db.session.get(TutorStats, tutor_id)
+    if stats is None:
+        stats = TutorStats(tutor_id=tutor_id)
+        for column in TutorStats.__table__.columns:
+            if column.name != "tutor_id":
+                setattr(stats, column.name, column.default.arg)
+    return stats
+
+
+def _aggregate(rating, sentiment):
+    """Columns that sum the contributions of a set of rows, for rebuild_tutor_stats."""
+    star = func.round(rating)
+    lowered = func.lower(func.coalesce(sentiment, "neutral"))
+    columns = [func.count().label("review_count"), func.coalesce(func.sum(rating), 0).label("rating_sum")]
+    columns += [func.sum(case((star == n, 1), else_=0)).label(f"star_{n}_count") for n in range(1, 6)]
+    columns += [func.sum(case((lowered == "positive", 1), else_=0)).label("positive_count"),
+                func.sum(case((lowered == "negative", 1), else_=0)).label("negative_count"),
+                func.sum(case((lowered.in_(["positive", "negative"]), 0), else_=1)).label("neutral_count")]
+    return columns
+
+
+def rebuild_tutor_stats(connection) -> int:
+    """
+    Recompute every TutorStats row from SessionFeedback and TutorReviews, after
+    writes that bypassed the mapper events. Runs in the caller's transaction.
+
+    Args:
+        connection: The connection to use, e.g. db.session.connection().
+
+    Returns:
+        int: Number of tutors with stats.
+    """
+    columns = [column.name for column in TutorStats.__table__.columns if column.name != "tutor_id"]
+    totals = defaultdict(lambda: dict.fromkeys(columns, 0.0))
+    feedback = (
+        select(Session.tutor_id, *_aggregate(SessionFeedback.star_rating, SessionFeedback.feedback_sentiment))
+        .join(Session, Session.session_id == SessionFeedback.session_id)
+        .group_by(Session.tutor_id)
+    )
+    for row in connection.execute(feedback).mappings():
+        counters = totals[row["tutor_id"]]
+        for column, value in row.items():
+            if column != "tutor_id":
+                counters[column] += float(value or 0)
+        counters["feedback_count"] += row["review_count"]
+        counters["feedback_rating_sum"] += float(row["rating_sum"] or 0)
+    reviews = (
+        select(TutorReview.tutor_id, *_aggregate(TutorReview.rating, TutorReview.sentiment))
+        .where(TutorReview.tutor_id.isnot(None))
+        .group_by(TutorReview.tutor_id)
+    )
+    for row in connection.execute(reviews).mappings():
+        counters = totals[row["tutor_id"]]
+        for column, value in row.items():
+            if column != "tutor_id":
+                counters[column] += float(value or 0)
+
+    table = TutorStats.__table__
+    connection.execute(table.delete())
+    if totals:
+        connection.execute(insert(table), [
+            dict(tutor_id=tutor_id, **{column: value if column.endswith("rating_sum") else int(value)
+                                       for column, value in counters.items()})
+            for tutor_id, counters in totals.items()
+        ])
+    return len(totals)
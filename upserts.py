@@ -0,0 +1,53 @@
+# upserts.py
+"""
+Counter rows that are updated in place and created on first use.
+
+increment() runs UPDATE ... SET column = column + delta and, if no row
+matched, INSERTs the row in a savepoint; if a concurrent transaction
+inserted it first, the insert fails on the primary key and the UPDATE is
+retried. Both work inside the caller's transaction on a Session (ordinary
+requests) or a Connection (mapper events during a flush); the caller commits.
+"""
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
+
+
+def _matching(table, keys: dict):
+    return [table.c[column] == value for column, value in keys.items()]
+
+
+def increment(executor, table, keys: dict, deltas: dict):
+    """
+    Atomically add deltas to the counters of one row, creating it on first use.
+
+    Args:
+        executor: The Session or Connection to run the statements on.
+        table: The counters' Table.
+        keys (dict): Primary key column -> value of the row.
+        deltas (dict): Counter column -> amount to add. Other columns get their defaults on insert.
+    """
+    statement = (update(table).where(*_matching(table, keys))
+                 .values({column: table.c[column] + delta for column, delta in deltas.items()}))
+    if executor.execute(statement).rowcount:
+        return
+    try:
+        with executor.begin_nested():
+            executor.execute(insert(table).values(**keys, **deltas))
+    except IntegrityError:
+        # Another transaction created the row first.
+        executor.execute(statement)
+
+
+def insert_once(executor, table, row: dict) -> bool:
+    """
+    Insert the row unless one with the same primary key exists.
+
+    Returns:
+        bool: True if this call inserted it.
+    """
+    try:
+        with executor.begin_nested():
+            executor.execute(insert(table).values(**row))
+    except IntegrityError:
+        return False
+    return True